@@ -1,46 +1,57 @@
 import sys
 import os
-from src.braille_translator import text_to_braille, braille_to_text
-from src.braille_image import image_to_braille_list, save_braille_sample
-from src.braille_utils import safe_filename, validate_braille_str
-import numpy as np
+import argparse
+import glob
+import io
+import json
+import time
+from contextlib import nullcontext
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+from braille_translator import (
+    text_to_braille, braille_to_text, iter_text_to_braille, iter_braille_to_text,
+    DEFAULT_CHUNK_SIZE,
+)
+# 이미지(OpenCV/numpy) 모듈은 이미지를 다루는 명령에서만 불러옴 -> 텍스트 변환만 하는 실행은 빨리 시작
+from braille_parse import format_01, parse_01, parse_unicode
+from braille_utils import BrailleParseError, codes_to_unicode, pack_cells
 
+# 형식 변환은 braille_parse/braille_utils의 한 번에 처리하는 변환을 씀
 def braille_list_to_str(braille_list):
-    return ' '.join(''.join(str(dot) for dot in cell) for cell in braille_list)
+    return format_01(pack_cells(braille_list))
 
 def braille_list_to_unicode(braille_list):
-    flat = []
-    for cell in braille_list:
-        if isinstance(cell[0], list):
-            flat.extend(cell)
-        else:
-            flat.append(cell)
-    def dots_to_unicode(cell):
-        value = 0
-        for i, dot in enumerate(cell):
-            if dot:
-                value |= (1 << i)
-        return chr(0x2800 + value)
-    return ''.join(dots_to_unicode(cell) for cell in flat)
+    # 셀 코드가 곧 U+2800 블록 안의 오프셋
+    return codes_to_unicode(braille_list)
 
 def str_to_braille_list(s):
-    cells = s.strip().split()
-    if not validate_braille_str(s):
+    if not s.strip():
         raise ValueError("점자(01문자열) 입력은 6자리 0/1만 공백으로 구분해야 합니다.")
-    return [[int(c) for c in cell] for cell in cells]
+    return parse_01(s)
 
 def unicode_to_braille_list(braille_unicode):
-    braille_list = []
-    for ch in braille_unicode:
-        code = ord(ch) - 0x2800
-        cell = [(code >> i) & 1 for i in range(6)]
-        braille_list.append(cell)
-    return braille_list
+    return parse_unicode(braille_unicode)
+
+def cells_to_format(codes, fmt):
+    """셀 코드를 출력 형식(01 / unicode / binary)으로 변환"""
+    if fmt == "binary":
+        return bytes(codes)
+    if fmt == "01":
+        return braille_list_to_str(codes)
+    return braille_list_to_unicode(codes)
+
+def format_to_cells(data, fmt):
+    """입력 형식(01 / unicode / binary)의 점자를 셀 코드로 변환 (잘못된 셀은 순번과 함께 BrailleParseError)"""
+    if fmt == "binary":
+        return pack_cells(data)
+    if fmt == "01":
+        return parse_01(data)
+    return parse_unicode(data)
 
 def prompt_with_example(prompt, example):
     return input(f"{prompt}\n(예시: {example})\n입력: ")
 
-if __name__ == "__main__":
+def run_interactive():
+    from braille_image import image_to_braille_list, save_braille_sample
     while True:
         print("모드 선택:")
         print("1: 텍스트 → 점자(약자 우선 변환)")
@@ -56,8 +67,8 @@ if __name__ == "__main__":
                 try:
                     text = prompt_with_example("변환할 텍스트를 입력하세요.", "안녕하세요 123 Hello!")
                     braille = text_to_braille(text, use_abbreviation=True)
-                    sample_dir = save_braille_sample(braille, text)
-                    print(f"dot.png와 텍스트가 {sample_dir}에 저장되었습니다.")
+                    sample_path = save_braille_sample(braille, text)
+                    print(f"점자 이미지가 {sample_path}에 저장되었습니다. (텍스트는 샘플 목록 manifest.jsonl에 기록)")
                     print("점자(01문자열):", braille_list_to_str(braille))
                     print("점자(유니코드):", braille_list_to_unicode(braille))
                     break
@@ -69,8 +80,8 @@ if __name__ == "__main__":
                 try:
                     text = prompt_with_example("변환할 텍스트를 입력하세요.", "반갑습니다")
                     braille = text_to_braille(text, use_abbreviation=False)
-                    sample_dir = save_braille_sample(braille, text)
-                    print(f"dot.png와 텍스트가 {sample_dir}에 저장되었습니다.")
+                    sample_path = save_braille_sample(braille, text)
+                    print(f"점자 이미지가 {sample_path}에 저장되었습니다. (텍스트는 샘플 목록 manifest.jsonl에 기록)")
                     print("점자(01문자열):", braille_list_to_str(braille))
                     print("점자(유니코드):", braille_list_to_unicode(braille))
                     break
@@ -107,7 +118,7 @@ if __name__ == "__main__":
             while True:
                 try:
                     img_path = prompt_with_example(
-                        "점자 이미지 파일 경로 입력", "data/1/dot.png"
+                        "점자 이미지 파일 경로 입력", "data/shard_0000/1.png"
                     )
                     braille = image_to_braille_list(img_path)
                     text = braille_to_text(braille)
@@ -120,4 +131,413 @@ if __name__ == "__main__":
             print("프로그램을 종료합니다.")
             break
         else:
-            print("잘못된 입력입니다. 다시 선택해주세요.")
\ No newline at end of file
+            print("잘못된 입력입니다. 다시 선택해주세요.")
+
+
+# === 일괄 처리 CLI (python main.py encode|decode|render|ocr ...) ===
+OUTPUT_EXT = {"01": ".txt", "unicode": ".txt", "binary": ".brl", "text": ".txt"}
+
+def expand_inputs(patterns):
+    """파일 경로/글롭 목록을 실제 파일 목록으로 확장. 비어 있거나 '-'면 표준입력"""
+    if not patterns:
+        return ["-"]
+    paths = []
+    for pattern in patterns:
+        if pattern == "-":
+            paths.append(pattern)
+            continue
+        matched = sorted(glob.glob(pattern, recursive=True))
+        if not matched:
+            raise FileNotFoundError(pattern)
+        paths.extend(p for p in matched if os.path.isfile(p))
+    return paths
+
+def output_path_for(path, output_dir, ext, base_dir="."):
+    """입력 파일의 base_dir 기준 상대 경로를 output_dir 아래에 유지하고 확장자만 바꿈 (data/1/안녕.txt 같은 이름 충돌 방지)"""
+    rel = os.path.relpath(os.path.abspath(path), os.path.abspath(base_dir))
+    return os.path.join(output_dir, os.path.splitext(rel)[0] + ext)
+
+def _open_input(path, binary):
+    if path == "-":
+        # 표준입력은 닫지 않음
+        return nullcontext(sys.stdin.buffer if binary else sys.stdin)
+    return open(path, "rb") if binary else open(path, encoding="utf-8")
+
+def _open_output(path, binary):
+    if path is None or path == "-":
+        return sys.stdout.buffer if binary else sys.stdout
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return open(path, "wb") if binary else open(path, "w", encoding="utf-8")
+
+def _strip_final_newline(chunks):
+    # 셸에서 들어오는 마지막 줄바꿈은 빈 셀로 변환하지 않음
+    prev = None
+    for chunk in chunks:
+        if prev:
+            yield prev
+        prev = chunk
+    if prev:
+        yield prev.rstrip("\r\n")
+
+def _iter_01_cells(chunks):
+    # 공백 구분 01문자열을 청크 경계에서 잘린 셀까지 이어 붙여 셀 코드로 변환
+    rest = ""
+    for chunk in chunks:
+        data = rest + chunk
+        cut = max(data.rfind(" "), data.rfind("\n"), data.rfind("\t"))
+        rest = data[cut + 1:]
+        if cut >= 0:
+            yield data[:cut + 1]
+    if rest.strip():
+        yield rest
+
+def _iter_cells(chunks, fmt):
+    # 청크마다 셀 코드로 변환하고, 형식 오류의 셀 순번은 입력 전체 기준으로 옮김
+    if fmt == "01":
+        chunks = _iter_01_cells(chunks)
+    base = 0
+    for chunk in chunks:
+        try:
+            codes = format_to_cells(chunk, fmt)
+        except BrailleParseError as e:
+            raise e.shifted(base) from None
+        base += len(codes)
+        yield codes
+
+def encode_stream(src, out, fmt="unicode", use_abbreviation=True, buffer_size=DEFAULT_CHUNK_SIZE):
+    """텍스트 스트림을 점자로 변환해 out에 차례로 기록 (메모리는 buffer_size 단위)"""
+    chunks = _strip_final_newline(iter(lambda: src.read(buffer_size), ""))
+    first = True
+    for codes in iter_text_to_braille(chunks, use_abbreviation):
+        if fmt == "01" and not first:
+            out.write(" ")
+        out.write(cells_to_format(codes, fmt))
+        first = False
+
+def decode_stream(src, out, fmt="unicode", buffer_size=DEFAULT_CHUNK_SIZE):
+    """점자 스트림(01 / unicode / binary)을 텍스트로 복원해 out에 차례로 기록"""
+    chunks = iter(lambda: src.read(buffer_size), src.read(0))
+    for text in iter_braille_to_text(_iter_cells(chunks, fmt)):
+        out.write(text)
+
+def _read_cells(path, fmt):
+    if fmt == "text":
+        with _open_input(path, False) as f:
+            return text_to_braille(f.read().rstrip("\r\n"))
+    with _open_input(path, fmt == "binary") as f:
+        return format_to_cells(f.read(), fmt)
+
+def _run_job(job, out=None):
+    """
+    파일 하나 처리 (워커 프로세스에서도 실행).
+    - out이 주어지면 그 스트림에 바로 기록
+    - 아니면 out_path 파일에 기록, out_path도 없으면 결과(str/bytes)를 반환
+    """
+    command, path, out_path, opts = job
+    fmt = opts["format"]
+    if command == "render":
+        from braille_image import braille_to_image
+        braille_to_image(_read_cells(path, fmt), save_path=os.path.abspath(out_path))
+        return None
+    binary_out = fmt == "binary" and command in ("encode", "ocr")
+    if out is not None:
+        target = out
+    elif out_path is not None:
+        target = _open_output(out_path, binary_out)
+    else:
+        target = io.BytesIO() if binary_out else io.StringIO()
+    try:
+        if command == "ocr":
+            from braille_image import image_to_braille_list
+            codes = image_to_braille_list(path)
+            target.write(braille_to_text(codes) if fmt == "text" else cells_to_format(codes, fmt))
+        elif command == "encode" and opts["save_sample"]:
+            # 샘플 저장에는 전체 텍스트가 필요하므로 한 번에 읽음
+            from braille_image import save_braille_sample
+            with _open_input(path, False) as f:
+                text = f.read().rstrip("\r\n")
+            encode_stream(io.StringIO(text), target, fmt, opts["use_abbreviation"], opts["buffer_size"])
+            save_braille_sample(text_to_braille(text, opts["use_abbreviation"]), text, opts["save_sample"])
+        elif command == "encode":
+            with _open_input(path, False) as src:
+                encode_stream(src, target, fmt, opts["use_abbreviation"], opts["buffer_size"])
+        else:
+            with _open_input(path, fmt == "binary") as src:
+                decode_stream(src, target, fmt, opts["buffer_size"])
+    finally:
+        if out is None and out_path is not None:
+            target.close()
+    if out is None and out_path is None:
+        return target.getvalue()
+    return None
+
+def _run_job_safe(job):
+    # 파일 하나의 실패가 전체 일괄 처리를 멈추지 않도록 예외를 결과로 돌려줌
+    try:
+        return _run_job(job)
+    except Exception as e:
+        return e
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="한글 점자 변환기 (인자 없이 실행하면 대화형 모드)"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_io(p, formats, default, help_fmt):
+        p.add_argument("inputs", nargs="*", help="입력 파일 또는 글롭 (없거나 '-'면 표준입력)")
+        p.add_argument("-f", "--format", choices=formats, default=default, help=help_fmt)
+        p.add_argument("-o", "--output", help="출력 파일 (기본: 표준출력)")
+        p.add_argument("--output-dir", help="입력 파일마다 결과 파일을 이 디렉터리 아래에 생성")
+        p.add_argument("-j", "--workers", type=int, default=1, help="파일 처리 프로세스 수")
+        p.add_argument("--buffer-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                       help="스트리밍 읽기 단위 (글자/바이트)")
+        p.add_argument("--metrics", nargs="?", const="-", default=None, metavar="PATH",
+                       help="변환 카운터와 단계별 시간을 Prometheus 텍스트 형식으로 기록 "
+                            "(기본: 표준에러, 파일은 모두 현재 프로세스에서 처리)")
+
+    p = sub.add_parser("encode", help="텍스트 -> 점자")
+    add_io(p, ("01", "unicode", "binary"), "unicode", "출력 점자 형식")
+    p.add_argument("--no-abbreviation", dest="use_abbreviation", action="store_false",
+                   help="약자 없이 초/중/종 조합형으로 변환")
+    p.add_argument("--save-sample", nargs="?", const="data", default=None, metavar="DATA_DIR",
+                   help="점자 이미지와 텍스트를 샘플 저장소에 저장 (기본: data)")
+
+    p = sub.add_parser("decode", help="점자 -> 텍스트")
+    add_io(p, ("01", "unicode", "binary"), "unicode", "입력 점자 형식")
+
+    p = sub.add_parser("render", help="텍스트/점자 -> 점자 이미지(PNG)")
+    add_io(p, ("text", "01", "unicode", "binary"), "text", "입력 형식")
+
+    p = sub.add_parser("ocr", help="점자 이미지 -> 텍스트")
+    add_io(p, ("text", "01", "unicode", "binary"), "text", "출력 형식 (text면 텍스트로 복원)")
+
+    p = sub.add_parser("bulk-ocr", help="디렉터리/글롭의 점자 이미지 일괄 인식 -> 결과 JSONL")
+    p.add_argument("inputs", nargs="+", help="이미지 파일, 디렉터리(하위 포함) 또는 글롭")
+    p.add_argument("-o", "--output", help="결과 파일 (한 줄에 이미지 하나, 기본: 표준출력)")
+    p.add_argument("-j", "--workers", type=int, default=1, help="인식 프로세스 수")
+    p.add_argument("--threads", type=int, default=4, help="파일 읽기/디코딩 스레드 수")
+    p.add_argument("--check", action="store_true",
+                   help="정답과 비교 (data/N/의 .txt 또는 샘플 저장소 manifest)")
+
+    p = sub.add_parser("serve", help="점자 변환 HTTP 서버 실행")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8080)
+    p.add_argument("-j", "--workers", type=int, default=None,
+                   help="변환 프로세스 수 (기본: CPU 수, 0이면 스레드 하나)")
+    p.add_argument("--max-connections", type=int, default=1024, help="동시 연결 수 상한")
+    p.add_argument("--max-inflight", type=int, default=4096, help="동시에 처리 중인 요청 수 상한")
+    p.add_argument("--max-batch", type=int, default=256, help="encode/decode 요청을 묶는 최대 개수")
+    p.add_argument("--batch-window-ms", type=float, default=2.0, help="요청을 모으는 시간 (밀리초)")
+
+    p = sub.add_parser("pack", help="샘플 저장소 -> 팩 파일 (셀 코드/텍스트/이미지를 한 파일로)")
+    p.add_argument("data_dir", help="샘플 저장소 디렉터리")
+    p.add_argument("pack_path", help="기록할 팩 파일 (있으면 이어서 기록)")
+    p.add_argument("--image", choices=("ref", "pixels", "none"), default="ref",
+                   help="이미지 저장 방식: 경로(ref), 회색조 픽셀(pixels), 없음(none)")
+    p.add_argument("--cells-from", choices=("image", "text"), default="image",
+                   help="셀 코드를 이미지 인식(image) 또는 텍스트 점역(text)으로 만듦")
+    p.add_argument("--no-abbreviation", dest="use_abbreviation", action="store_false",
+                   help="--cells-from text일 때 약자 없이 점역")
+
+    p = sub.add_parser("unpack", help="팩 파일 -> 샘플 저장소")
+    p.add_argument("pack_path", help="읽을 팩 파일")
+    p.add_argument("data_dir", help="샘플을 추가할 샘플 저장소 디렉터리")
+
+    # 기본값은 braille_bench의 상수 (다른 명령의 시작을 늦추지 않도록 실행할 때 불러옴)
+    p = sub.add_parser("bench", help="변환/복원/렌더링/인식 성능 측정 -> 결과 JSON (기준 결과와 비교)")
+    p.add_argument("-o", "--output", help="결과 JSON 파일 (저장해 두고 다음 실행에서 --baseline으로 비교)")
+    p.add_argument("--baseline", help="비교할 기준 결과 JSON (회귀가 있으면 종료 코드 1)")
+    p.add_argument("--tolerance", type=float, default=None, help="허용하는 느려짐/메모리 증가 비율 (기본 0.25)")
+    p.add_argument("--sizes", default=None, help="코퍼스 크기 (글자 수, 쉼표 구분, 기본 1000,10000,100000)")
+    p.add_argument("--long-size", type=int, default=None, help="긴 단일 문서 크기 (기본 1000000, 0이면 생략)")
+    p.add_argument("--image-cells", default=None, help="이미지 작업 셀 수 (쉼표 구분, 기본 64,512)")
+    p.add_argument("--only", default=None,
+                   help="측정할 작업 (쉼표 구분: encode_abbrev,encode_plain,decode,edit,encode_many,decode_many,render,recognize,startup)")
+    p.add_argument("--repeat", type=int, default=None, help="측정마다 최소 실행 횟수 (기본 5)")
+    p.add_argument("--seed", type=int, default=0, help="코퍼스 시드")
+    return parser
+
+def _run_bulk_ocr(args):
+    from braille_ocr import bulk_ocr, expand_image_inputs, store_expected
+    paths = expand_image_inputs(args.inputs)
+    if not paths:
+        raise SystemExit("처리할 이미지가 없습니다.")
+    expected = {}
+    if args.check:
+        for item in args.inputs:
+            if os.path.isdir(item):
+                expected.update(store_expected(item))
+    total = failed = checked = correct = 0
+    start = time.perf_counter()
+    out = _open_output(args.output, False)
+    try:
+        for result in bulk_ocr(paths, workers=args.workers, threads=args.threads,
+                               check=args.check, expected=expected):
+            out.write(json.dumps(result.to_record(), ensure_ascii=False) + "\n")
+            total += 1
+            failed += result.error is not None
+            if result.correct is not None:
+                checked += 1
+                correct += result.correct
+    finally:
+        if out is sys.stdout:
+            out.flush()
+        else:
+            out.close()
+    seconds = time.perf_counter() - start
+    summary = f"이미지 {total}개, 실패 {failed}개, {seconds:.2f}초 ({total / seconds if seconds else 0:.1f}장/초)"
+    if checked:
+        summary += f", 정답 일치 {correct}/{checked}"
+    print(summary, file=sys.stderr)
+    return 1 if failed else 0
+
+def _run_pack(args):
+    from braille_pack import build_pack, import_pack
+    if args.command == "pack":
+        image = None if args.image == "none" else args.image
+        count = build_pack(args.data_dir, args.pack_path, image, args.cells_from, args.use_abbreviation)
+        print(f"샘플 {count}개를 {args.pack_path}에 기록했습니다.", file=sys.stderr)
+    else:
+        count = import_pack(args.pack_path, args.data_dir)
+        print(f"샘플 {count}개를 {args.data_dir}에 추가했습니다.", file=sys.stderr)
+    return 0
+
+def _int_list(value):
+    return tuple(int(v) for v in value.split(",") if v.strip())
+
+def _run_bench(args):
+    import braille_bench as bench
+    try:
+        baseline = bench.load_results(args.baseline) if args.baseline else None
+        results = bench.run_benchmarks(
+            sizes=_int_list(args.sizes) if args.sizes is not None else bench.DEFAULT_SIZES,
+            long_size=args.long_size if args.long_size is not None else bench.LONG_DOCUMENT_SIZE,
+            image_cells=_int_list(args.image_cells) if args.image_cells is not None else bench.DEFAULT_IMAGE_CELLS,
+            operations=args.only.split(",") if args.only else bench.OPERATIONS,
+            repeat=args.repeat or bench.DEFAULT_REPEAT,
+            seed=args.seed,
+            progress=lambda r: print(bench.format_result(r), file=sys.stderr),
+        )
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"에러: {e}")
+    if args.output:
+        bench.save_results(args.output, results)
+    if baseline is None:
+        return 0
+    tolerance = args.tolerance if args.tolerance is not None else bench.DEFAULT_TOLERANCE
+    regressions = bench.compare(results, baseline, tolerance, tolerance)
+    for regression in regressions:
+        print(f"회귀: {regression}", file=sys.stderr)
+    compared = sum(r.name in baseline for r in results)
+    print(f"기준과 비교한 측정 {compared}개, 회귀 {len(regressions)}개 (허용 {tolerance:.0%})", file=sys.stderr)
+    return 1 if regressions else 0
+
+def _write_metrics(metrics, path):
+    dump = metrics.to_prometheus()
+    if path == "-":
+        sys.stderr.write(dump)
+        return
+    with _open_output(path, False) as f:
+        f.write(dump)
+
+def run_cli(argv):
+    args = build_parser().parse_args(argv)
+    command = args.command
+    if command == "bench":
+        return _run_bench(args)
+    if command in ("pack", "unpack"):
+        return _run_pack(args)
+    if command == "bulk-ocr":
+        return _run_bulk_ocr(args)
+    if command == "serve":
+        from braille_server import ServerConfig, serve
+        serve(ServerConfig(args.host, args.port, args.workers, args.max_connections,
+                           args.max_inflight, args.max_batch, args.batch_window_ms / 1000))
+        return 0
+    opts = {
+        "format": args.format,
+        "use_abbreviation": getattr(args, "use_abbreviation", True),
+        "save_sample": getattr(args, "save_sample", None),
+        "buffer_size": args.buffer_size,
+    }
+    try:
+        paths = expand_inputs(args.inputs)
+    except FileNotFoundError as e:
+        raise SystemExit(f"입력 파일을 찾을 수 없습니다: {e}")
+    if not paths:
+        raise SystemExit("처리할 입력 파일이 없습니다.")
+    if command == "ocr" and "-" in paths:
+        raise SystemExit("ocr에는 이미지 파일 경로가 필요합니다.")
+    if command == "render" and not (args.output_dir or (args.output and len(paths) == 1)):
+        raise SystemExit("render에는 --output-dir 또는 (입력 하나일 때) -o가 필요합니다.")
+    binary_out = args.format == "binary" and command in ("encode", "ocr")
+    if binary_out and len(paths) > 1 and not args.output_dir:
+        raise SystemExit("여러 입력의 binary 출력에는 --output-dir가 필요합니다.")
+
+    if args.output_dir:
+        ext = ".png" if command == "render" else OUTPUT_EXT["text" if command == "decode" else args.format]
+        base_dir = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in paths])
+        jobs = [(command, p, output_path_for(p, args.output_dir, ext, base_dir), opts) for p in paths]
+    elif command == "render":
+        jobs = [(command, paths[0], args.output, opts)]
+    else:
+        jobs = [(command, p, None, opts) for p in paths]
+    to_stream = jobs[0][2] is None
+
+    current = [None]            # 처리 중인 파일 (경고 메시지용)
+    metrics = None
+    if args.metrics:
+        # 알 수 없는 글자/셀은 파일 이름과 함께 표준에러로 알림
+        import braille_metrics
+        metrics = braille_metrics.enable(braille_metrics.Metrics(
+            on_event=lambda kind, message: print(f"경고: {current[0]}: {message}", file=sys.stderr)
+        ))
+
+    failed = 0
+    out = _open_output(args.output, binary_out) if to_stream else None
+    # 표준입력은 부모 프로세스에서만 읽을 수 있고, 집계는 현재 프로세스에서만 모임
+    parallel = args.workers > 1 and len(jobs) > 1 and "-" not in paths and metrics is None
+    if parallel:
+        from concurrent.futures import ProcessPoolExecutor
+    executor = ProcessPoolExecutor(max_workers=args.workers) if parallel else None
+    try:
+        if executor is not None:
+            chunksize = max(1, len(jobs) // (args.workers * 4))
+            results = executor.map(_run_job_safe, jobs, chunksize=chunksize)
+        else:
+            results = (None for _ in jobs)
+        # 결과는 입력 순서대로 기록
+        for job, result in zip(jobs, results):
+            path = current[0] = job[1]
+            if to_stream and not binary_out and len(paths) > 1:
+                out.write(f"{path}\t")
+            if executor is None:
+                try:
+                    result = _run_job(job, out)
+                except Exception as e:
+                    result = e
+            if isinstance(result, Exception):
+                failed += 1
+                print(f"에러: {path}: {result}", file=sys.stderr)
+            elif result is not None:
+                out.write(result)
+            if to_stream and not binary_out:
+                out.write("\n")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if out is not None:
+            if out in (sys.stdout, sys.stdout.buffer):
+                out.flush()
+            else:
+                out.close()
+        if metrics is not None:
+            braille_metrics.disable()
+            _write_metrics(metrics, args.metrics)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+    run_interactive()
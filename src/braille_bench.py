@@ -0,0 +1,312 @@
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from braille_incremental import IncrementalTranslator
+from braille_table import HANGUL_BRAILLE_ABBREVIATION
+from braille_translator import braille_to_text, decode_many, encode_many, text_to_braille
+
+# 벤치마크 기본 설정
+DEFAULT_SIZES = (1_000, 10_000, 100_000)       # 코퍼스 크기 (글자 수)
+LONG_DOCUMENT_SIZE = 1_000_000                  # 긴 단일 문서 크기 (글자 수)
+DEFAULT_IMAGE_CELLS = (64, 512)                 # 이미지 렌더링/인식 셀 수 (한 줄)
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.25                        # 기준보다 이 비율 이상 느리거나 메모리를 더 쓰면 회귀
+RESULTS_VERSION = 1
+
+CORPUS_KINDS = ("hangul", "abbrev", "mixed", "long")
+OPERATIONS = (
+    "encode_abbrev", "encode_plain", "decode", "edit", "encode_many", "decode_many", "render", "recognize", "startup"
+)
+# edit 측정에서 문서 가운데에 한 글자씩 입력했다가 지우는 문구 (한 번 실행 = 글자 수 x 2 타건)
+EDIT_PHRASE = "안녕하세요 반갑습니다 123 abc "
+
+# 자주 쓰는 음절 (코퍼스 생성용, 순서가 곧 시드 결과이므로 바꾸면 코퍼스가 바뀜)
+_SYLLABLES = (
+    "이다는에의가을를하고지서로한기사자도수대리나그어아요인정게일시만적상전해보세주들과있내화부"
+    "면우오국마라제것중여원성장동안구실관방문신발학소비생회무계모연경없물분말결우리니까운데저"
+)
+_ENGLISH = ("braille", "Korea", "hello", "World", "data", "OCR", "image", "text", "Seoul", "model")
+_SYMBOLS = ".,?!:;-~/()[]{}<>@#$%^&*_+=“”‘’"
+_ABBREVIATIONS = tuple(HANGUL_BRAILLE_ABBREVIATION)
+
+class BenchResult(NamedTuple):
+    operation: str
+    corpus: str
+    size: int               # 코퍼스 크기 (글자 수), 이미지 작업은 셀 수
+    units: int              # 한 번에 처리한 입력 단위 수 (글자 또는 셀)
+    best_seconds: float     # 한 번 실행 시간의 최솟값
+    median_seconds: float
+    loops: int              # 측정 횟수
+    peak_bytes: int         # 한 번 실행 중 파이썬 힙 최대 사용량 (tracemalloc, 0이면 측정 안 함)
+
+    @property
+    def name(self) -> str:
+        return f"{self.operation}/{self.corpus}/{self.size}"
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리한 입력 단위 수 (최솟값 기준)"""
+        return self.units / self.best_seconds if self.best_seconds > 0 else float("inf")
+
+    def to_record(self) -> dict:
+        record = self._asdict()
+        record["name"] = self.name
+        record["throughput"] = round(self.throughput, 1)
+        return record
+
+class Regression(NamedTuple):
+    name: str
+    metric: str             # "time" 또는 "memory"
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        unit = "ms" if self.metric == "time" else "KiB"
+        scale = 1000 if self.metric == "time" else 1 / 1024
+        return (f"{self.name} {self.metric}: {self.baseline * scale:.3f}{unit} -> "
+                f"{self.current * scale:.3f}{unit} ({self.ratio:.2f}x)")
+
+# === 코퍼스 (오프라인, 시드로 결정) ===
+
+def _words(kind: str, rng: random.Random) -> Iterable[str]:
+    while True:
+        roll = rng.random()
+        if kind == "hangul":
+            yield ''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 4)))
+        elif kind == "abbrev":
+            # 약자 낱말이 절반 이상인 문장
+            if roll < 0.55:
+                yield rng.choice(_ABBREVIATIONS)
+            else:
+                yield ''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 3)))
+        elif roll < 0.45:
+            yield ''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 4)))
+        elif roll < 0.65:
+            yield rng.choice(_ENGLISH)
+        elif roll < 0.8:
+            yield str(rng.randint(0, 10 ** rng.randint(1, 6)))
+        else:
+            yield rng.choice(_SYMBOLS) + ''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(0, 2)))
+
+def make_corpus(kind: str, size: int, seed: int = 0) -> str:
+    """
+    kind 종류의 결정적 코퍼스 (정확히 size 글자).
+    - hangul: 한글 음절 낱말, abbrev: 약자 낱말 위주 문장, mixed: 한글/영문/숫자/기호 혼합
+    - long: mixed 문장을 문단(줄바꿈)으로 이어 붙인 긴 단일 문서
+    """
+    if kind not in CORPUS_KINDS:
+        raise ValueError(f"알 수 없는 코퍼스 종류: {kind} (가능: {', '.join(CORPUS_KINDS)})")
+    rng = random.Random(f"{kind}:{seed}")
+    words = _words("mixed" if kind == "long" else kind, rng)
+    parts = []
+    length = 0
+    while length < size:
+        word = next(words)
+        if kind == "long" and rng.random() < 0.02:
+            sep = "\n"
+        elif rng.random() < 0.08:
+            sep = ". "
+        else:
+            sep = " "
+        parts.append(word + sep)
+        length += len(word) + len(sep)
+    return ''.join(parts)[:size]
+
+# === 측정 ===
+
+def _measure(fn: Callable[[], object], repeat: int, min_time: float):
+    # 한 번 실행해 걸린 시간으로 측정 횟수를 정함 (짧은 작업은 min_time을 채울 만큼 반복).
+    # timeit처럼 측정 중에는 GC를 꺼서 이전 측정의 쓰레기 수거가 섞이지 않게 함
+    start = time.perf_counter()
+    fn()
+    first = time.perf_counter() - start
+    loops = max(repeat, min(1000, int(min_time / first) if first > 0 else 1000))
+    times = []
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(loops):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return min(times), statistics.median(times), loops
+
+def _peak_memory(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def _startup_command(tmp_dir: str) -> Callable[[], object]:
+    # 짧은 텍스트 파일 하나를 점역하는 CLI 실행 (프로세스 시작 + import + 변환)
+    main_py = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+    path = os.path.join(tmp_dir, "startup.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("안녕하세요 123")
+    return lambda: subprocess.run([sys.executable, main_py, "encode", path], check=True, stdout=subprocess.DEVNULL)
+
+def _typing(translator: IncrementalTranslator, pos: int) -> Callable[[], object]:
+    # pos에 EDIT_PHRASE를 한 글자씩 입력한 뒤 백스페이스로 모두 지움 (끝나면 문서가 원래대로라 반복해도 같음)
+    def run():
+        for i, char in enumerate(EDIT_PHRASE):
+            translator.edit(pos + i, pos + i, char)
+        for i in range(len(EDIT_PHRASE), 0, -1):
+            translator.edit(pos + i - 1, pos + i)
+    return run
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    long_size: Optional[int] = LONG_DOCUMENT_SIZE,
+    image_cells: Sequence[int] = DEFAULT_IMAGE_CELLS,
+    operations: Sequence[str] = OPERATIONS,
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = 0.2,
+    seed: int = 0,
+    progress: Optional[Callable[[BenchResult], None]] = None
+) -> List[BenchResult]:
+    """
+    작업 x 코퍼스 x 크기 조합을 측정해 BenchResult 목록 반환 (progress가 있으면 하나 끝날 때마다 호출).
+    - encode_abbrev / encode_plain / decode: hangul, abbrev, mixed 코퍼스의 sizes 크기 + long_size 긴 문서
+    - edit: 같은 문서를 IncrementalTranslator로 열어 가운데에서 타건 (단위는 타건 수, 문서 크기와 무관해야 함)
+    - encode_many / decode_many: 같은 코퍼스를 낱말(짧은 라벨) 목록으로 나눠 배치 API로 한 번에 변환/복원
+    - render / recognize: mixed 코퍼스를 점역한 셀 앞부분 image_cells개를 PNG로 그리기 / 그 파일 인식
+    - startup: main.py encode 프로세스 실행 시간 (import 포함)
+    실행 시간은 최소 repeat번(짧은 작업은 min_time초를 채울 때까지) 재고, 메모리는 따로 한 번 실행해 잼
+    """
+    unknown = set(operations) - set(OPERATIONS)
+    if unknown:
+        raise ValueError(f"알 수 없는 작업: {', '.join(sorted(unknown))} (가능: {', '.join(OPERATIONS)})")
+    results = []
+
+    def record(operation, corpus, size, units, fn, memory=True):
+        best, median, loops = _measure(fn, repeat, min_time)
+        result = BenchResult(operation, corpus, size, units, best, median, loops,
+                             _peak_memory(fn) if memory else 0)
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    text_cases = [(kind, size) for kind in ("hangul", "abbrev", "mixed") for size in sizes]
+    if long_size:
+        text_cases.append(("long", long_size))
+    for kind, size in text_cases:
+        text = make_corpus(kind, size, seed)
+        if "encode_abbrev" in operations:
+            record("encode_abbrev", kind, size, len(text), lambda: text_to_braille(text, True))
+        if "encode_plain" in operations:
+            record("encode_plain", kind, size, len(text), lambda: text_to_braille(text, False))
+        if "decode" in operations:
+            cells = text_to_braille(text)
+            record("decode", kind, size, len(cells), lambda: braille_to_text(cells))
+        if "edit" in operations:
+            typing = _typing(IncrementalTranslator(text), len(text) // 2)
+            record("edit", kind, size, 2 * len(EDIT_PHRASE), typing)
+        if "encode_many" in operations or "decode_many" in operations:
+            labels = text.split()
+            if "encode_many" in operations:
+                record("encode_many", kind, size, len(text), lambda: encode_many(labels))
+            if "decode_many" in operations:
+                packed = encode_many(labels)
+                record("decode_many", kind, size, len(packed.data), lambda: decode_many(packed))
+
+    if image_cells and ("render" in operations or "recognize" in operations):
+        # 이미지 모듈(OpenCV)은 이미지 작업을 잴 때만 불러옴
+        from braille_image import braille_to_image, image_to_braille_list
+        cells = text_to_braille(make_corpus("mixed", max(image_cells) * 2, seed))
+        with tempfile.TemporaryDirectory() as tmp:
+            for count in image_cells:
+                part = cells[:count]
+                path = os.path.join(tmp, f"bench_{count}.png")
+                if "render" in operations:
+                    record("render", "mixed", count, len(part), lambda: braille_to_image(part, save_path=path))
+                else:
+                    braille_to_image(part, save_path=path)
+                if "recognize" in operations:
+                    record("recognize", "mixed", count, len(part), lambda: image_to_braille_list(path))
+
+    if "startup" in operations:
+        with tempfile.TemporaryDirectory() as tmp:
+            record("startup", "cli", 1, 1, _startup_command(tmp), memory=False)
+    return results
+
+# === 결과 파일 / 기준 비교 ===
+
+def results_document(results: Iterable[BenchResult]) -> dict:
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": [r.to_record() for r in results],
+    }
+
+def save_results(path: str, results: Iterable[BenchResult]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results_document(results), f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+def load_results(path: str) -> Dict[str, dict]:
+    """결과 파일(JSON)의 측정값을 이름(작업/코퍼스/크기) -> 기록으로 읽음"""
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    if document.get("version") != RESULTS_VERSION:
+        raise ValueError(f"지원하지 않는 벤치마크 결과 형식입니다: {path}")
+    return {record["name"]: record for record in document["results"]}
+
+def compare(
+    results: Iterable[BenchResult],
+    baseline: Dict[str, dict],
+    tolerance: float = DEFAULT_TOLERANCE,
+    memory_tolerance: float = DEFAULT_TOLERANCE,
+    memory_slack: int = 64 * 1024
+) -> List[Regression]:
+    """
+    기준 결과와 같은 이름의 측정끼리 비교해 회귀 목록 반환.
+    - 시간: 최솟값이 기준의 (1 + tolerance)배를 넘으면
+    - 메모리: 최대 사용량이 기준의 (1 + memory_tolerance)배와 기준 + memory_slack을 모두 넘으면
+    기준에 없는 측정은 비교하지 않음
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        if result.best_seconds > base["best_seconds"] * (1 + tolerance):
+            regressions.append(Regression(result.name, "time", base["best_seconds"], result.best_seconds))
+        base_peak = base.get("peak_bytes", 0)
+        if base_peak and result.peak_bytes > max(base_peak * (1 + memory_tolerance), base_peak + memory_slack):
+            regressions.append(Regression(result.name, "memory", base_peak, result.peak_bytes))
+    return regressions
+
+def format_result(result: BenchResult) -> str:
+    """사람이 읽는 한 줄 요약"""
+    line = f"{result.name:<32} {result.best_seconds * 1000:>10.3f}ms (중앙값 {result.median_seconds * 1000:.3f}ms"
+    line += f", {result.throughput:,.0f}/초"
+    if result.peak_bytes:
+        line += f", 최대 {result.peak_bytes / 1024:,.0f}KiB"
+    return line + ")"
@@ -0,0 +1,101 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, NamedTuple, Optional
+
+# 단어 캐시 기본 크기 (항목 수)
+DEFAULT_CACHE_CAPACITY = 65536
+
+class CacheStats(NamedTuple):
+    capacity: int
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class LRUCache:
+    """
+    크기가 정해진 LRU 캐시 (스레드 안전).
+    OrderedDict 순서를 최근 사용 순서로 씀: 조회되면 맨 뒤로 옮기고(move_to_end), 가득 차면 맨 앞(가장 오래 안 쓴 것)을 버림.
+    (일반 dict로 pop/재삽입하면 앞쪽에 빈 슬롯이 쌓여 맨 앞 찾기가 O(n)이 됨)
+    hits/misses/evictions 카운터로 코퍼스에 맞는 크기를 정할 수 있음
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CACHE_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+        self.capacity = capacity
+        self._data: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[object]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: object):
+        with self._lock:
+            data = self._data
+            if key in data:
+                data.move_to_end(key)
+            elif len(data) >= self.capacity:
+                data.popitem(last=False)
+                self.evictions += 1
+            data[key] = value
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, object]:
+        """여러 키를 잠금 한 번으로 조회. 있는 키만 담은 dict 반환"""
+        found = {}
+        with self._lock:
+            data = self._data
+            for key in keys:
+                value = data.get(key)
+                if value is None:
+                    self.misses += 1
+                else:
+                    data.move_to_end(key)
+                    found[key] = value
+                    self.hits += 1
+        return found
+
+    def put_many(self, items: Dict[Hashable, object]):
+        """여러 항목을 잠금 한 번으로 기록"""
+        with self._lock:
+            data = self._data
+            for key, value in items.items():
+                if key in data:
+                    data.move_to_end(key)
+                elif len(data) >= self.capacity:
+                    data.popitem(last=False)
+                    self.evictions += 1
+                data[key] = value
+
+    def add_hits(self, count: int):
+        """캐시 밖에서(예: 한 호출 안의 반복) 재사용한 횟수를 적중으로 더함"""
+        with self._lock:
+            self.hits += count
+
+    def clear(self):
+        """항목과 카운터를 모두 비움"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self.capacity, len(self._data), self.hits, self.misses, self.evictions)
@@ -0,0 +1,166 @@
+import marshal
+import os
+import struct
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from braille_utils import flatten_braille_cell, pack_cells
+
+# 표 아티팩트 파일 구성
+# - 헤더(_HEADER): 매직, 형식 버전, marshal 버전, 본문 해시(sha256), 원본 스탬프 길이, 본문 길이
+# - 원본 스탬프: 표 정의와 파생 규칙이 담긴 소스 파일들의 (이름, 수정 시각, 크기)와 파생 결과에 영향을 주는
+#   실행 환경 값(유니코드 데이터 버전 등) -> 다르면 아티팩트를 다시 만듦 (pyc와 같은 방식이라 import 때 해시를 계산하지 않음)
+# - 본문: 파생 표 이름 -> 값 dict를 marshal로 직렬화 (C 구현이라 파이썬 루프 없이 한 번에 복원)
+# 본문 해시는 만들 때 기록하는 내용 식별값 (같은 표면 같은 해시). 읽을 때는 verify=True일 때만 확인
+TABLE_MAGIC = b"BRTB"
+TABLE_FORMAT_VERSION = 1
+DEFAULT_ARTIFACT_NAME = "braille_tables.bin"
+
+_HEADER = struct.Struct("<4sHH32sII")
+
+class TableConflict(NamedTuple):
+    kind: str                   # "duplicate-key": 표 정의에 같은 key가 두 번, "ambiguous": 여러 key가 같은 셀
+    table: str
+    keys: Tuple[str, ...]
+    cells: bytes = b""          # ambiguous일 때 겹치는 셀 코드
+
+    def __str__(self) -> str:
+        if self.kind == "duplicate-key":
+            return f"[{self.table}] {self.keys[0]!r} key가 두 번 정의됨 (앞의 값이 무시됨)"
+        dots = ' '.join(''.join('1' if code >> dot & 1 else '0' for dot in range(6)) for code in self.cells)
+        return f"[{self.table}] {dots} -> {list(self.keys)} (복원 시 구분 불가)"
+
+class TableConflictError(ValueError):
+    """점자 표에 모호한 매핑이 있어 아티팩트를 만들 수 없음. conflicts: TableConflict 목록"""
+
+    def __init__(self, conflicts: Sequence[TableConflict]):
+        self.conflicts = list(conflicts)
+        lines = "\n".join(f"  {c}" for c in self.conflicts)
+        super().__init__(f"점자 표 충돌 {len(self.conflicts)}건:\n{lines}")
+
+def find_duplicate_keys(source_path: str, table_names: Iterable[str]) -> List[TableConflict]:
+    """소스 파일의 dict 리터럴에서 같은 key가 두 번 나오는 곳 (파이썬은 뒤의 값으로 조용히 덮어씀)"""
+    import ast  # 아티팩트를 만들 때만 필요
+    names = set(table_names)
+    with open(source_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), source_path)
+    conflicts = []
+    for node in tree.body:
+        if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)):
+            continue
+        for target in node.targets:
+            if not (isinstance(target, ast.Name) and target.id in names):
+                continue
+            seen = set()
+            for key in node.value.keys:
+                if not isinstance(key, ast.Constant):
+                    continue
+                if key.value in seen:
+                    conflicts.append(TableConflict("duplicate-key", target.id, (key.value,)))
+                seen.add(key.value)
+    return conflicts
+
+def find_ambiguous_cells(
+    tables: Dict[str, dict],
+    allowed: Iterable[Iterable[str]] = ()
+) -> List[TableConflict]:
+    """
+    한 표 안에서 여러 key가 같은 셀(들)로 바뀌는 곳 (역변환 표에서 하나만 남음).
+    allowed: 복원할 때 문맥으로 고르는 key 묶음 (이 묶음 안에서만 겹치면 허용)
+    """
+    allowed_groups = [frozenset(group) for group in allowed]
+    conflicts = []
+    for table_name, table in tables.items():
+        by_cells = defaultdict(list)
+        for key, value in table.items():
+            by_cells[pack_cells(flatten_braille_cell(value))].append(key)
+        for cells, keys in by_cells.items():
+            if len(keys) > 1 and not any(set(keys) <= group for group in allowed_groups):
+                conflicts.append(TableConflict("ambiguous", table_name, tuple(keys), cells))
+    return conflicts
+
+def check_tables(
+    tables: Dict[str, dict],
+    source_path: Optional[str] = None,
+    allowed: Iterable[Iterable[str]] = ()
+):
+    """중복 key(source_path가 주어지면)와 모호한 셀을 모두 찾아 하나라도 있으면 TableConflictError"""
+    conflicts = []
+    if source_path is not None:
+        conflicts.extend(find_duplicate_keys(source_path, tables))
+    conflicts.extend(find_ambiguous_cells(tables, allowed))
+    if conflicts:
+        raise TableConflictError(conflicts)
+
+def source_stamp(paths: Iterable[str], environment: Tuple[str, ...] = ()) -> bytes:
+    """소스 파일들의 (이름, 수정 시각, 크기)와 environment (예: unicodedata.unidata_version)"""
+    stamps = []
+    for path in paths:
+        st = os.stat(path)
+        stamps.append((os.path.basename(path), st.st_mtime_ns, st.st_size))
+    return marshal.dumps((tuple(stamps), tuple(environment)))
+
+def write_artifact(path: str, tables: Dict[str, object], stamp: bytes) -> bytes:
+    """
+    파생 표를 아티팩트 파일로 저장하고 본문 해시 반환.
+    임시 파일에 쓰고 교체하므로 읽는 쪽은 항상 완성된 파일만 봄
+    """
+    import hashlib
+    payload = marshal.dumps(tables)
+    checksum = hashlib.sha256(payload).digest()
+    header = _HEADER.pack(
+        TABLE_MAGIC, TABLE_FORMAT_VERSION, marshal.version, checksum, len(stamp), len(payload)
+    )
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(header + stamp + payload)
+    os.replace(tmp, path)
+    return checksum
+
+def read_artifact(path: str, stamp: Optional[bytes] = None, verify: bool = False) -> Optional[Dict[str, object]]:
+    """
+    아티팩트를 한 번에 읽어 파생 표 dict 반환.
+    파일이 없거나, 형식/marshal 버전이 다르거나, stamp가 주어졌는데 원본 스탬프가 다르거나,
+    본문이 잘렸거나 손상됐으면 None (다시 만들어야 함). verify면 본문 해시도 확인
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, marshal_version, checksum, stamp_size, size = _HEADER.unpack_from(data)
+    if (magic, version, marshal_version) != (TABLE_MAGIC, TABLE_FORMAT_VERSION, marshal.version):
+        return None
+    start = _HEADER.size + stamp_size
+    if stamp is not None and data[_HEADER.size:start] != stamp:
+        return None
+    payload = memoryview(data)[start:]
+    if len(payload) != size:
+        return None
+    if verify:
+        import hashlib
+        if hashlib.sha256(payload).digest() != checksum:
+            return None
+    try:
+        return marshal.loads(payload)
+    except (EOFError, ValueError, TypeError):
+        return None
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="점자 표를 검증하고 아티팩트 파일로 컴파일")
+    parser.add_argument("-o", "--output", default=None, help="아티팩트 경로 (기본: 런타임이 읽는 위치)")
+    args = parser.parse_args()
+    # 표 충돌은 braille_table을 불러올 때(아티팩트가 없거나 오래됐으면) 또는 컴파일할 때 드러남.
+    # 스크립트로 실행하면 이 모듈이 __main__과 braille_compile 두 벌이 되므로 부모 클래스(ValueError)로 잡음
+    try:
+        import braille_table
+        tables = braille_table.compile_tables()
+    except ValueError as e:
+        raise SystemExit(f"에러: {e}")
+    output = args.output or braille_table.TABLE_ARTIFACT_PATH
+    checksum = write_artifact(output, tables, braille_table.TABLE_SOURCE_STAMP)
+    print(f"{output}: 표 {len(tables)}개, {os.path.getsize(output)} bytes, sha256 {checksum.hex()}")
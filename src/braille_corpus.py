@@ -0,0 +1,143 @@
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from braille_translator import braille_to_text, text_to_braille
+
+# 샤드 하나에 담는 문서 수 (작업당 프로세스 간 통신 비용을 나눠 갖는 단위)
+DEFAULT_SHARD_SIZE = 256
+
+class ShardStats(NamedTuple):
+    shard: int          # 샤드 번호 (입력 순서)
+    documents: int      # 샤드의 문서 수
+    units: int          # 입력 글자 수(encode) 또는 셀 수(decode)
+    seconds: float      # 워커에서 변환에 걸린 시간
+    worker: int         # 처리한 워커 pid
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리한 입력 단위 수"""
+        return self.units / self.seconds if self.seconds > 0 else float("inf")
+
+def _init_worker():
+    # 변환 테이블은 braille_translator import 시 워커마다 한 번만 만들어짐.
+    # 작업에는 문서만 실어 보내고 테이블은 pickle 하지 않음
+    import braille_translator  # noqa: F401
+
+def _run_shard(direction: str, use_abbreviation: bool, shard: int, docs: List) -> Tuple[int, List, ShardStats]:
+    start = time.perf_counter()
+    if direction == "encode":
+        results = [text_to_braille(doc, use_abbreviation) for doc in docs]
+    else:
+        results = [braille_to_text(doc) for doc in docs]
+    units = sum(len(doc) for doc in docs)
+    stats = ShardStats(shard, len(docs), units, time.perf_counter() - start, os.getpid())
+    return shard, results, stats
+
+def _load_checkpoint(path: Optional[str], shard_size: int) -> Set[int]:
+    """
+    체크포인트 파일: 첫 줄은 설정(JSON), 이후 한 줄에 끝난 샤드 번호 하나
+    """
+    if path is None or not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("shard_size") != shard_size:
+            raise ValueError(
+                f"체크포인트의 shard_size({header.get('shard_size')})가 현재 값({shard_size})과 다릅니다."
+            )
+        return {int(line) for line in f if line.strip()}
+
+def _open_checkpoint(path: Optional[str], shard_size: int):
+    if path is None:
+        return None
+    is_new = not os.path.exists(path)
+    f = open(path, "a", encoding="utf-8")
+    if is_new:
+        f.write(json.dumps({"shard_size": shard_size}) + "\n")
+        f.flush()
+    return f
+
+def _iter_shards(documents: Iterable, shard_size: int) -> Iterator[Tuple[int, int, List]]:
+    it = iter(documents)
+    shard = 0
+    while True:
+        docs = list(islice(it, shard_size))
+        if not docs:
+            return
+        yield shard, shard * shard_size, docs
+        shard += 1
+
+def translate_corpus(
+    documents: Iterable,
+    direction: str = "encode",
+    use_abbreviation: bool = True,
+    workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    max_pending: Optional[int] = None,
+    ordered: bool = True,
+    checkpoint: Optional[str] = None,
+    on_shard: Optional[Callable[[ShardStats], None]] = None,
+) -> Iterator[Tuple[int, object]]:
+    """
+    문서 묶음(텍스트 또는 점자 셀 버퍼)을 프로세스 풀로 나눠 변환하고 (문서 번호, 결과)를 차례로 내보냄.
+    - direction: "encode"(텍스트 -> 셀 코드 bytes) 또는 "decode"(점자 -> 텍스트)
+    - ordered: True면 입력 순서대로, False면 끝난 샤드부터 내보냄
+    - max_pending: 동시에 처리 중인 샤드 수 상한 (기본 workers * 2). 소비가 느리면 입력도 그만큼만 읽음
+    - checkpoint: 끝난 샤드를 기록하는 파일. 다시 실행하면 기록된 샤드는 건너뜀
+      (샤드는 결과를 모두 내보낸 뒤에 기록되므로 중간에 멈춘 샤드는 다시 실행할 때 처음부터 다시 내보냄)
+    - on_shard: 샤드가 끝날 때마다 ShardStats를 받는 콜백 (샤드별 처리량 보고용)
+    """
+    if direction not in ("encode", "decode"):
+        raise ValueError("direction은 'encode' 또는 'decode'여야 합니다.")
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    done = _load_checkpoint(checkpoint, shard_size)
+    shards = (s for s in _iter_shards(documents, shard_size) if s[0] not in done)
+    log = _open_checkpoint(checkpoint, shard_size)
+
+    def finish(start: int, results: List, stats: ShardStats):
+        for offset, result in enumerate(results):
+            yield start + offset, result
+        if log is not None:
+            log.write(f"{stats.shard}\n")
+            log.flush()
+        if on_shard is not None:
+            on_shard(stats)
+
+    try:
+        if workers == 1:
+            # 워커가 하나면 프로세스 간 통신 없이 바로 처리
+            for shard, start, docs in shards:
+                _, results, stats = _run_shard(direction, use_abbreviation, shard, docs)
+                yield from finish(start, results, stats)
+            return
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        try:
+            pending = deque()
+            starts = {}
+            for shard, start, docs in islice(shards, max_pending):
+                starts[shard] = start
+                pending.append(executor.submit(_run_shard, direction, use_abbreviation, shard, docs))
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = next(f for f in pending if f in finished)
+                    pending.remove(future)
+                shard, results, stats = future.result()
+                # 샤드 하나를 내보낼 때마다 새 샤드 하나를 넣어 처리 중인 샤드 수를 유지
+                for shard_next, start, docs in islice(shards, 1):
+                    starts[shard_next] = start
+                    pending.append(executor.submit(_run_shard, direction, use_abbreviation, shard_next, docs))
+                yield from finish(starts.pop(shard), results, stats)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    finally:
+        if log is not None:
+            log.close()
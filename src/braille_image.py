@@ -1,90 +1,366 @@
 import cv2
 import numpy as np
 import os
-from typing import List, Optional
-from .braille_utils import safe_filename
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Union
+from braille_metrics import timed
+from braille_utils import BrailleCells, pack_cells
+
+# 쪽 배치 기본값 (한 줄 셀 수, 한 쪽 줄 수)
+DEFAULT_CELLS_PER_LINE = 32
+DEFAULT_LINES_PER_PAGE = 24
+
+# 이미지 입력: 파일 경로, 인코딩된 이미지 바이트(PNG/WebP 등), 또는 이미 디코딩된 배열
+ImageSource = Union[str, os.PathLike, bytes, bytearray, memoryview, np.ndarray]
+
+# 셀 안의 점 위치 (열, 행): 점 1~3은 왼쪽 열, 점 4~6은 오른쪽 열
+DOT_POS = [(0,0), (0,1), (0,2), (1,0), (1,1), (1,2)]
+
+def _dot_centers(cell_size: int):
+    # 셀 왼쪽 위를 원점으로 한 점 중심 좌표 목록
+    return [
+        (dx * (cell_size // 2) + cell_size // 4, dy * (cell_size // 3) + cell_size // 6)
+        for dx, dy in DOT_POS
+    ]
+
+@lru_cache(maxsize=16)
+def glyph_atlas(cell_size: int = 40, dot_radius: int = 7):
+    """
+    셀 코드 64개의 점 모양을 미리 그린 글리프 아틀라스 (셀 크기/점 반지름별로 캐시).
+    (atlas, pad_top, pad_left) 반환
+    - atlas: (블록 수, 높이, 64, cell_size) uint8 회색조 (점 0, 바탕 255)
+      점이 셀 밖으로 넘치는 만큼 위/왼쪽/아래/오른쪽을 늘리고, 가로는 cell_size 폭 블록으로 나눔
+    - pad_top, pad_left: 셀 원점 대비 글리프 원점의 위/왼쪽 여유
+    """
+    centers = _dot_centers(cell_size)
+    reach = dot_radius + 1
+    pad_left = max(0, reach - min(cx for cx, _ in centers))
+    pad_right = max(0, max(cx for cx, _ in centers) + reach - cell_size + 1)
+    pad_top = max(0, reach - min(cy for _, cy in centers))
+    pad_bottom = max(0, max(cy for _, cy in centers) + reach - cell_size + 1)
+    height = pad_top + cell_size + pad_bottom
+    blocks = -(-(pad_left + cell_size + pad_right) // cell_size)
+    glyphs = np.full((64, height, blocks * cell_size), 255, dtype=np.uint8)
+    for code in range(64):
+        for i, (cx, cy) in enumerate(centers):
+            if code >> i & 1:
+                cv2.circle(glyphs[code], (cx + pad_left, cy + pad_top), dot_radius, 0, -1)
+    # 셀 코드 배열로 인덱싱하면 (높이, 셀 수, cell_size)가 되어 바로 한 줄로 펼칠 수 있는 배치
+    atlas = glyphs.reshape(64, height, blocks, cell_size).transpose(2, 1, 0, 3).copy()
+    atlas.setflags(write=False)
+    return atlas, pad_top, pad_left
+
+@timed("render")
+def render_braille(
+    braille_list: BrailleCells,
+    cell_size: int = 40,
+    dot_radius: int = 7,
+    margin: int = 20
+) -> np.ndarray:
+    """
+    점자를 한 줄 회색조 이미지(uint8 ndarray, 점 0 / 바탕 255)로 그림.
+    셀 코드 배열로 글리프 아틀라스를 한 번에 인덱싱해 이어 붙이므로 셀마다 그리는 반복이 없음
+    """
+    codes = np.frombuffer(pack_cells(braille_list), dtype=np.uint8)
+    cols = len(codes)
+    img_w = cols * cell_size + 2 * margin
+    img_h = cell_size + 2 * margin
+    if not cols:
+        return np.full((img_h, img_w), 255, dtype=np.uint8)
+    atlas, pad_top, pad_left = glyph_atlas(cell_size, dot_radius)
+    blocks, height = atlas.shape[0], atlas.shape[1]
+    y0, x0 = margin - pad_top, margin - pad_left
+    x1 = x0 + cols * cell_size
+    if blocks == 1 and y0 >= 0 and x0 >= 0 and y0 + height <= img_h and x1 <= img_w:
+        # 글리프가 이미지 안에 다 들어가면 아틀라스에서 결과 이미지로 바로 복사하고 나머지만 바탕색으로 채움
+        img = np.empty((img_h, img_w), dtype=np.uint8)
+        rows = img[y0:y0 + height]
+        np.take(atlas[0], codes, axis=1, out=rows[:, x0:x1].reshape(height, cols, cell_size), mode='clip')
+        rows[:, :x0] = 255
+        rows[:, x1:] = 255
+        img[:y0] = 255
+        img[y0 + height:] = 255
+        return img
+    if blocks == 1:
+        strip = atlas[0][:, codes].reshape(height, -1)
+    else:
+        # 블록 b는 셀 k의 글리프 중 k+b번째 셀 칸에 놓이는 부분. 겹치는 점은 어두운 쪽(min)
+        cells = np.full((height, cols + blocks - 1, cell_size), 255, dtype=np.uint8)
+        for b in range(blocks):
+            np.minimum(cells[:, b:b + cols], atlas[b][:, codes], out=cells[:, b:b + cols])
+        strip = cells.reshape(height, -1)
+    # 이미지 경계 밖으로 나가는 부분은 잘라서 붙임
+    img = np.full((img_h, img_w), 255, dtype=np.uint8)
+    top, left = max(0, -y0), max(0, -x0)
+    bottom = min(height, img_h - y0)
+    right = min(strip.shape[1], img_w - x0)
+    img[y0 + top:y0 + bottom, x0 + left:x0 + right] = strip[top:bottom, left:right]
+    return img
+
+def encode_params(ext: str, compression: Optional[int] = None, quality: Optional[int] = None) -> List[int]:
+    """
+    cv2.imencode/imwrite 인자.
+    - compression: PNG 압축 수준 0~9 (높을수록 작고 느림, cv2 기본 1)
+    - quality: WebP/JPEG 품질 0~100 (WebP는 100 초과면 무손실)
+    """
+    ext = ext.lower()
+    params = []
+    if compression is not None and ext == ".png":
+        params += [cv2.IMWRITE_PNG_COMPRESSION, compression]
+    if quality is not None and ext == ".webp":
+        params += [cv2.IMWRITE_WEBP_QUALITY, quality]
+    if quality is not None and ext in (".jpg", ".jpeg"):
+        params += [cv2.IMWRITE_JPEG_QUALITY, quality]
+    return params
+
+def encode_image(
+    braille_list: BrailleCells,
+    ext: str = ".png",
+    cell_size: int = 40,
+    dot_radius: int = 7,
+    margin: int = 20,
+    compression: Optional[int] = None,
+    quality: Optional[int] = None
+) -> bytes:
+    """점자 이미지를 파일을 거치지 않고 PNG/WebP 등 인코딩된 바이트로 반환"""
+    img = render_braille(braille_list, cell_size, dot_radius, margin)
+    ok, buf = cv2.imencode(ext, img, encode_params(ext, compression, quality))
+    if not ok:
+        raise ValueError(f"이미지를 {ext} 형식으로 인코딩할 수 없습니다.")
+    return buf.tobytes()
 
 def braille_to_image(
-    braille_list: List[List[int]], 
+    braille_list: BrailleCells, 
     cell_size: int = 40, 
     dot_radius: int = 7, 
     margin: int = 20,
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    compression: Optional[int] = None,
+    quality: Optional[int] = None
 ) -> str:
-    cols = len(braille_list)
-    img_w = cols * cell_size + 2 * margin
-    img_h = cell_size + 2 * margin
-    img = np.ones((img_h, img_w, 3), dtype=np.uint8) * 255
-
-    dot_pos = [(0,0), (0,1), (0,2), (1,0), (1,1), (1,2)]
-    for idx, cell in enumerate(braille_list):
-        x0 = margin + idx * cell_size
-        y0 = margin
-        for i, (dx, dy) in enumerate(dot_pos):
-            if cell[i]:
-                cx = x0 + dx * (cell_size // 2) + cell_size // 4
-                cy = y0 + dy * (cell_size // 3) + cell_size // 6
-                cv2.circle(img, (cx, cy), dot_radius, (0,0,0), -1)
+    img = render_braille(braille_list, cell_size, dot_radius, margin)
     if save_path is None:
         filename = "dot.png"
     else:
         filename = save_path
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    cv2.imwrite(filename, img)
+    dirname = os.path.dirname(filename)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    if not cv2.imwrite(filename, img, encode_params(os.path.splitext(filename)[1], compression, quality)):
+        raise ValueError(f"이미지를 저장할 수 없습니다: {filename}")
     return filename
 
+def sample_dots(img: np.ndarray, cx: np.ndarray, cy: np.ndarray, patch: int = 1) -> np.ndarray:
+    """
+    (cx, cy) 중심의 (2*patch+1)² 패치 평균이 128 미만(어두움)인지 한 번에 판정.
+    이미지 경계에서 잘린 패치는 남은 부분의 평균, 비어 있으면 점 없음.
+    점 중심 행마다 세로 합을 한 번 구하고 누적합으로 가로 구간 합을 계산
+    """
+    h, w = img.shape
+    dark = np.zeros(cx.shape, dtype=bool)
+    for row in np.unique(cy):
+        r0, r1 = max(0, row - patch), min(h, row + patch + 1)
+        if r0 >= r1:
+            continue
+        sel = cy == row
+        col_sums = np.zeros(w + 1, dtype=np.int64)
+        np.cumsum(img[r0:r1].sum(axis=0, dtype=np.int64), out=col_sums[1:])
+        xs = cx[sel]
+        c0 = np.clip(xs - patch, 0, w)
+        c1 = np.clip(xs + patch + 1, 0, w)
+        count = np.maximum(c1 - c0, 0) * (r1 - r0)
+        total = col_sums[np.maximum(c1, c0)] - col_sums[c0]
+        dark[sel] = (count > 0) & (total < 128 * count)
+    return dark
+
+def pack_dots(dots: np.ndarray) -> bytes:
+    """(셀 수, 6) bool 배열 -> 셀 코드 bytes"""
+    weights = np.left_shift(1, np.arange(6, dtype=np.uint8))
+    return (dots.astype(np.uint8) * weights).sum(axis=-1, dtype=np.uint8).tobytes()
+
+@timed("recognize")
+def _read_grid(img: np.ndarray, rows: int, cols: int, cell_size: int, margin: int, patch: int) -> np.ndarray:
+    # 모든 셀의 점 중심 좌표를 (행, 열, 6) 배열로 만들어 한 번에 샘플링 -> (행, 열) 셀 코드
+    centers = np.array(_dot_centers(cell_size))
+    cx = margin + np.arange(cols)[None, :, None] * cell_size + centers[:, 0]
+    cy = margin + np.arange(rows)[:, None, None] * cell_size + centers[:, 1]
+    cx, cy = np.broadcast_arrays(cx, cy)
+    codes = pack_dots(sample_dots(img, cx.reshape(-1, 6), cy.reshape(-1, 6), patch))
+    return np.frombuffer(codes, dtype=np.uint8).reshape(rows, cols)
+
+def load_gray(source: ImageSource) -> np.ndarray:
+    """
+    경로, 인코딩된 이미지 바이트/버퍼, 배열을 회색조 배열로 읽음.
+    배열은 회색조면 그대로, BGR/BGRA면 회색조로 변환 (복사 없이 넘기려면 uint8 회색조 배열을 주면 됨)
+    """
+    if isinstance(source, np.ndarray):
+        if source.ndim == 2:
+            return source
+        if source.ndim == 3 and source.shape[2] in (3, 4):
+            code = cv2.COLOR_BGR2GRAY if source.shape[2] == 3 else cv2.COLOR_BGRA2GRAY
+            return cv2.cvtColor(source, code)
+        raise ValueError("이미지 배열은 (높이, 너비) 또는 (높이, 너비, 3/4) 형태여야 합니다.")
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        img = cv2.imdecode(np.frombuffer(source, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+        if img is None:
+            raise ValueError("이미지 데이터를 디코딩할 수 없습니다.")
+        return img
+    img = cv2.imread(os.fspath(source), cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        raise FileNotFoundError(source)
+    return img
+
 def image_to_braille_list(
-    img_path: str, 
+    img_path: ImageSource, 
     cell_size: int = 40, 
     margin: int = 20,
     patch: int = 1
-) -> List[List[int]]:
-    img = cv2.imread(img_path, cv2.IMREAD_GRAYSCALE)
-    if img is None:
-        raise FileNotFoundError(img_path)
-    cols = (img.shape[1] - 2 * margin) // cell_size
-    braille_list = []
-    dot_pos = [(0,0), (0,1), (0,2), (1,0), (1,1), (1,2)]
-    for idx in range(cols):
-        x0 = margin + idx * cell_size
-        y0 = margin
-        cell = []
-        for (dx, dy) in dot_pos:
-            cx = x0 + dx * (cell_size // 2) + cell_size // 4
-            cy = y0 + dy * (cell_size // 3) + cell_size // 6
-            px = img[max(0, cy-patch):cy+patch+1, max(0, cx-patch):cx+patch+1]
-            if px.mean() < 128:
-                cell.append(1)
-            else:
-                cell.append(0)
-        braille_list.append(cell)
-    return braille_list
+) -> bytes:
+    """점자 이미지(경로/바이트/배열, load_gray 참고)의 한 줄을 셀 코드로 읽음"""
+    return recognize_braille(load_gray(img_path), cell_size, margin, patch)
+
+def recognize_braille(img: np.ndarray, cell_size: int = 40, margin: int = 20, patch: int = 1) -> bytes:
+    """이미 읽은 회색조 이미지에서 y = margin 한 줄의 셀 코드를 읽음"""
+    cols = max(0, (img.shape[1] - 2 * margin) // cell_size)
+    return _read_grid(img, 1, cols, cell_size, margin, patch).tobytes()
+
+# === 쪽 배치 (여러 줄/여러 쪽) ===
+
+def wrap_cells(braille_list: BrailleCells, cells_per_line: int = DEFAULT_CELLS_PER_LINE) -> Iterator[bytes]:
+    """
+    점자를 한 줄 cells_per_line 칸 이하의 줄로 나눔 (빈 셀 = 단어 경계).
+    - 단어 경계에서 줄을 바꾸면 그 빈 셀 하나는 줄바꿈으로 대신하고, 줄은 칸을 다 채우지 않음
+    - 한 줄보다 긴 단어만 칸을 꽉 채워 자르고, 다음 줄에 이어 씀
+    그래서 읽을 때 꽉 찬 줄은 그대로, 덜 찬 줄은 빈 셀 하나를 넣어 이어 붙이면 원래 점자가 됨
+    (join_lines). 줄 끝의 빈 셀은 그림에 남지 않으므로 전체 끝의 빈 셀과
+    한 줄 이상 이어지는 빈 셀은 보존되지 않음
+    """
+    if cells_per_line < 2:
+        raise ValueError("cells_per_line은 2 이상이어야 합니다.")
+    codes = pack_cells(braille_list).rstrip(b"\0")
+    n = len(codes)
+    pos = 0
+    while n - pos > cells_per_line:
+        # 칸을 남기는 위치 중 가장 뒤의 단어 끝 (다음 셀이 빈 셀이고 마지막 셀은 점이 있음)
+        end = pos + cells_per_line - 1
+        brk = codes.rfind(0, pos + 1, end + 1)
+        while brk > pos and codes[brk - 1] == 0:
+            brk = codes.rfind(0, pos + 1, brk)
+        if brk > pos:
+            yield codes[pos:brk]
+            pos = brk + 1
+        else:
+            yield codes[pos:pos + cells_per_line]
+            pos += cells_per_line
+    if pos < n:
+        yield codes[pos:]
+
+def join_lines(lines: Iterable[bytes], cells_per_line: int = DEFAULT_CELLS_PER_LINE) -> bytes:
+    """wrap_cells의 역: 줄 끝 빈 셀을 떼고, 덜 찬 줄 뒤에는 빈 셀 하나를 넣어 이어 붙임"""
+    out = bytearray()
+    soft = False
+    for line in lines:
+        if soft:
+            out.append(0)
+        line = bytes(line).rstrip(b"\0")
+        out += line
+        soft = len(line) < cells_per_line
+    return bytes(out)
+
+def iter_pages(
+    braille_list: BrailleCells,
+    cells_per_line: int = DEFAULT_CELLS_PER_LINE,
+    lines_per_page: int = DEFAULT_LINES_PER_PAGE
+) -> Iterator[List[bytes]]:
+    """wrap_cells의 줄을 lines_per_page 줄씩 묶은 쪽을 차례로 내보냄"""
+    page = []
+    for line in wrap_cells(braille_list, cells_per_line):
+        page.append(line)
+        if len(page) == lines_per_page:
+            yield page
+            page = []
+    if page:
+        yield page
+
+def render_page(
+    lines: List[bytes],
+    cells_per_line: int = DEFAULT_CELLS_PER_LINE,
+    cell_size: int = 40,
+    dot_radius: int = 7,
+    margin: int = 20
+) -> np.ndarray:
+    """
+    줄 목록을 한 쪽 회색조 이미지로 그림.
+    가로는 cells_per_line 칸으로 고정, 세로는 줄 수만큼. 줄마다 render_braille 결과를 겹쳐 찍음
+    """
+    img = np.full((len(lines) * cell_size + 2 * margin, cells_per_line * cell_size + 2 * margin), 255, dtype=np.uint8)
+    row_h = cell_size + 2 * margin
+    for r, line in enumerate(lines):
+        row = render_braille(bytes(line).ljust(cells_per_line, b"\0"), cell_size, dot_radius, margin)
+        band = img[r * cell_size:r * cell_size + row_h]
+        np.minimum(band, row, out=band)
+    return img
+
+def braille_to_pages(
+    braille_list: BrailleCells,
+    save_dir: str = "pages",
+    cells_per_line: int = DEFAULT_CELLS_PER_LINE,
+    lines_per_page: int = DEFAULT_LINES_PER_PAGE,
+    cell_size: int = 40,
+    dot_radius: int = 7,
+    margin: int = 20
+) -> List[str]:
+    """
+    점자를 쪽 단위 이미지(save_dir/page_0001.png, ...)로 저장하고 경로 목록 반환.
+    한 번에 한 쪽만 그리므로 메모리는 문서 길이가 아니라 쪽 크기에 비례
+    """
+    os.makedirs(save_dir, exist_ok=True)
+    paths = []
+    for i, lines in enumerate(iter_pages(braille_list, cells_per_line, lines_per_page), 1):
+        path = os.path.join(save_dir, f"page_{i:04d}.png")
+        if not cv2.imwrite(path, render_page(lines, cells_per_line, cell_size, dot_radius, margin)):
+            raise ValueError(f"쪽 이미지를 저장할 수 없습니다: {path}")
+        paths.append(path)
+    return paths
+
+def image_to_braille_lines(
+    img_path: ImageSource,
+    cell_size: int = 40,
+    margin: int = 20,
+    patch: int = 1
+) -> List[bytes]:
+    """쪽 이미지 하나의 줄들을 위에서부터 읽어 줄별 셀 코드 목록으로 반환 (줄 끝 빈 셀 제외)"""
+    img = load_gray(img_path)
+    rows = max(0, (img.shape[0] - 2 * margin) // cell_size)
+    cols = max(0, (img.shape[1] - 2 * margin) // cell_size)
+    grid = _read_grid(img, rows, cols, cell_size, margin, patch)
+    return [row.tobytes().rstrip(b"\0") for row in grid]
+
+def pages_to_braille_list(
+    img_paths: Iterable[ImageSource],
+    cells_per_line: int = DEFAULT_CELLS_PER_LINE,
+    cell_size: int = 40,
+    margin: int = 20,
+    patch: int = 1
+) -> bytes:
+    """쪽 이미지들을 순서대로 읽어 braille_to_pages 이전의 점자로 이어 붙임"""
+    return join_lines(
+        (line for path in img_paths for line in image_to_braille_lines(path, cell_size, margin, patch)),
+        cells_per_line,
+    )
 
 def save_braille_sample(
-    braille_list: List[List[int]],
+    braille_list: BrailleCells,
     text: str,
     data_dir: str = "data",
     cell_size: int = 40,
     dot_radius: int = 7,
     margin: int = 20
 ) -> str:
-    os.makedirs(data_dir, exist_ok=True)
-    existing = [int(name) for name in os.listdir(data_dir) if name.isdigit()]
-    next_idx = max(existing, default=0) + 1
-    sample_dir = os.path.join(data_dir, str(next_idx))
-    os.makedirs(sample_dir, exist_ok=False)
-
-    img_path = os.path.join(sample_dir, "dot.png")
-    txt_path = os.path.join(sample_dir, f"{safe_filename(text)}.txt")
-
-    braille_to_image(
-        braille_list=braille_list,
-        cell_size=cell_size,
-        dot_radius=dot_radius,
-        margin=margin,
-        save_path=img_path
-    )
-    with open(txt_path, "w", encoding="utf-8") as f:
-        f.write(text)
-
-    return sample_dir
\ No newline at end of file
+    """
+    점자 이미지를 data_dir 샘플 저장소에 저장하고 이미지 경로를 반환 (텍스트는 manifest에 기록).
+    번호 발급/기록은 braille_samples.SampleStore 참고
+    """
+    from braille_samples import open_sample_store
+    sample = open_sample_store(data_dir).save(braille_list, text, cell_size, dot_radius, margin)
+    return sample.image_path
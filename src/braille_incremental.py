@@ -0,0 +1,245 @@
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, NamedTuple, Tuple
+
+from braille_translator import split_words, text_to_braille, text_to_braille_offsets
+
+# 블록 하나에 담는 단어 조각 수 (편집으로 두 배를 넘으면 나눔)
+DEFAULT_BLOCK_SIZE = 64
+
+class CellEdit(NamedTuple):
+    """편집 한 번으로 바뀐 셀: 편집 전 셀 [start, end)를 cells로 바꾸면 편집 뒤 셀이 됨"""
+    start: int
+    end: int
+    cells: bytes
+
+    def apply(self, cells: bytes) -> bytes:
+        return cells[:self.start] + self.cells + cells[self.end:]
+
+class _PrefixSums:
+    """
+    블록 길이의 누적합 (펜윅 트리). 한 블록 길이 변경과 위치로 블록 찾기가 모두 O(log 블록 수).
+    블록이 나뉘거나 합쳐지면 새로 만듦
+    """
+
+    def __init__(self, values: List[int]):
+        n = len(values)
+        tree = [0] + values
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._top = 1 << n.bit_length() >> 1 if n else 0
+
+    def add(self, index: int, delta: int):
+        tree = self._tree
+        i = index + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, index: int) -> int:
+        """앞의 index개 블록 길이 합"""
+        tree = self._tree
+        total = 0
+        while index:
+            total += tree[index]
+            index &= index - 1
+        return total
+
+    def find(self, pos: int) -> Tuple[int, int]:
+        """pos를 담은 블록 번호와 그 블록의 시작 위치 (pos가 전체 길이 이상이면 블록 수)"""
+        tree = self._tree
+        index = total = 0
+        step = self._top
+        while step:
+            nxt = index + step
+            if nxt < len(tree) and total + tree[nxt] <= pos:
+                index = nxt
+                total += tree[nxt]
+            step >>= 1
+        return index, total
+
+class IncrementalTranslator:
+    """
+    편집할 때마다 바뀐 부분만 다시 점역하는 문서 (점자 디스플레이 실시간 갱신용).
+    문서를 단어 조각(split_words)으로 나눠 조각별 셀을 들고 있음. 조각은 일반 모드에서 시작하고
+    약자와 숫자/영문 구분점자가 공백을 넘지 않으므로, 편집은 걸친 조각과 앞뒤 한 조각만 다시 변환하면 됨.
+    조각은 블록(block_size개 안팎)으로 묶고 블록별 원문/셀 길이의 누적합(_PrefixSums)으로 블록을 고른 뒤
+    그 블록 안만 보므로, 편집/위치 변환 비용은 문서 길이에 거의 무관함 (블록 수의 로그)
+    """
+
+    def __init__(self, text: str = "", use_abbreviation: bool = True, block_size: int = DEFAULT_BLOCK_SIZE):
+        if block_size < 1:
+            raise ValueError("block_size는 1 이상이어야 합니다.")
+        self.use_abbreviation = use_abbreviation
+        self.block_size = block_size
+        self.reset(text)
+
+    def reset(self, text: str):
+        """문서 전체를 text로 바꾸고 처음부터 다시 변환"""
+        tokens = split_words(text)
+        cells = self._encode_tokens(tokens)
+        size = self.block_size
+        # 블록별 조각 목록, 셀 목록, 원문 길이, 셀 길이 (같은 번호끼리 한 블록)
+        self._tokens = [tokens[i:i + size] for i in range(0, len(tokens), size)] or [[]]
+        self._cells = [cells[i:i + size] for i in range(0, len(cells), size)] or [[]]
+        self._source_lens = [sum(map(len, block)) for block in self._tokens]
+        self._cell_lens = [sum(map(len, block)) for block in self._cells]
+        self._length = len(text)
+        self._cell_count = sum(self._cell_lens)
+        self._reindex()
+
+    def _reindex(self):
+        # 블록 구성이 바뀌면 누적합을 새로 만듦
+        self._source_sums = _PrefixSums(self._source_lens)
+        self._cell_sums = _PrefixSums(self._cell_lens)
+
+    def _encode_tokens(self, tokens: List[str]) -> List[bytes]:
+        # 같은 조각은 한 번만 변환
+        unique = dict.fromkeys(tokens)
+        for token in unique:
+            unique[token] = text_to_braille(token, self.use_abbreviation)
+        return list(map(unique.__getitem__, tokens))
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def cell_count(self) -> int:
+        return self._cell_count
+
+    @property
+    def text(self) -> str:
+        return ''.join(map(''.join, self._tokens))
+
+    @property
+    def cells(self) -> bytes:
+        return b''.join(map(b''.join, self._cells))
+
+    def _find(self, pos: int, by_cells: bool = False) -> Tuple[int, int, int, int]:
+        """
+        원문(by_cells면 셀) 위치 pos를 담은 조각의 (블록 번호, 블록 안 조각 번호, 조각의 원문 시작, 조각의 셀 시작).
+        pos가 문서 끝이면 마지막 블록의 마지막 조각 다음
+        """
+        sums, other = (self._cell_sums, self._source_sums) if by_cells else (self._source_sums, self._cell_sums)
+        bi, base = sums.find(pos)
+        if bi == len(self._tokens):
+            bi -= 1
+            base -= (self._cell_lens if by_cells else self._source_lens)[bi]
+        tokens, cells = self._tokens[bi], self._cells[bi]
+        source, cell = (other.prefix(bi), base) if by_cells else (base, other.prefix(bi))
+        ti = bisect_right(list(accumulate(map(len, cells if by_cells else tokens))), pos - base)
+        source += sum(map(len, tokens[:ti]))
+        cell += sum(map(len, cells[:ti]))
+        return bi, ti, source, cell
+
+    def _merge(self, first: int, last: int):
+        # 블록 first..last를 하나로 합침 (편집이 블록 경계에 걸칠 때)
+        for parts in (self._tokens, self._cells):
+            parts[first:last + 1] = [[item for block in parts[first:last + 1] for item in block]]
+        for lens in (self._source_lens, self._cell_lens):
+            lens[first:last + 1] = [sum(lens[first:last + 1])]
+        self._reindex()
+
+    def _rebalance(self, bi: int):
+        tokens, cells = self._tokens[bi], self._cells[bi]
+        size = self.block_size
+        if len(tokens) > 2 * size:
+            starts = range(0, len(tokens), size)
+            split_tokens = [tokens[i:i + size] for i in starts]
+            split_cells = [cells[i:i + size] for i in starts]
+            self._tokens[bi:bi + 1] = split_tokens
+            self._cells[bi:bi + 1] = split_cells
+            self._source_lens[bi:bi + 1] = [sum(map(len, block)) for block in split_tokens]
+            self._cell_lens[bi:bi + 1] = [sum(map(len, block)) for block in split_cells]
+            self._reindex()
+        elif not tokens and len(self._tokens) > 1:
+            for parts in (self._tokens, self._cells, self._source_lens, self._cell_lens):
+                del parts[bi]
+            self._reindex()
+
+    def edit(self, start: int, end: int, replacement: str = "") -> CellEdit:
+        """
+        원문 [start, end)를 replacement로 바꾸고, 셀이 바뀐 구간을 CellEdit으로 반환 (삽입은 start == end, 삭제는 빈 문자열).
+        - 앞쪽은 start 직전 글자를 담은 조각부터: 그 조각의 시작은 편집 뒤에도 조각 경계
+          (start 바로 앞이 공백이었다가 글자가 붙어 앞 조각과 이어지는 경우까지 포함)
+        - 뒤쪽은 end 위치 글자를 담은 조각까지: 그 조각의 끝은 편집 구간 뒤라 편집 뒤에도 조각 경계
+        그 사이만 다시 나눠 바뀐 조각만 변환하므로, 결과는 문서 전체를 다시 변환한 것과 같음
+        """
+        if not 0 <= start <= end <= self._length:
+            raise ValueError(f"편집 구간이 문서 밖입니다: [{start}, {end}) (문서 길이 {self._length})")
+        bi, ti, source_start, cell_start = self._find(start - 1 if start else 0)
+        bj, tj, _, _ = self._find(end)
+        if bj > bi:
+            tj += sum(map(len, self._tokens[bi:bj]))
+            self._merge(bi, bj)
+        tokens, cells = self._tokens[bi], self._cells[bi]
+        stop = min(tj + 1, len(tokens))
+        old_tokens = tokens[ti:stop]
+        old_text = ''.join(old_tokens)
+        new_tokens = split_words(
+            old_text[:start - source_start] + replacement + old_text[end - source_start:]
+        )
+        # 앞뒤로 그대로인 조각은 셀도 그대로 둠
+        same = min(len(old_tokens), len(new_tokens))
+        head = 0
+        while head < same and old_tokens[head] == new_tokens[head]:
+            head += 1
+        tail = 0
+        while tail < same - head and old_tokens[-1 - tail] == new_tokens[-1 - tail]:
+            tail += 1
+        lo, hi = ti + head, stop - tail
+        changed = new_tokens[head:len(new_tokens) - tail]
+        new_cells = self._encode_tokens(changed)
+        cell_start += sum(map(len, cells[ti:lo]))
+        removed = sum(map(len, cells[lo:hi]))
+        added = b"".join(new_cells)
+        tokens[lo:hi] = changed
+        cells[lo:hi] = new_cells
+        delta = len(replacement) - (end - start)
+        self._source_lens[bi] += delta
+        self._cell_lens[bi] += len(added) - removed
+        self._source_sums.add(bi, delta)
+        self._cell_sums.add(bi, len(added) - removed)
+        self._length += delta
+        self._cell_count += len(added) - removed
+        self._rebalance(bi)
+        return CellEdit(cell_start, cell_start + removed, added)
+
+    # === 원문 <-> 셀 위치 대응 ===
+
+    def _locate(self, pos: int, by_cells: bool, at_start: bool) -> int:
+        # at_start면 pos를 담은 변환 단위의 시작, 아니면 pos-1을 담은 단위의 끝을 반대쪽 위치로 바꿈.
+        # 조각 안의 글자별 대응은 그 조각만 다시 변환해 구함
+        total, other_total = (self._cell_count, self._length) if by_cells else (self._length, self._cell_count)
+        if at_start and pos >= total:
+            return other_total
+        if not at_start and pos <= 0:
+            return 0
+        bi, ti, source, cell = self._find(pos if at_start else pos - 1, by_cells)
+        offsets = text_to_braille_offsets(self._tokens[bi][ti], self.use_abbreviation)
+        if by_cells:
+            local = pos - cell
+            return source + (offsets.source_start(local) if at_start else offsets.source_end(local))
+        local = pos - source
+        return cell + (offsets.cell_start(local) if at_start else offsets.cell_end(local))
+
+    def cell_range(self, start: int, end: int) -> Tuple[int, int]:
+        """원문 [start, end) 글자를 나타내는 셀 구간 (약자에 걸치면 약자 전체로 넓힘)"""
+        if not 0 <= start <= end <= self._length:
+            raise ValueError(f"원문 구간이 문서 밖입니다: [{start}, {end}) (문서 길이 {self._length})")
+        first = self._locate(start, False, True)
+        if start == end:
+            return first, first
+        return first, max(first, self._locate(end, False, False))
+
+    def source_range(self, cell_start: int, cell_end: int) -> Tuple[int, int]:
+        """셀 [cell_start, cell_end)를 만든 원문 구간 (커서/터치 위치를 원문으로 옮길 때)"""
+        if not 0 <= cell_start <= cell_end <= self._cell_count:
+            raise ValueError(f"셀 구간이 점자 밖입니다: [{cell_start}, {cell_end}) (셀 수 {self._cell_count})")
+        first = self._locate(cell_start, True, True)
+        if cell_start == cell_end:
+            return first, first
+        return first, max(first, self._locate(cell_end, True, False))
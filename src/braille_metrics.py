@@ -0,0 +1,171 @@
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict, Iterator, NamedTuple, Optional
+
+# 변환 중에 세는 카운터 (이름 -> 설명)
+COUNTERS = {
+    "abbreviations": "텍스트 변환에서 적용한 여러 글자 약자 수",
+    "syllables": "점자 복원에서 초성+중성(+종성) 셀을 합쳐 만든 음절 수",
+    "ambiguous_symbols": "점자 복원에서 앞뒤 문맥으로 고른 모호한 기호 수",
+    "unknown_cells": "점자 복원에서 대응하는 글자가 없는 셀 수",
+    "unknown_chars": "텍스트 변환에서 점자로 바꿀 수 없어 빈 셀로 둔 글자 수",
+    "mode_switches": "숫자/영문 구분점자로 모드를 바꾼 횟수 (변환은 넣은 수, 복원은 읽은 수)",
+}
+# 시간을 재는 단계 (이름 -> 설명)
+STAGES = {
+    "parse": "01문자열/유니코드 점자 -> 셀 코드",
+    "translate": "텍스트 <-> 셀 코드 변환/복원",
+    "render": "셀 코드 -> 점자 이미지",
+    "recognize": "점자 이미지 -> 셀 코드",
+}
+
+# 이벤트(알 수 없는 셀/글자 등)를 넘겨받는 콜백: (종류, 메시지)
+EventCallback = Callable[[str, str], None]
+
+class StageStats(NamedTuple):
+    calls: int
+    seconds: float
+    max_seconds: float
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+class MetricsSnapshot(NamedTuple):
+    counters: Dict[str, int]
+    stages: Dict[str, StageStats]
+
+    def to_prometheus(self, prefix: str = "braille") -> str:
+        """Prometheus 텍스트 형식 (카운터는 <prefix>_<이름>_total, 단계는 stage 라벨)"""
+        lines = []
+        for name, value in self.counters.items():
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# HELP {metric} {COUNTERS.get(name, name)}")
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        for metric, kind, help_text, field in (
+            (f"{prefix}_stage_calls_total", "counter", "단계별 측정 횟수", "calls"),
+            (f"{prefix}_stage_seconds_total", "counter", "단계별 누적 시간 (초)", "seconds"),
+            (f"{prefix}_stage_max_seconds", "gauge", "단계별 가장 오래 걸린 한 번 (초)", "max_seconds"),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for stage, stats in self.stages.items():
+                lines.append(f'{metric}{{stage="{stage}"}} {getattr(stats, field)}')
+        return "\n".join(lines) + "\n"
+
+class Metrics:
+    """
+    카운터와 단계별 시간 집계 (스레드 안전).
+    변환 함수는 호출 하나가 끝날 때 모아 둔 값을 한 번에 더하므로 글자/셀마다 잠그지 않음.
+    on_event를 주면 알 수 없는 셀/글자 같은 이벤트를 콜백으로, 없으면 logging("braille" 로거)으로 보냄
+    """
+
+    def __init__(self, on_event: Optional[EventCallback] = None):
+        self.on_event = on_event
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(COUNTERS, 0)
+        self._stages = {stage: [0, 0.0, 0.0] for stage in STAGES}
+
+    def add(self, **counts: int):
+        """카운터 여러 개를 한 번에 더함 (예: add(syllables=3, unknown_cells=1))"""
+        with self._lock:
+            counters = self._counters
+            for name, count in counts.items():
+                counters[name] = counters.get(name, 0) + count
+
+    def record(self, stage: str, seconds: float):
+        """단계 한 번의 실행 시간을 더함"""
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = self._stages[stage] = [0, 0.0, 0.0]
+            stats[0] += 1
+            stats[1] += seconds
+            if seconds > stats[2]:
+                stats[2] = seconds
+
+    def event(self, kind: str, message: str):
+        if self.on_event is not None:
+            self.on_event(kind, message)
+        else:
+            log_event(kind, message)
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            return MetricsSnapshot(
+                dict(self._counters),
+                {stage: StageStats(*stats) for stage, stats in self._stages.items()},
+            )
+
+    def to_prometheus(self, prefix: str = "braille") -> str:
+        return self.snapshot().to_prometheus(prefix)
+
+    def reset(self):
+        with self._lock:
+            for name in self._counters:
+                self._counters[name] = 0
+            for stats in self._stages.values():
+                stats[:] = [0, 0.0, 0.0]
+
+def log_event(kind: str, message: str):
+    """집계가 꺼져 있거나 콜백이 없을 때의 이벤트 출력 (logging은 처음 쓸 때 불러옴)"""
+    import logging
+    logging.getLogger("braille").info("%s: %s", kind, message)
+
+# 현재 집계 대상 (None이면 꺼짐). 변환 함수는 호출마다 이 값만 한 번 확인하므로 꺼져 있을 때 비용이 거의 없음
+active: Optional[Metrics] = None
+
+def enable(metrics: Optional[Metrics] = None) -> Metrics:
+    """집계를 켜고 집계 객체를 반환 (metrics가 없으면 새로 만듦)"""
+    global active
+    active = metrics if metrics is not None else Metrics()
+    return active
+
+def disable() -> Optional[Metrics]:
+    """집계를 끄고 마지막 집계 객체를 반환"""
+    global active
+    metrics, active = active, None
+    return metrics
+
+@contextmanager
+def collect(metrics: Optional[Metrics] = None, on_event: Optional[EventCallback] = None) -> Iterator[Metrics]:
+    """
+    with 블록 안에서만 집계를 켬 (끝나면 이전 상태로 되돌림).
+        with collect() as metrics:
+            text_to_braille(...)
+        print(metrics.to_prometheus())
+    """
+    global active
+    previous = active
+    active = metrics if metrics is not None else Metrics(on_event)
+    try:
+        yield active
+    finally:
+        active = previous
+
+def timed(stage: str):
+    """켜져 있을 때만 함수 한 번의 실행 시간을 stage로 기록하는 데코레이터 (꺼져 있으면 값 하나만 확인)"""
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = active
+            if metrics is None:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.record(stage, perf_counter() - start)
+        return wrapper
+    return decorate
+
+def report(kind: str, message: str):
+    """알 수 없는 셀/글자 같은 이벤트를 집계 객체의 콜백으로, 꺼져 있거나 콜백이 없으면 logging으로 보냄"""
+    metrics = active
+    if metrics is not None:
+        metrics.event(kind, message)
+    else:
+        log_event(kind, message)
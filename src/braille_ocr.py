@@ -0,0 +1,168 @@
+import glob
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+
+from braille_image import load_gray, recognize_braille
+from braille_translator import braille_to_text
+from braille_utils import codes_to_unicode
+
+# 인식할 이미지 확장자 (디렉터리를 넘기면 이 확장자만 재귀로 모음)
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp", ".webp")
+
+class OcrResult(NamedTuple):
+    path: str
+    cells: bytes                    # 인식한 셀 코드 (실패하면 빈 bytes)
+    text: str                       # 복원한 텍스트
+    expected: Optional[str]         # 정답 텍스트 (확인하지 않으면 None)
+    read_seconds: float             # 파일 읽기 + 이미지 디코딩 시간
+    recognize_seconds: float        # 셀 인식 + 텍스트 복원 시간
+    error: Optional[str] = None
+
+    @property
+    def correct(self) -> Optional[bool]:
+        if self.error is not None or self.expected is None:
+            return None
+        return self.text == self.expected
+
+    def to_record(self) -> dict:
+        """결과 파일(JSONL) 한 줄에 쓰는 값"""
+        return {
+            "path": self.path,
+            "braille": codes_to_unicode(self.cells),
+            "text": self.text,
+            "expected": self.expected,
+            "correct": self.correct,
+            "read_ms": round(self.read_seconds * 1000, 3),
+            "recognize_ms": round(self.recognize_seconds * 1000, 3),
+            "error": self.error,
+        }
+
+def expand_image_inputs(inputs: Iterable[str]) -> List[str]:
+    """디렉터리(하위까지 이미지 파일), 글롭, 파일 경로를 입력 순서대로 펼침"""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            found = []
+            for root, _, files in os.walk(item):
+                found.extend(os.path.join(root, f) for f in files if f.lower().endswith(IMAGE_EXTS))
+            paths.extend(sorted(found))
+        elif glob.has_magic(item):
+            paths.extend(sorted(glob.glob(item, recursive=True)))
+        else:
+            paths.append(item)
+    return paths
+
+def sibling_text(path: str) -> Optional[str]:
+    """data/N/ 구조의 정답: 이미지와 같은 디렉터리에 .txt 파일이 하나만 있으면 그 내용"""
+    sample_dir = os.path.dirname(path) or "."
+    texts = [f for f in os.listdir(sample_dir) if f.endswith(".txt")]
+    if len(texts) != 1:
+        return None
+    with open(os.path.join(sample_dir, texts[0]), encoding="utf-8") as f:
+        return f.read()
+
+def store_expected(data_dir: str) -> Dict[str, str]:
+    """샘플 저장소(manifest.jsonl)의 이미지 경로 -> 텍스트"""
+    from braille_samples import MANIFEST_NAME, SampleStore
+    if not os.path.exists(os.path.join(data_dir, MANIFEST_NAME)):
+        return {}
+    return {os.path.normpath(s.image_path): s.text for s in SampleStore(data_dir)}
+
+def _load(path: str, check: bool, expected: Optional[Dict[str, str]]):
+    # 스레드에서 실행: 파일 읽기와 디코딩(cv2가 GIL을 놓음)
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        img = load_gray(f.read())
+    truth = None
+    key = os.path.normpath(path)
+    if expected is not None and key in expected:
+        truth = expected[key]
+    elif check:
+        truth = sibling_text(path)
+    return img, truth, time.perf_counter() - start
+
+def _recognize(img: np.ndarray, cell_size: int, margin: int, patch: int):
+    # 워커 프로세스(또는 workers=1이면 현재 프로세스)에서 실행
+    start = time.perf_counter()
+    cells = recognize_braille(img, cell_size, margin, patch)
+    return cells, braille_to_text(cells), time.perf_counter() - start
+
+def _done(result=None, exception: Optional[BaseException] = None) -> Future:
+    future = Future()
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+def bulk_ocr(
+    paths: Iterable[str],
+    cell_size: int = 40,
+    margin: int = 20,
+    patch: int = 1,
+    workers: int = 1,
+    threads: int = 4,
+    check: bool = False,
+    expected: Optional[Dict[str, str]] = None,
+    max_pending: Optional[int] = None
+) -> Iterator[OcrResult]:
+    """
+    이미지 여러 장을 인식해 입력 순서대로 OcrResult를 내보냄. 실패한 이미지는 error에 사유를 담아 계속 진행.
+    - 파일 읽기/디코딩은 threads개 스레드에서 미리 읽어 두고(최대 max_pending장), 인식/텍스트 복원은
+      workers > 1이면 프로세스 풀, 아니면 현재 프로세스에서 함 -> 읽기와 인식이 겹쳐서 진행
+    - check: 이미지 옆 .txt(data/N/ 구조)를 정답으로 읽어 expected에 담음
+    - expected: 경로(os.path.normpath) -> 정답 텍스트 (있으면 .txt보다 우선, store_expected 참고)
+    """
+    max_pending = max_pending or max(threads, workers) * 4
+    it = iter(paths)
+    loads = deque()
+    recognitions = deque()
+    loader = ThreadPoolExecutor(max_workers=threads)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def fill():
+        while len(loads) + len(recognitions) < max_pending:
+            path = next(it, None)
+            if path is None:
+                return
+            loads.append((path, loader.submit(_load, path, check, expected)))
+
+    def stage(path, load):
+        # 읽기가 끝난 이미지를 인식 단계로 넘김. 읽기 실패도 Future에 담아 순서대로 보고
+        try:
+            img, truth, read_seconds = load.result()
+        except Exception as e:
+            return path, _done(exception=e), None, 0.0
+        if executor is not None:
+            return path, executor.submit(_recognize, img, cell_size, margin, patch), truth, read_seconds
+        try:
+            return path, _done(_recognize(img, cell_size, margin, patch)), truth, read_seconds
+        except Exception as e:
+            return path, _done(exception=e), truth, read_seconds
+
+    def finish(path, job, truth, read_seconds):
+        try:
+            cells, text, seconds = job.result()
+        except Exception as e:
+            return OcrResult(path, b"", "", truth, read_seconds, 0.0, f"{type(e).__name__}: {e}")
+        return OcrResult(path, cells, text, truth, read_seconds, seconds)
+
+    try:
+        fill()
+        while loads or recognitions:
+            if loads:
+                recognitions.append(stage(*loads.popleft()))
+                fill()
+            # 인식 중인 작업이 프로세스 수의 두 배를 넘거나 더 읽을 파일이 없으면 앞에서부터 내보냄
+            while recognitions and (not loads or len(recognitions) > max(1, workers) * 2):
+                yield finish(*recognitions.popleft())
+                fill()
+    finally:
+        loader.shutdown(wait=True, cancel_futures=True)
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
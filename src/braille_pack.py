@@ -0,0 +1,200 @@
+import mmap
+import os
+import struct
+from typing import Iterator, NamedTuple, Optional, Union
+
+import numpy as np
+
+from braille_utils import BrailleCells, pack_cells
+
+# 팩 파일 구성
+# - <path>      : 8바이트 매직 + 레코드를 이어 붙인 데이터 (추가만 함)
+# - <path>.idx  : 레코드 시작 위치(little-endian u64)를 레코드 순서대로 나열한 색인
+#                 N번 레코드 위치는 색인의 8*N 바이트 -> 임의 접근은 한 번의 조회
+# 레코드: 헤더(_RECORD) + 셀 코드 + UTF-8 텍스트 + 이미지 블록
+# 색인은 레코드를 다 쓴 뒤에 기록하므로, 쓰다 멈춘 마지막 레코드는 색인에 없어 읽히지 않음
+PACK_MAGIC = b"BRPK\x01\x00\x00\x00"
+INDEX_SUFFIX = ".idx"
+
+# 이미지 블록 종류
+IMAGE_NONE = 0      # 이미지 없음
+IMAGE_REF = 1       # 이미지 파일 경로 (UTF-8)
+IMAGE_PIXELS = 2    # 회색조 픽셀 (height * width 바이트)
+
+# 셀 길이, 텍스트 길이, 이미지 길이, 높이, 너비, 이미지 종류
+_RECORD = struct.Struct("<IIIIIB3x")
+_OFFSET = struct.Struct("<Q")
+
+class PackedSample(NamedTuple):
+    cells: memoryview                               # 셀 코드 (mmap을 그대로 가리킴)
+    text: str
+    image: Union[None, str, np.ndarray]             # 경로, 또는 mmap을 가리키는 (높이, 너비) uint8 배열
+
+class PackWriter:
+    """
+    팩 파일에 샘플을 이어서 기록 (파일이 없으면 새로 만듦).
+    image: None, 이미지 경로(str), 또는 2차원 uint8 회색조 배열
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._data = open(path, "ab")
+        self._index = open(path + INDEX_SUFFIX, "ab")
+        if is_new:
+            self._data.write(PACK_MAGIC)
+        else:
+            with open(path, "rb") as f:
+                if f.read(len(PACK_MAGIC)) != PACK_MAGIC:
+                    raise ValueError(f"점자 팩 파일이 아닙니다: {path}")
+        self._offset = self._data.tell()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add(self, braille_list: BrailleCells, text: str, image: Union[None, str, np.ndarray] = None):
+        cells = pack_cells(braille_list)
+        text_bytes = text.encode("utf-8")
+        height = width = 0
+        if image is None:
+            kind, block = IMAGE_NONE, b""
+        elif isinstance(image, str):
+            kind, block = IMAGE_REF, image.encode("utf-8")
+        else:
+            if image.ndim != 2 or image.dtype != np.uint8:
+                raise ValueError("픽셀 이미지는 2차원 uint8 회색조 배열이어야 합니다.")
+            kind, block = IMAGE_PIXELS, np.ascontiguousarray(image).tobytes()
+            height, width = image.shape
+        header = _RECORD.pack(len(cells), len(text_bytes), len(block), height, width, kind)
+        self._data.write(header + cells + text_bytes + block)
+        self._data.flush()
+        self._index.write(_OFFSET.pack(self._offset))
+        self._offset += len(header) + len(cells) + len(text_bytes) + len(block)
+
+    def close(self):
+        self._data.close()
+        self._index.close()
+
+class PackReader:
+    """
+    팩 파일을 mmap으로 열어 읽음. 여는 시점까지 색인에 기록된 레코드만 보임.
+    반환하는 셀/픽셀은 복사 없이 mmap을 가리키므로 close 전에 참조를 놓아야 함
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data = self._map(path)
+        self._index = self._map(path + INDEX_SUFFIX)
+        if self._data[:len(PACK_MAGIC)] != PACK_MAGIC:
+            raise ValueError(f"점자 팩 파일이 아닙니다: {path}")
+        self._count = len(self._index) // _OFFSET.size
+
+    @staticmethod
+    def _map(path: str):
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, n: int) -> PackedSample:
+        if n < 0:
+            n += self._count
+        if not 0 <= n < self._count:
+            raise IndexError(n)
+        offset, = _OFFSET.unpack_from(self._index, n * _OFFSET.size)
+        n_cells, n_text, n_image, height, width, kind = _RECORD.unpack_from(self._data, offset)
+        view = memoryview(self._data)
+        pos = offset + _RECORD.size
+        cells = view[pos:pos + n_cells]
+        pos += n_cells
+        text = str(view[pos:pos + n_text], "utf-8")
+        pos += n_text
+        image: Union[None, str, np.ndarray] = None
+        if kind == IMAGE_REF:
+            image = str(view[pos:pos + n_image], "utf-8")
+        elif kind == IMAGE_PIXELS:
+            image = np.frombuffer(self._data, dtype=np.uint8, count=n_image, offset=pos).reshape(height, width)
+        return PackedSample(cells, text, image)
+
+    def __iter__(self) -> Iterator[PackedSample]:
+        return (self[n] for n in range(self._count))
+
+    def close(self):
+        for m in (self._data, self._index):
+            if isinstance(m, mmap.mmap):
+                try:
+                    m.close()
+                except BufferError:
+                    # 아직 쓰는 셀/픽셀 뷰가 있으면 마지막 뷰가 사라질 때 해제됨
+                    pass
+        self._data = self._index = b""
+
+def build_pack(
+    data_dir: str,
+    pack_path: str,
+    image: Optional[str] = "ref",
+    cells_from: str = "image",
+    use_abbreviation: bool = True,
+    cell_size: int = 40,
+    margin: int = 20
+) -> int:
+    """
+    샘플 저장소(data_dir)의 샘플을 하나씩 읽어 팩 파일에 이어 씀. 기록한 샘플 수 반환.
+    - image: "ref"(이미지 경로), "pixels"(회색조 픽셀), None(이미지 없음)
+    - cells_from: "image"(이미지 인식 결과) 또는 "text"(텍스트 점역 결과)
+    """
+    # 읽기 쪽(PackReader)은 cv2 없이 쓸 수 있도록 만들 때 필요한 모듈은 여기서 import
+    import cv2
+    from braille_image import image_to_braille_list
+    from braille_samples import SampleStore
+    from braille_translator import text_to_braille
+
+    if image not in ("ref", "pixels", None):
+        raise ValueError("image는 'ref', 'pixels', None 중 하나여야 합니다.")
+    if cells_from not in ("image", "text"):
+        raise ValueError("cells_from은 'image' 또는 'text'여야 합니다.")
+    count = 0
+    with PackWriter(pack_path) as writer:
+        for sample in SampleStore(data_dir):
+            if cells_from == "image":
+                cells = image_to_braille_list(sample.image_path, cell_size, margin)
+            else:
+                cells = text_to_braille(sample.text, use_abbreviation)
+            if image == "pixels":
+                block = cv2.imread(sample.image_path, cv2.IMREAD_GRAYSCALE)
+                if block is None:
+                    raise FileNotFoundError(sample.image_path)
+            else:
+                block = sample.image_path if image == "ref" else None
+            writer.add(cells, sample.text, block)
+            count += 1
+    return count
+
+def import_pack(
+    pack_path: str,
+    data_dir: str,
+    cell_size: int = 40,
+    dot_radius: int = 7,
+    margin: int = 20
+) -> int:
+    """팩 파일의 샘플을 샘플 저장소로 되돌려 씀 (셀 코드로 이미지를 다시 그림). 기록한 샘플 수 반환"""
+    from braille_samples import SampleStore
+
+    count = 0
+    with PackReader(pack_path) as reader, SampleStore(data_dir, batch_size=256) as store:
+        for sample in reader:
+            store.save(bytes(sample.cells), sample.text, cell_size, dot_radius, margin)
+            count += 1
+    return count
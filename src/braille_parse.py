@@ -0,0 +1,69 @@
+from braille_metrics import timed
+from braille_utils import BrailleParseError, unicode_to_codes
+
+# 셀 코드 -> "dddddd " (점 1~6 순서 + 구분 공백)
+_CELL_01 = tuple(''.join("1" if code >> dot & 1 else "0" for dot in range(6)) + " " for code in range(64))
+# 점 i(0~5) 자리의 '0'/'1' 바이트 -> 0 / 비트 i
+_DOT_BITS = tuple(bytes.maketrans(b"01", bytes((0, 1 << dot))) for dot in range(6))
+# ASCII 공백 (스페이스, 탭, 줄바꿈, CR, VT, FF)
+_WHITESPACE_BYTES = (32, 9, 10, 11, 12, 13)
+
+@timed("parse")
+def parse_01(s: str) -> bytes:
+    """
+    공백으로 구분한 6자리 01문자열(점 1~6 순서)을 셀 코드 bytes로 변환.
+    ASCII 바이트 배열 위에서 검증과 변환을 한 번에 처리하므로 셀마다 파이썬 객체를 만들지 않음.
+    잘못된 셀이 있으면 첫 셀의 순번을 담아 BrailleParseError
+    """
+    # 앞뒤 공백은 셀 순번에 영향이 없으므로 먼저 걷어 냄 (청크 경계/파일 끝 줄바꿈도 빠른 경로로)
+    raw = s.encode("utf-8").strip()
+    if not raw:
+        return b""
+    n = len(raw) // 7 + 1
+    if len(raw) % 7 == 6 and raw[6::7] == b" " * (n - 1) and not raw.translate(None, b"01 "):
+        # 흔한 형태("xxxxxx xxxxxx ...", 공백 하나로 구분): 0/1/공백뿐이고 7바이트마다 공백이면
+        # 모든 셀이 6자리이므로 점 자리별 7칸 간격 슬라이스를 비트 값 바이트로 바꿔 큰 정수로 OR
+        # (자리마다 다른 비트라 올림이 없음) -> numpy 없이 바이트 연산만으로 변환
+        value = 0
+        for dot in range(6):
+            value |= int.from_bytes(raw[dot::7].translate(_DOT_BITS[dot]), "little")
+        return value.to_bytes(n, "little")
+    # 일반 형태는 벡터 연산으로 검증 (numpy는 이 경로에서만 불러옴)
+    import numpy as np
+    data = np.frombuffer(raw, dtype=np.uint8)
+    whitespace = np.zeros(256, dtype=bool)
+    whitespace[list(_WHITESPACE_BYTES)] = True
+    # 공백이 아닌 구간(셀 후보)의 시작/끝
+    word = ~whitespace[data]
+    edges = np.diff(word.view(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    bad_len = ends - starts != 6
+    bad_char = np.flatnonzero(word & (data != 48) & (data != 49))
+    if bad_len.any() or len(bad_char):
+        # 잘못된 글자가 들어 있는 셀과 길이가 틀린 셀 중 가장 앞의 것
+        offset = len(starts)
+        if bad_len.any():
+            offset = int(np.argmax(bad_len))
+        if len(bad_char):
+            offset = min(offset, int(np.searchsorted(starts, bad_char[0], side="right")) - 1)
+        cell = raw[starts[offset]:ends[offset]].decode("utf-8", "replace")
+        raise BrailleParseError(f"{cell!r}: 점자(01문자열)는 6자리 0/1을 공백으로 구분해야 합니다.", offset)
+    digits = data[word].reshape(-1, 6) - 48
+    weights = np.left_shift(1, np.arange(6, dtype=np.uint8))
+    return (digits * weights).sum(axis=1, dtype=np.uint8).tobytes()
+
+@timed("parse")
+def parse_unicode(s: str, ignore_newlines: bool = True) -> bytes:
+    """
+    유니코드 점자 문자열을 셀 코드 bytes로 변환 (줄바꿈은 기본으로 무시).
+    점자가 아닌 글자가 있으면 그 셀 순번을 담아 BrailleParseError
+    """
+    if ignore_newlines and ("\n" in s or "\r" in s):
+        s = s.replace("\r", "").replace("\n", "")
+    return unicode_to_codes(s)
+
+def format_01(codes: bytes) -> str:
+    """셀 코드 bytes를 공백 구분 01문자열로 변환 (parse_01의 역)"""
+    # 64개 문자열 표 조회 + join (numpy 벡터 연산과 같은 속도이고 numpy import가 필요 없음)
+    return ''.join(map(_CELL_01.__getitem__, codes))[:-1]
@@ -0,0 +1,229 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from braille_image import braille_to_image
+from braille_utils import BrailleCells
+
+# 샘플 저장소 파일 이름
+MANIFEST_NAME = "manifest.jsonl"   # 한 줄에 샘플 하나: {"id", "image", "text"}
+COUNTER_NAME = "counter"           # 다음에 발급할 샘플 번호
+LOCK_NAME = ".lock"                # 번호 발급/manifest 기록 때 운영체제 잠금을 거는 파일 (지우지 않음)
+
+# 샤드 디렉터리 하나에 넣는 샘플 수
+DEFAULT_SAMPLE_SHARD_SIZE = 1000
+
+class Sample(NamedTuple):
+    id: int
+    text: str
+    image_path: str     # data_dir 기준 경로를 붙인 이미지 경로
+
+if os.name == "nt":
+    import msvcrt
+
+    def _try_lock(fd: int) -> bool:
+        os.lseek(fd, 0, os.SEEK_SET)
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def _unlock(fd: int):
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _try_lock(fd: int) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def _unlock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+@contextmanager
+def _file_lock(path: str, timeout: float = 10.0):
+    # 잠금 파일에 거는 운영체제 잠금 (POSIX flock, Windows msvcrt.locking).
+    # 잠금은 파일을 연 프로세스가 죽으면 운영체제가 풀어 주므로 남은 잠금 파일을 치울 필요가 없음
+    deadline = time.monotonic() + timeout
+    fd = os.open(path, os.O_CREAT | os.O_RDWR)
+    try:
+        while not _try_lock(fd):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"샘플 저장소 잠금을 얻지 못했습니다: {path}")
+            time.sleep(0.01)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+def _write_atomic(path: str, data: str):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+class SampleStore:
+    """
+    점자 이미지 샘플 저장소.
+    - 샘플 번호는 counter 파일로 발급 (잠금 안에서 읽고 원자적으로 교체) -> 저장은 디렉터리 크기와 무관한 O(1)
+    - 이미지는 shard_NNNN/<번호>.png 로 나눠 저장하고, 텍스트와 경로는 manifest.jsonl에 한 줄씩 추가
+    - 조회/목록은 manifest만 읽음 (디렉터리 순회 없음). 다른 프로세스가 추가한 줄은 이어서 읽음
+    - batch_size > 1이면 번호를 묶음으로 발급하고 manifest 기록을 모아서 함 (flush/close 또는 with 종료 시 기록).
+      기록 전에 멈추면 그 묶음의 이미지는 manifest에 없으므로 샘플로 보이지 않고 번호는 비게 됨
+    기존 방식(data_dir/<번호>/dot.png + <텍스트>.txt)의 샘플은 저장소를 처음 만들 때 한 번 manifest로 옮겨 적음
+    """
+
+    def __init__(
+        self,
+        data_dir: str = "data",
+        shard_size: int = DEFAULT_SAMPLE_SHARD_SIZE,
+        batch_size: int = 1
+    ):
+        self.data_dir = data_dir
+        self.shard_size = shard_size
+        self.batch_size = max(1, batch_size)
+        self._manifest = os.path.join(data_dir, MANIFEST_NAME)
+        self._counter = os.path.join(data_dir, COUNTER_NAME)
+        self._lock = os.path.join(data_dir, LOCK_NAME)
+        self._reserved: List[int] = []
+        self._pending: List[dict] = []
+        self._index: Dict[int, dict] = {}
+        self._offset = 0
+        os.makedirs(data_dir, exist_ok=True)
+        if not os.path.exists(self._counter):
+            with _file_lock(self._lock):
+                if not os.path.exists(self._counter):
+                    self._import_legacy()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- 쓰기 ---
+
+    def _import_legacy(self):
+        records = []
+        for name in os.listdir(self.data_dir):
+            sample_dir = os.path.join(self.data_dir, name)
+            if not (name.isdigit() and os.path.isdir(sample_dir)):
+                continue
+            texts = [f for f in os.listdir(sample_dir) if f.endswith(".txt")]
+            text = ""
+            if texts:
+                with open(os.path.join(sample_dir, texts[0]), encoding="utf-8") as f:
+                    text = f.read()
+            records.append({"id": int(name), "image": f"{name}/dot.png", "text": text})
+        records.sort(key=lambda r: r["id"])
+        if records:
+            self._append(records)
+        next_id = records[-1]["id"] + 1 if records else 1
+        _write_atomic(self._counter, str(next_id))
+
+    def _reserve(self, count: int) -> List[int]:
+        with _file_lock(self._lock):
+            with open(self._counter, encoding="utf-8") as f:
+                start = int(f.read().strip() or 1)
+            _write_atomic(self._counter, str(start + count))
+        return list(range(start, start + count))
+
+    def _append(self, records: List[dict]):
+        lines = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+        with open(self._manifest, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def save(
+        self,
+        braille_list: BrailleCells,
+        text: str,
+        cell_size: int = 40,
+        dot_radius: int = 7,
+        margin: int = 20
+    ) -> Sample:
+        if not self._reserved:
+            self._reserved = self._reserve(self.batch_size)
+        sample_id = self._reserved.pop(0)
+        image = f"shard_{sample_id // self.shard_size:04d}/{sample_id}.png"
+        braille_to_image(
+            braille_list=braille_list,
+            cell_size=cell_size,
+            dot_radius=dot_radius,
+            margin=margin,
+            save_path=os.path.join(self.data_dir, image)
+        )
+        record = {"id": sample_id, "image": image, "text": text}
+        self._pending.append(record)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        return self._sample(record)
+
+    def flush(self):
+        """모아 둔 샘플을 manifest에 기록"""
+        if not self._pending:
+            return
+        with _file_lock(self._lock):
+            self._append(self._pending)
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        self._reserved = []
+
+    # --- 읽기 ---
+
+    def _sample(self, record: dict) -> Sample:
+        return Sample(record["id"], record["text"], os.path.join(self.data_dir, record["image"]))
+
+    def _refresh(self):
+        # 마지막으로 읽은 위치 이후에 추가된 줄만 읽음 (끝나지 않은 마지막 줄은 다음에 읽음)
+        if not os.path.exists(self._manifest):
+            return
+        with open(self._manifest, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if line.strip():
+                record = json.loads(line)
+                self._index[record["id"]] = record
+        self._offset += end
+
+    def get(self, sample_id: int) -> Sample:
+        if sample_id not in self._index:
+            self._refresh()
+        return self._sample(self._index[sample_id])
+
+    def __contains__(self, sample_id: int) -> bool:
+        try:
+            self.get(sample_id)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[Sample]:
+        self._refresh()
+        return (self._sample(r) for r in sorted(self._index.values(), key=lambda r: r["id"]))
+
+    def __len__(self) -> int:
+        self._refresh()
+        return len(self._index)
+
+_stores: Dict[str, SampleStore] = {}
+
+def open_sample_store(data_dir: str = "data") -> SampleStore:
+    """data_dir별로 한 번만 연 저장소를 재사용 (샘플 하나씩 바로 기록)"""
+    key = os.path.abspath(data_dir)
+    store: Optional[SampleStore] = _stores.get(key)
+    if store is None:
+        store = _stores[key] = SampleStore(data_dir)
+    return store
@@ -0,0 +1,377 @@
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from braille_image import encode_image, image_to_braille_list
+from braille_translator import braille_to_text, text_to_braille
+from braille_utils import codes_to_unicode, unicode_to_codes
+
+# 한 묶음으로 모으는 최대 요청 수와 첫 요청 이후 기다리는 시간(초)
+DEFAULT_MAX_BATCH = 256
+DEFAULT_BATCH_WINDOW = 0.002
+# 요청 본문 최대 크기 (바이트)
+DEFAULT_MAX_BODY = 8 << 20
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    411: "Length Required", 413: "Payload Too Large", 500: "Internal Server Error",
+}
+
+class ServerConfig(NamedTuple):
+    host: str = "127.0.0.1"
+    port: int = 8080
+    workers: Optional[int] = None           # 프로세스 풀 크기 (0이면 스레드 하나에서 처리)
+    max_connections: int = 1024             # 동시에 처리하는 연결 수
+    max_inflight: int = 4096                # 동시에 처리 중인 요청 수 (넘으면 자리가 날 때까지 대기)
+    max_batch: int = DEFAULT_MAX_BATCH
+    batch_window: float = DEFAULT_BATCH_WINDOW
+    max_body: int = DEFAULT_MAX_BODY
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+# === 워커 프로세스에서 실행하는 작업 (결과는 항목별 (성공 여부, 값)) ===
+
+def _encode_batch(items: List[Tuple[str, bool]]) -> List[Tuple[bool, object]]:
+    results = []
+    for text, use_abbreviation in items:
+        try:
+            results.append((True, text_to_braille(text, use_abbreviation)))
+        except Exception as e:
+            results.append((False, str(e)))
+    return results
+
+def _decode_batch(items: List[bytes]) -> List[Tuple[bool, object]]:
+    results = []
+    for codes in items:
+        try:
+            results.append((True, braille_to_text(codes)))
+        except Exception as e:
+            results.append((False, str(e)))
+    return results
+
+def _render(codes: bytes, ext: str, compression: Optional[int], quality: Optional[int]) -> bytes:
+    return encode_image(codes, ext, compression=compression, quality=quality)
+
+def _ocr(data: bytes) -> Tuple[bytes, str]:
+    codes = image_to_braille_list(data)
+    return codes, braille_to_text(codes)
+
+def _from_unicode(braille) -> bytes:
+    if not isinstance(braille, str):
+        raise HttpError(400, "braille는 유니코드 점자 문자열이어야 합니다.")
+    try:
+        return unicode_to_codes(braille)
+    except ValueError as e:
+        raise HttpError(400, str(e))
+
+class Batcher:
+    """
+    짧은 시간(window) 안에 들어온 요청을 묶어 한 번의 작업(batch_fn)으로 실행기에 넘기고
+    결과를 요청별 Future로 나눠 돌려줌. 프로세스 간 통신 비용을 묶음 단위로 나눠 가짐
+    """
+
+    def __init__(self, executor: Executor, batch_fn: Callable, max_batch: int, window: float, stats: Dict):
+        self.executor = executor
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.window = window
+        self.stats = stats
+        self._items: List = []
+        self._futures: List[asyncio.Future] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def submit(self, item) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._items.append(item)
+        self._futures.append(future)
+        if len(self._items) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._items:
+            return
+        items, futures = self._items, self._futures
+        self._items, self._futures = [], []
+        self.stats["batches"] += 1
+        self.stats["batched_items"] += len(items)
+        job = asyncio.get_running_loop().run_in_executor(self.executor, self.batch_fn, items)
+        job.add_done_callback(lambda done: self._scatter(done, futures))
+
+    @staticmethod
+    def _scatter(done: asyncio.Future, futures: List[asyncio.Future]):
+        if done.cancelled() or done.exception() is not None:
+            error = done.exception() if not done.cancelled() else asyncio.CancelledError()
+            for f in futures:
+                if not f.done():
+                    f.set_exception(error)
+            return
+        for f, (ok, value) in zip(futures, done.result()):
+            if f.done():
+                continue
+            if ok:
+                f.set_result(value)
+            else:
+                f.set_exception(HttpError(400, value))
+
+class BrailleServer:
+    """
+    점자 변환 HTTP 서버 (표준 라이브러리 asyncio, HTTP/1.1 keep-alive).
+    - POST /encode  {"text", "abbreviation"?}        -> {"braille", "cells"}
+    - POST /decode  {"braille"} 또는 {"cells"}         -> {"text"}
+    - POST /render  {"text" 또는 "braille", "format"?, "compression"?, "quality"?} -> 이미지 바이트
+    - POST /ocr     본문 = 이미지 바이트              -> {"braille", "cells", "text"}
+    - GET  /health, GET /metrics
+    encode/decode는 batch_window 안에 모인 요청을 묶어 처리하고, render/ocr은 요청마다 실행기로 넘김
+    """
+
+    def __init__(self, config: ServerConfig = ServerConfig()):
+        self.config = config
+        self.stats: Dict = {"requests": {}, "errors": 0, "batches": 0, "batched_items": 0,
+                            "inflight": 0, "latency_seconds": 0.0}
+        self._started = time.monotonic()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._executor: Optional[Executor] = None
+        self._connections: Optional[asyncio.Semaphore] = None
+        self._inflight: Optional[asyncio.Semaphore] = None
+        self._encoder: Optional[Batcher] = None
+        self._decoder: Optional[Batcher] = None
+        self._handlers: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self):
+        cfg = self.config
+        if cfg.workers == 0:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            self._executor = ProcessPoolExecutor(max_workers=cfg.workers or os.cpu_count() or 1)
+        self._connections = asyncio.Semaphore(cfg.max_connections)
+        self._inflight = asyncio.Semaphore(cfg.max_inflight)
+        self._encoder = Batcher(self._executor, _encode_batch, cfg.max_batch, cfg.batch_window, self.stats)
+        self._decoder = Batcher(self._executor, _decode_batch, cfg.max_batch, cfg.batch_window, self.stats)
+        self._server = await asyncio.start_server(self._handle_connection, cfg.host, cfg.port)
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            # 대기 중인 keep-alive 연결을 닫아 처리 태스크가 스스로 끝나게 함
+            for writer in self._handlers.values():
+                writer.close()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # --- HTTP ---
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._handlers[task] = writer
+        async with self._connections:
+            try:
+                while True:
+                    request = await self._read_request(reader, writer)
+                    if request is None:
+                        break
+                    method, path, headers, body = request
+                    status, content_type, payload = await self._dispatch(method, path, headers, body)
+                    keep_alive = headers.get("connection", "").lower() != "close"
+                    self._write_response(writer, status, content_type, payload, keep_alive)
+                    await writer.drain()
+                    if not keep_alive:
+                        break
+            except (ConnectionError, asyncio.IncompleteReadError):
+                pass
+            finally:
+                writer.close()
+                self._handlers.pop(task, None)
+
+    async def _read_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        try:
+            method, target, _ = line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            self._write_error(writer, HttpError(400, "잘못된 요청 줄입니다."))
+            return None
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            self._write_error(writer, HttpError(411, "Content-Length가 필요합니다."))
+            return None
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._write_error(writer, HttpError(400, "Content-Length가 잘못되었습니다."))
+            return None
+        if length > self.config.max_body:
+            self._write_error(writer, HttpError(413, "요청 본문이 너무 큽니다."))
+            return None
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target.split("?", 1)[0], headers, body
+
+    def _write_response(self, writer, status: int, content_type: str, payload: bytes, keep_alive: bool = True):
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + payload)
+
+    def _write_error(self, writer, error: HttpError):
+        self._write_response(writer, error.status, "application/json; charset=utf-8",
+                             self._json({"error": str(error)}), keep_alive=False)
+
+    @staticmethod
+    def _json(value) -> bytes:
+        return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+    async def _dispatch(self, method: str, path: str, headers: Dict[str, str], body: bytes):
+        routes = {
+            "/encode": ("POST", self._encode), "/decode": ("POST", self._decode),
+            "/render": ("POST", self._render), "/ocr": ("POST", self._ocr),
+            "/health": ("GET", self._health), "/metrics": ("GET", self._metrics),
+        }
+        counts = self.stats["requests"]
+        key = path if path in routes else "other"
+        counts[key] = counts.get(key, 0) + 1
+        start = time.perf_counter()
+        try:
+            if path not in routes:
+                raise HttpError(404, f"없는 경로입니다: {path}")
+            expected_method, handler = routes[path]
+            if method != expected_method:
+                raise HttpError(405, f"{path}는 {expected_method}만 지원합니다.")
+            self.stats["inflight"] += 1
+            try:
+                async with self._inflight:
+                    result = await handler(headers, body)
+            finally:
+                self.stats["inflight"] -= 1
+            if isinstance(result, tuple):
+                return (200,) + result
+            return 200, "application/json; charset=utf-8", self._json(result)
+        except HttpError as e:
+            self.stats["errors"] += 1
+            return e.status, "application/json; charset=utf-8", self._json({"error": str(e)})
+        except Exception as e:
+            self.stats["errors"] += 1
+            return 500, "application/json; charset=utf-8", self._json({"error": f"{type(e).__name__}: {e}"})
+        finally:
+            self.stats["latency_seconds"] += time.perf_counter() - start
+
+    @staticmethod
+    def _parse_json(body: bytes) -> Dict:
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            raise HttpError(400, "요청 본문이 JSON이 아닙니다.")
+        if not isinstance(data, dict):
+            raise HttpError(400, "요청 본문은 JSON 객체여야 합니다.")
+        return data
+
+    @staticmethod
+    def _cells_from(data: Dict) -> bytes:
+        if "braille" in data:
+            return _from_unicode(data["braille"])
+        if "cells" in data:
+            cells = data["cells"]
+            if not isinstance(cells, list) or any(not isinstance(c, int) or not 0 <= c <= 63 for c in cells):
+                raise HttpError(400, "cells는 0~63 셀 코드 목록이어야 합니다.")
+            return bytes(cells)
+        raise HttpError(400, "braille 또는 cells가 필요합니다.")
+
+    async def _encode(self, headers, body):
+        data = self._parse_json(body)
+        if not isinstance(data.get("text"), str):
+            raise HttpError(400, "text(문자열)가 필요합니다.")
+        codes = await self._encoder.submit((data["text"], bool(data.get("abbreviation", True))))
+        return {"braille": codes_to_unicode(codes), "cells": list(codes)}
+
+    async def _decode(self, headers, body):
+        codes = self._cells_from(self._parse_json(body))
+        return {"text": await self._decoder.submit(codes)}
+
+    async def _render(self, headers, body):
+        data = self._parse_json(body)
+        if isinstance(data.get("text"), str):
+            codes = await self._encoder.submit((data["text"], bool(data.get("abbreviation", True))))
+        else:
+            codes = self._cells_from(data)
+        fmt = str(data.get("format", "png")).lower()
+        if fmt not in ("png", "webp", "jpg", "jpeg"):
+            raise HttpError(400, "format은 png, webp, jpg 중 하나여야 합니다.")
+        for key in ("compression", "quality"):
+            if not isinstance(data.get(key, 0), int):
+                raise HttpError(400, f"{key}는 정수여야 합니다.")
+        loop = asyncio.get_running_loop()
+        image = await loop.run_in_executor(
+            self._executor, _render, codes, "." + fmt, data.get("compression"), data.get("quality")
+        )
+        return f"image/{'jpeg' if fmt == 'jpg' else fmt}", image
+
+    async def _ocr(self, headers, body):
+        if not body:
+            raise HttpError(400, "이미지 본문이 필요합니다.")
+        loop = asyncio.get_running_loop()
+        try:
+            codes, text = await loop.run_in_executor(self._executor, _ocr, body)
+        except ValueError as e:
+            raise HttpError(400, str(e))
+        return {"braille": codes_to_unicode(codes), "cells": list(codes), "text": text}
+
+    async def _health(self, headers, body):
+        return {"status": "ok"}
+
+    async def _metrics(self, headers, body):
+        stats = dict(self.stats)
+        total = sum(stats["requests"].values())
+        stats["uptime_seconds"] = time.monotonic() - self._started
+        stats["mean_latency_ms"] = stats["latency_seconds"] * 1000 / total if total else 0.0
+        stats["mean_batch_size"] = stats["batched_items"] / stats["batches"] if stats["batches"] else 0.0
+        return stats
+
+def serve(config: ServerConfig = ServerConfig()):
+    """서버를 띄우고 종료(Ctrl+C)까지 실행"""
+    async def run():
+        server = await BrailleServer(config).start()
+        print(f"점자 변환 서버: http://{config.host}:{server.port}")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
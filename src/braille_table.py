@@ -1,5 +1,11 @@
+import os
+import sys
+import unicodedata
 from typing import List, Dict, Tuple, Union
-from braille_utils import flatten_braille_cell, tupleize
+import braille_compile
+import braille_utils
+from braille_compile import DEFAULT_ARTIFACT_NAME, check_tables, read_artifact, source_stamp, write_artifact
+from braille_utils import flatten_braille_cell, tupleize, cell_to_code, pack_cells, unpack_cells
 from collections import defaultdict
 
 # 초성 (자음) 점자
@@ -30,7 +36,7 @@ FINAL_TO_BRAILLE = {
     'ㄱ': [1,0,0,0,0,0], 'ㄲ': [[1,0,0,0,0,0],[1,0,0,0,0,0]],
     'ㄴ': [0,1,0,0,1,0], 'ㄷ': [0,0,1,0,1,0],
     'ㄹ': [0,1,0,0,0,0], 'ㅁ': [0,1,0,0,0,1],
-    'ㅂ': [1,1,0,0,0,0], 'ㅅ': [0,0,1,0,0,0], 'ㅅ' : [0,0,1,1,0,0],
+    'ㅂ': [1,1,0,0,0,0], 'ㅅ': [0,0,1,0,0,0], 'ㅆ': [0,0,1,1,0,0],
     'ㅇ': [0,1,1,0,1,1], 'ㅈ': [1,0,1,0,0,0],
     'ㅊ': [0,1,1,0,0,0], 'ㅋ': [0,1,1,0,1,0],
     'ㅌ': [0,1,1,0,0,1], 'ㅍ': [0,1,0,0,1,1],
@@ -121,9 +127,7 @@ SYMBOL_TO_BRAILLE = {
     "[]" : [[0,0,0,0,1,0],[0,0,0,1,1,0],[1,1,1,0,1,1],[0,0,0,1,1,0],[0,1,1,1,1,1]],
     "//" : [[0,0,0,0,1,0],[0,0,0,1,1,0],[0,0,1,1,0,0],[0,0,0,1,1,0],[0,0,1,1,0,0]],
     "+" : [0,1,0,0,0,1],
-    "-" : [0,0,1,0,1,0],
     "*" : [1,0,0,0,0,1],
-    "/" : [[0,0,1,1,0,0],[0,0,1,1,0,0]],
     "=" : [[0,1,0,0,1,0],[0,1,0,0,1,0]],
     "<" : [[0,0,1,0,1,0],[0,0,1,0,1,0]],
     ">" : [[0,1,0,0,0,1],[0,1,0,0,0,1]],
@@ -155,62 +159,313 @@ SYMBOL_TO_BRAILLE = {
     '&': [[0,0,0,1,0,0],[1,1,1,1,0,1]],
 }
 
-# === INV 테이블 생성 (2차원 튜플 key) ===
+# --- 프리픽스 ---
+CAPITAL_PREFIX = [0,0,0,0,1,1]
+NUMBER_PREFIX = [0,1,1,1,1,1]
+# 기호 구분점자는 아직 정해지지 않음 (빈 리스트라 어떤 셀과도 일치하지 않음)
+SYMBOL_PREFIX = []
+
+CAPITAL_PREFIX_CODE = cell_to_code(CAPITAL_PREFIX)
+NUMBER_PREFIX_CODE = cell_to_code(NUMBER_PREFIX)
+# 구분점자가 정해지지 않은 경우 None (어떤 셀 코드와도 일치하지 않음)
+SYMBOL_PREFIX_CODE = cell_to_code(SYMBOL_PREFIX) if SYMBOL_PREFIX else None
+
+# === 문맥으로 구분하는 기호 (key: 셀 코드) ===
+# 같은 셀을 쓰는 기호 쌍. 복원할 때 braille_translator.resolve_ambiguous_symbol이 앞뒤 글자로 고르며,
+# 표 검증에서도 이 쌍 안에서 겹치는 것은 허용
+QUOTE_OR_QUESTION = cell_to_code((0, 1, 1, 0, 0, 1))       # 여는 큰따옴표 / 물음표
+CLOSE_QUOTE_OR_EXCLAIM = cell_to_code((1, 1, 1, 0, 0, 1))  # 닫는 큰따옴표 / 느낌표
+SINGLE_QUOTE_OR_COMMA = cell_to_code((0, 1, 0, 0, 0, 1))   # 여는 작은따옴표 / 쉼표
+CLOSE_SINGLE_OR_SEMI = cell_to_code((1, 1, 0, 0, 0, 1))    # 닫는 작은따옴표 / 세미콜론
+PERIOD_OR_COLON = cell_to_code((0, 0, 1, 0, 0, 1))         # 마침표 / 쌍점
+HYPHEN_OR_TILDE = cell_to_code((1, 0, 0, 0, 0, 1))         # 하이픈 / 물결
+SLASH_OR_BACKSLASH = cell_to_code((0, 1, 0, 1, 0, 1))      # 슬래시 / 백슬래시
+
+AMBIGUOUS_SYMBOLS = {
+    QUOTE_OR_QUESTION: ("“", "?"),
+    CLOSE_QUOTE_OR_EXCLAIM: ("”", "!"),
+    SINGLE_QUOTE_OR_COMMA: ("‘", ","),
+    CLOSE_SINGLE_OR_SEMI: ("’", ";"),
+    PERIOD_OR_COLON: (".", ":"),
+    HYPHEN_OR_TILDE: ("-", "~"),
+    SLASH_OR_BACKSLASH: ("/", "\\"),
+    # 필요시 계속 추가
+}
+
+# === 한글 자모 (유니코드 음절 배열 순서) ===
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSUNG = (
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+)
+JUNGSUNG = (
+    'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ',
+    'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ',
+)
+JONGSUNG = (
+    '', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+    'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+)
+HANGUL_JAMO = frozenset(CHOSUNG + JUNGSUNG + JONGSUNG[1:])
+
+# === 글자 분류 (CHAR_CLASSES 값) ===
+# 코드 포인트 하나를 한 번 찾아 변환 방법을 정함 (표 범위 밖 코드 포인트는 CLASS_UNKNOWN)
+CLASS_UNKNOWN = "x"   # 점자로 바꿀 수 없는 글자 -> 빈 셀
+CLASS_DIRECT = "c"    # 한글/기호/공백: 글자마다 셀이 정해짐
+CLASS_ABBREV = "b"    # 여러 글자 약자의 첫 글자가 될 수 있는 한글 (약자를 쓰지 않으면 CLASS_DIRECT와 같음)
+CLASS_DIGIT = "d"     # 숫자: 이어진 숫자 앞에 수표 한 번
+CLASS_ALPHA = "a"     # 영문자: 이어진 영문자 앞에 로마자표 한 번
+CLASS_SEPARATOR = "s" # 배치 변환에서 문자열 사이에 넣는 MARK_SEPARATOR (혼자 변환하면 CLASS_UNKNOWN처럼 빈 셀)
+
+# 셀 표(CHAR_CELLS)에만 있는 내부 표시 글자 (유니코드 비문자 U+FDD0~U+FDEF).
+# 원문 조각 사이에 끼워 넣으면 str.translate 한 번으로 구분점자/빈 셀/여러 글자 약자 셀이 됨.
+# 원문에 들어 있는 비문자는 CLASS_UNKNOWN(MARK_SEPARATOR는 CLASS_SEPARATOR)이라 MARK_BLANK로 바뀌므로
+# 표시 글자와 섞이지 않음 (배치 변환은 원문에 MARK_SEPARATOR가 없을 때만 이어 붙여 변환)
+MARK_NUMBER = "\uFDD0"
+MARK_CAPITAL = "\uFDD1"
+MARK_BLANK = "\uFDD2"
+MARK_SEPARATOR = "\uFDD3"    # 배치 변환의 문자열 경계 -> SEPARATOR_CODE
+MARK_ABBREV_FIRST = 0xFDD4   # 여러 글자 약자마다 하나씩 (ABBREV_MARKS)
+MARK_LAST = 0xFDEF
+# 배치 변환 결과에서 문자열 경계를 나타내는 값 (6점 셀 코드 0~63으로는 나올 수 없음)
+SEPARATOR_CODE = 64
+
+# 검증/컴파일 대상 원본 표
+SOURCE_TABLES = {
+    "INITIAL_TO_BRAILLE": INITIAL_TO_BRAILLE,
+    "MEDIAL_TO_BRAILLE": MEDIAL_TO_BRAILLE,
+    "FINAL_TO_BRAILLE": FINAL_TO_BRAILLE,
+    "NUMBER_TO_BRAILLE": NUMBER_TO_BRAILLE,
+    "ALPHABET_TO_BRAILLE": ALPHABET_TO_BRAILLE,
+    "SYMBOL_TO_BRAILLE": SYMBOL_TO_BRAILLE,
+    "HANGUL_BRAILLE_ABBREVIATION": HANGUL_BRAILLE_ABBREVIATION,
+}
+
+# === 파생 표 컴파일 ===
 def _invert_table(table):
+    # 셀 코드 -> key (v가 2차원이든 1차원이든 flatten 후 각 셀의 코드를 모두 등록)
     inv = {}
     for k, v in table.items():
-        # v가 2차원이든 1차원이든 flatten 후 각각 튜플화하여 모두 등록
         for cell in flatten_braille_cell(v):
-            inv[tuple(cell)] = k
+            inv[cell_to_code(cell)] = k
     return inv
 
-INV_INITIAL = _invert_table(INITIAL_TO_BRAILLE)
-INV_MEDIAL = _invert_table(MEDIAL_TO_BRAILLE)
-INV_FINAL = _invert_table(FINAL_TO_BRAILLE)
-INV_NUMBER = _invert_table(NUMBER_TO_BRAILLE)
-INV_ALPHA = _invert_table(ALPHABET_TO_BRAILLE)
-INV_SYMBOL = _invert_table(SYMBOL_TO_BRAILLE)
-INV_ABBREV = _invert_table(HANGUL_BRAILLE_ABBREVIATION)
+def _pack_table(table):
+    # key -> 셀 코드 bytes
+    return {k: pack_cells(flatten_braille_cell(v)) for k, v in table.items()}
 
-# --- 프리픽스 ---
-CAPITAL_PREFIX = [0,0,0,0,1,1]
-NUMBER_PREFIX = [0,1,1,1,1,1]
-# SYMBOL_PREFIX 위에서 선언
+def _build_hangul_table(initial_codes, medial_codes, final_codes):
+    """
+    한글 글자 -> 셀 코드 bytes 표 (완성형 11,172자 + 호환 자모)
+    - 음절은 유니코드 배열 순서(초성 > 중성 > 종성)대로 자모 셀 코드를 이어 붙여 한 번에 생성
+      (테이블에 없는 초성/중성은 생략, 종성이 없으면 '' (받침 없음 셀))
+    - 낱자모는 초성 > 중성 > 종성 순으로 자리를 정해 변환
+    """
+    initials = [initial_codes.get(cho, b'') for cho in CHOSUNG]
+    medials = [medial_codes.get(jung, b'') for jung in JUNGSUNG]
+    finals = [final_codes.get(jong, b'') for jong in JONGSUNG]
+    syllables = [ini + med + fin for ini in initials for med in medials for fin in finals]
+    table = dict(zip(map(chr, range(HANGUL_BASE, HANGUL_LAST + 1)), syllables))
+    none = final_codes.get('', b'')
+    for jamo in sorted(HANGUL_JAMO):
+        if jamo in CHOSUNG:
+            table[jamo] = initial_codes.get(jamo, b'') + none
+        elif jamo in JUNGSUNG:
+            table[jamo] = medial_codes.get(jamo, b'') + none
+        else:
+            table[jamo] = final_codes.get(jamo, b'')
+    return table
+
+def _with_abbreviations(table, abbreviations):
+    # 한 글자 약자가 있는 글자는 약자 셀로 덮어쓴 사본
+    table = dict(table)
+    for word, codes in abbreviations.items():
+        if word in table:
+            table[word] = codes
+    return table
+
+def _build_inv_syllables(inv_initial, inv_medial, inv_final):
+    """
+    (초성, 중성[, 종성]) 셀 코드 조합 -> 음절 역변환 표
+    - 3셀 key: 초성 << 12 | 중성 << 6 | 종성
+    - 2셀 key: 초성 << 6 | 중성 (받침 없는 음절)
+    """
+    inv3, inv2 = {}, {}
+    finals = [(fin, JONGSUNG.index(jong)) for fin, jong in inv_final.items()]
+    for ini, cho in inv_initial.items():
+        for med, jung in inv_medial.items():
+            base = HANGUL_BASE + (CHOSUNG.index(cho) * len(JUNGSUNG) + JUNGSUNG.index(jung)) * len(JONGSUNG)
+            inv2[ini << 6 | med] = chr(base)
+            key = ini << 12 | med << 6
+            inv3.update({key | fin: chr(base + offset) for fin, offset in finals})
+    return inv3, inv2
+
+def _build_char_cells(hangul, numbers, alphabet, symbols, digits):
+    """
+    코드 포인트 -> 셀 코드 문자열(latin-1) 표 (str.translate용).
+    변환할 수 있는 글자는 모두 담음: 공백은 빈 셀, 영문 대문자는 소문자 셀, 표에 없는 숫자(digits 중 ², ٣ 등)는
+    빈 셀 (수표는 숫자 구간 앞에 따로 붙임). 한글 > 숫자 > 영문 > 기호 순으로 우선
+    """
+    table = {code: "\0" for code in range(0x3001) if chr(code).isspace()}
+    table.update(dict.fromkeys(digits, "\0"))
+    for codes in (symbols, alphabet, numbers, hangul):
+        table.update({ord(k): v.decode("latin-1") for k, v in codes.items() if len(k) == 1})
+    table.update({ord(k.upper()): v.decode("latin-1") for k, v in alphabet.items()})
+    return table
+
+def _build_char_classes(cells, alphabet, trie, digits):
+    """코드 포인트 -> 분류(CLASS_*) 문자열 (str.translate용, 길이는 변환할 수 있는 가장 큰 코드 포인트 + 1)"""
+    classes = [CLASS_UNKNOWN] * (max(cells) + 1)
+    for code in cells:
+        classes[code] = CLASS_DIRECT
+    for word in trie:
+        classes[ord(word)] = CLASS_ABBREV
+    for code in digits:
+        classes[code] = CLASS_DIGIT
+    for ch in alphabet:
+        classes[ord(ch)] = classes[ord(ch.upper())] = CLASS_ALPHA
+    classes[ord(MARK_SEPARATOR)] = CLASS_SEPARATOR
+    return "".join(classes)
+
+def _build_marks(abbreviations, single):
+    """
+    여러 글자 약자 -> 표시 글자, 표시 글자 코드 포인트 -> 셀 코드 문자열 (셀 표에 더할 것)
+    한 글자 약자는 음절 표(single)에서 바로 찾으므로 제외
+    """
+    words = [word for word in abbreviations if word not in single]
+    if MARK_ABBREV_FIRST + len(words) > MARK_LAST + 1:
+        raise ValueError(f"여러 글자 약자가 너무 많습니다: {len(words)}개")
+    marks = {word: chr(MARK_ABBREV_FIRST + i) for i, word in enumerate(words)}
+    mark_cells = {ord(mark): abbreviations[word].decode("latin-1") for word, mark in marks.items()}
+    mark_cells[ord(MARK_NUMBER)] = chr(NUMBER_PREFIX_CODE)
+    mark_cells[ord(MARK_CAPITAL)] = chr(CAPITAL_PREFIX_CODE)
+    mark_cells[ord(MARK_BLANK)] = "\0"
+    mark_cells[ord(MARK_SEPARATOR)] = chr(SEPARATOR_CODE)
+    return marks, mark_cells
+
+def _build_trie(table, single):
+    """
+    여러 글자 약자를 글자 단위 트라이(dict 중첩)로 변환 (최장 일치 검색용).
+    - 자식 노드는 글자 key, 약자가 끝나는 노드는 None key에 셀 코드 bytes 저장
+    - 한 글자 약자는 음절 표(single)에서 바로 찾으므로 제외
+    """
+    root = {}
+    for word, codes in table.items():
+        if word in single:
+            continue
+        node = root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[None] = codes
+    return root
+
+def compile_tables() -> Dict[str, object]:
+    """
+    원본 표를 검증하고 변환/복원에 쓰는 파생 표를 모두 만듦 (이름 -> 값).
+    중복 key나 구분할 수 없는 셀이 있으면 TableConflictError
+    """
+    check_tables(SOURCE_TABLES, __file__, AMBIGUOUS_SYMBOLS.values())
+    tables = {}
+    for name, inv_name, codes_name in (
+        ("INITIAL_TO_BRAILLE", "INV_INITIAL", "INITIAL_CODES"),
+        ("MEDIAL_TO_BRAILLE", "INV_MEDIAL", "MEDIAL_CODES"),
+        ("FINAL_TO_BRAILLE", "INV_FINAL", "FINAL_CODES"),
+        ("NUMBER_TO_BRAILLE", "INV_NUMBER", "NUMBER_CODES"),
+        ("ALPHABET_TO_BRAILLE", "INV_ALPHA", "ALPHA_CODES"),
+        ("SYMBOL_TO_BRAILLE", "INV_SYMBOL", "SYMBOL_CODES"),
+        ("HANGUL_BRAILLE_ABBREVIATION", "INV_ABBREV", "ABBREV_CODES"),
+    ):
+        tables[inv_name] = _invert_table(SOURCE_TABLES[name])
+        tables[codes_name] = _pack_table(SOURCE_TABLES[name])
+    hangul = _build_hangul_table(tables["INITIAL_CODES"], tables["MEDIAL_CODES"], tables["FINAL_CODES"])
+    tables["HANGUL_CODES"] = hangul
+    tables["HANGUL_CODES_ABBREV"] = _with_abbreviations(hangul, tables["ABBREV_CODES"])
+    tables["INV_SYLLABLE"], tables["INV_SYLLABLE_OPEN"] = _build_inv_syllables(
+        tables["INV_INITIAL"], tables["INV_MEDIAL"], tables["INV_FINAL"]
+    )
+    tables["ABBREV_TRIE"] = _build_trie(tables["ABBREV_CODES"], tables["HANGUL_CODES_ABBREV"])
+    tables["ABBREV_MAX_LEN"] = max(len(word) for word in HANGUL_BRAILLE_ABBREVIATION)
+    # 숫자는 str.isdigit() 기준 (변환기가 예전부터 써 온 규칙). 범위는 실행 중인 유니코드 데이터 전체에서 찾음
+    digits = [code for code in range(sys.maxunicode + 1) if chr(code).isdigit()]
+    cells = _build_char_cells(hangul, tables["NUMBER_CODES"], tables["ALPHA_CODES"], tables["SYMBOL_CODES"], digits)
+    tables["CHAR_CLASSES"] = _build_char_classes(cells, tables["ALPHA_CODES"], tables["ABBREV_TRIE"], digits)
+    # 표시 글자는 분류 표를 만든 뒤에 더함 (원문의 표시 글자는 CLASS_UNKNOWN)
+    tables["ABBREV_MARKS"], mark_cells = _build_marks(tables["ABBREV_CODES"], tables["HANGUL_CODES_ABBREV"])
+    cells.update(mark_cells)
+    tables["CHAR_CELLS"] = cells
+    # 약자 적용 셀 표는 한 글자 약자만 다르므로 다른 부분만 저장하고 읽을 때 합침
+    tables["CHAR_CELLS_ABBREV_DIFF"] = {
+        ord(ch): codes.decode("latin-1") for ch, codes in tables["HANGUL_CODES_ABBREV"].items() if hangul[ch] != codes
+    }
+    return tables
+
+# === 표 아티팩트 ===
+# 표 정의(이 파일)와 파생 규칙(braille_compile, braille_utils)의 스탬프, 유니코드 데이터 버전(숫자 분류가 str.isdigit()을
+# 따름)이 같은 아티팩트가 있으면 한 번 읽어서 쓰고,
+# 없거나 오래됐으면 검증/컴파일 후 저장 (pyc처럼 저장 실패는 무시, -B나 PYTHONDONTWRITEBYTECODE면 저장하지 않음).
+# 미리 만들어 두려면: python src/braille_compile.py
+TABLE_ARTIFACT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), DEFAULT_ARTIFACT_NAME)
+TABLE_SOURCE_STAMP = source_stamp(
+    (__file__, braille_compile.__file__, braille_utils.__file__), (unicodedata.unidata_version,)
+)
+
+def load_tables(path: str = TABLE_ARTIFACT_PATH) -> Dict[str, object]:
+    tables = read_artifact(path, TABLE_SOURCE_STAMP)
+    if tables is None:
+        tables = compile_tables()
+        if not sys.dont_write_bytecode:
+            try:
+                write_artifact(path, tables, TABLE_SOURCE_STAMP)
+            except OSError:
+                pass
+    return tables
+
+_tables = load_tables()
+
+INV_INITIAL = _tables["INV_INITIAL"]
+INV_MEDIAL = _tables["INV_MEDIAL"]
+INV_FINAL = _tables["INV_FINAL"]
+INV_NUMBER = _tables["INV_NUMBER"]
+INV_ALPHA = _tables["INV_ALPHA"]
+INV_SYMBOL = _tables["INV_SYMBOL"]
+INV_ABBREV = _tables["INV_ABBREV"]
+
+# 셀 코드 테이블 (값: 셀 코드 bytes)
+INITIAL_CODES = _tables["INITIAL_CODES"]
+MEDIAL_CODES = _tables["MEDIAL_CODES"]
+FINAL_CODES = _tables["FINAL_CODES"]
+NUMBER_CODES = _tables["NUMBER_CODES"]
+ALPHA_CODES = _tables["ALPHA_CODES"]
+SYMBOL_CODES = _tables["SYMBOL_CODES"]
+ABBREV_CODES = _tables["ABBREV_CODES"]
+
+# 한글 글자 -> 셀 코드 (약자 미적용 / 한 글자 약자 적용)
+HANGUL_CODES = _tables["HANGUL_CODES"]
+HANGUL_CODES_ABBREV = _tables["HANGUL_CODES_ABBREV"]
+
+# 음절 역변환 표 (3셀 / 받침 없는 2셀)
+INV_SYLLABLE = _tables["INV_SYLLABLE"]
+INV_SYLLABLE_OPEN = _tables["INV_SYLLABLE_OPEN"]
+
+# 약자 트라이
+ABBREV_TRIE = _tables["ABBREV_TRIE"]
+ABBREV_MAX_LEN = _tables["ABBREV_MAX_LEN"]
+
+# 글자 분류 표 (코드 포인트 -> CLASS_*)와 코드 포인트 -> 셀 코드 문자열 표 (약자 미적용 / 한 글자 약자 적용)
+CHAR_CLASSES = _tables["CHAR_CLASSES"]
+CHAR_CELLS = _tables["CHAR_CELLS"]
+CHAR_CELLS_ABBREV = {**CHAR_CELLS, **_tables["CHAR_CELLS_ABBREV_DIFF"]}
+# 여러 글자 약자 -> 셀 표의 표시 글자
+ABBREV_MARKS = _tables["ABBREV_MARKS"]
 
 def encode_braille(text: str) -> List[List[int]]:
-    """주어진 텍스트를 구분점자 규칙에 따라 점자로 변환"""
-    result = []
-    i = 0
-    while i < len(text):
-        ch = text[i]
-        # 숫자
-        if ch.isdigit():
-            # 숫자 구간 시작 시 프리픽스 추가
-            if not (result and result[-1] == NUMBER_PREFIX):
-                result.append(NUMBER_PREFIX.copy())
-            result.extend(flatten_braille_cell(NUMBER_TO_BRAILLE[ch]))
-        # 영어 소문자
-        elif 'a' <= ch <= 'z':
-            if not (result and result[-1] == CAPITAL_PREFIX):
-                result.append(CAPITAL_PREFIX.copy())
-            result.extend(flatten_braille_cell(ALPHABET_TO_BRAILLE[ch]))
-        # 기호
-        elif ch in SYMBOL_TO_BRAILLE:
-            result.extend(flatten_braille_cell(SYMBOL_TO_BRAILLE[ch]))
-        # 한글 자모/약자
-        elif ch in INITIAL_TO_BRAILLE:
-            result.extend(flatten_braille_cell(INITIAL_TO_BRAILLE[ch]))
-        elif ch in MEDIAL_TO_BRAILLE:
-            result.extend(flatten_braille_cell(MEDIAL_TO_BRAILLE[ch]))
-        elif ch in FINAL_TO_BRAILLE:
-            result.extend(flatten_braille_cell(FINAL_TO_BRAILLE[ch]))
-        elif ch in HANGUL_BRAILLE_ABBREVIATION:
-            result.extend(flatten_braille_cell(HANGUL_BRAILLE_ABBREVIATION[ch]))
-        else:
-            # 기타 미지원 문자
-            pass
-        i += 1
-    return result
+    """
+    주어진 텍스트를 구분점자 규칙에 따라 점자(6점 리스트)로 변환.
+    text_to_braille(약자 적용)와 같은 변환기를 씀 (대문자, 숫자 뒤 영문, 변환할 수 없는 글자도 같은 규칙)
+    """
+    from braille_translator import text_to_braille  # braille_translator가 이 모듈을 불러오므로 쓸 때 불러옴
+    return unpack_cells(text_to_braille(text))
 
 if __name__ == "__main__":
     all_tables = {
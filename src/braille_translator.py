@@ -1,25 +1,35 @@
-import hgtk
-from typing import List, Union
+import codecs
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from time import perf_counter
+from typing import BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
 from braille_table import (
-    ALPHABET_TO_BRAILLE, HANGUL_BRAILLE_ABBREVIATION, INITIAL_TO_BRAILLE,
-    MEDIAL_TO_BRAILLE, FINAL_TO_BRAILLE, SYMBOL_TO_BRAILLE, NUMBER_TO_BRAILLE,
-    CAPITAL_PREFIX, NUMBER_PREFIX, SYMBOL_PREFIX,
-    INV_ABBREV, INV_NUMBER, INV_SYMBOL, INV_ALPHA,
-    INV_INITIAL, INV_MEDIAL, INV_FINAL,
+    CAPITAL_PREFIX_CODE, NUMBER_PREFIX_CODE, SYMBOL_PREFIX_CODE,
+    INV_NUMBER, INV_SYMBOL, INV_ALPHA, INV_SYLLABLE, INV_SYLLABLE_OPEN,
+    HANGUL_JAMO, ABBREV_TRIE, ABBREV_MAX_LEN, CHAR_CLASSES, CHAR_CELLS, CHAR_CELLS_ABBREV,
+    CLASS_DIRECT, CLASS_ABBREV, CLASS_DIGIT, CLASS_ALPHA, CLASS_SEPARATOR,
+    MARK_NUMBER, MARK_CAPITAL, MARK_BLANK, MARK_SEPARATOR, ABBREV_MARKS, SEPARATOR_CODE,
+    # 문맥으로 구분하는 기호 (key: 셀 코드)
+    AMBIGUOUS_SYMBOLS, QUOTE_OR_QUESTION, CLOSE_QUOTE_OR_EXCLAIM, SINGLE_QUOTE_OR_COMMA,
+    CLOSE_SINGLE_OR_SEMI, PERIOD_OR_COLON, HYPHEN_OR_TILDE, SLASH_OR_BACKSLASH,
 )
-from braille_utils import flatten_braille_cell, tupleize
-
-# ambiguous symbol 목록 확장
-AMBIGUOUS_SYMBOLS = {
-    (0, 1, 1, 0, 0, 1): ("“", "?"),           # 여는 큰따옴표 / 물음표
-    (1, 1, 1, 0, 0, 1): ("”", "!"),           # 닫는 큰따옴표 / 느낌표
-    (0, 1, 0, 0, 0, 1): ("‘", ","),           # 여는 작은따옴표 / 쉼표
-    (1, 1, 0, 0, 0, 1): ("’", ";"),           # 닫는 작은따옴표 / 세미콜론
-    (0, 0, 1, 0, 0, 1): (".", ":"),           # 마침표 / 쌍점
-    (1, 0, 0, 0, 0, 1): ("-", "~"),           # 하이픈 / 물결
-    (0, 1, 0, 1, 0, 1): ("/", "\\"),          # 슬래시 / 백슬래시
-    # 필요시 계속 추가
-}
+import braille_metrics
+from braille_cache import LRUCache
+from braille_metrics import Metrics
+from braille_utils import (
+    BrailleCells, code_to_cell, codes_to_unicode, pack_cells, unicode_to_codes,
+)
+
+# 빈 셀 (변환할 수 없는 문자)
+BLANK = bytes(1)
+
+# 모드: 0=일반, 1=숫자, 2=영문, 3=기호 (구분점자 뒤에서 해당 테이블을 우선 적용)
+MODE_NONE, MODE_NUMBER, MODE_ALPHA, MODE_SYMBOL = 0, 1, 2, 3
+
+# 스트리밍 변환에서 파일 객체를 읽는 단위 (글자 수 또는 바이트 수)
+DEFAULT_CHUNK_SIZE = 1 << 16
 
 OPENING_CONTEXT_CHARS = {
     '', ' ', '\n', '\t', '\r',
@@ -34,237 +44,651 @@ CLOSING_CONTEXT_CHARS = {
 }
 
 def is_korean_letter(c: str) -> bool:
-    return '\uAC00' <= c <= '\uD7A3' or (len(c) == 1 and hgtk.checker.is_hangul(c))
+    return '\uAC00' <= c <= '\uD7A3' or c in HANGUL_JAMO
 
 def is_letter_or_digit(c: str) -> bool:
     return c.isalpha() or c.isdigit() or is_korean_letter(c)
 
 def resolve_ambiguous_symbol(symbolkey, prev_char, next_cell, next_is_end):
+    # symbolkey, next_cell은 셀 코드 (next_cell은 마지막 셀이면 None)
     # 각 ambiguous symbol에 맞는 문맥 해석 규칙 적용
     # 큰따옴표/작은따옴표류
-    if symbolkey == (0, 1, 1, 0, 0, 1):  # “ or ?
+    if symbolkey == QUOTE_OR_QUESTION:  # “ or ?
         if prev_char in OPENING_CONTEXT_CHARS:
             return "“"
         else:
             return "?"
-    if symbolkey == (1, 1, 1, 0, 0, 1):  # ” or !
+    if symbolkey == CLOSE_QUOTE_OR_EXCLAIM:  # ” or !
         # 닫는따옴표는 보통 직전이 글자/숫자/닫는괄호/마침표 등. 느낌표는 문장 끝/강조
         if prev_char and (is_letter_or_digit(prev_char) or prev_char in CLOSING_CONTEXT_CHARS):
             return "”"
         else:
             return "!"
-    if symbolkey == (0, 1, 0, 0, 0, 1):  # ‘ or ,
+    if symbolkey == SINGLE_QUOTE_OR_COMMA:  # ‘ or ,
         # 여는작은따옴표는 앞이 공백/기호류, 쉼표는 단어 뒤/숫자 뒤 등
         if prev_char in OPENING_CONTEXT_CHARS:
             return "‘"
         else:
             return ","
-    if symbolkey == (1, 1, 0, 0, 0, 1):  # ’ or ;
+    if symbolkey == CLOSE_SINGLE_OR_SEMI:  # ’ or ;
         if prev_char and (is_letter_or_digit(prev_char) or prev_char in CLOSING_CONTEXT_CHARS):
             return "’"
         else:
             return ";"
-    if symbolkey == (0, 0, 1, 0, 0, 1):  # . or :
+    if symbolkey == PERIOD_OR_COLON:  # . or :
         # 마침표: 문장 끝/숫자 뒤, 쌍점: 시각·비율 등에서 앞뒤 숫자
         if next_cell is not None:
-            key = tupleize(next_cell)
             # 쌍점 앞뒤가 숫자면 쌍점, 아니면 마침표
-            if key in INV_NUMBER and prev_char.isdigit():
+            if next_cell in INV_NUMBER and prev_char.isdigit():
                 return ":"
         # 기본값은 마침표
         return "."
-    if symbolkey == (1, 0, 0, 0, 0, 1):  # - or ~
+    if symbolkey == HYPHEN_OR_TILDE:  # - or ~
         # 하이픈은 단어/숫자 사이, 물결은 반복/범위/강조
         if prev_char and prev_char.isdigit() and next_cell is not None:
-            key = tupleize(next_cell)
-            if key in INV_NUMBER:
+            if next_cell in INV_NUMBER:
                 return "-"
         return "~"
-    if symbolkey == (0, 1, 0, 1, 0, 1):  # / or \
+    if symbolkey == SLASH_OR_BACKSLASH:  # / or \
         # 수식·경로 등에서 앞뒤 맥락으로 구분
         # (여기서는 기본적으로 / 반환, 필요시 확장)
         return "/"
     return None
 
-def text_to_braille(text: str, use_abbreviation: bool = True) -> List[List[int]]:
-    braille_output: List[List[int]] = []
-    i = 0
-    mode = None
-    while i < len(text):
-        matched = False
-        if use_abbreviation:
-            for abbr in sorted(HANGUL_BRAILLE_ABBREVIATION.keys(), key=len, reverse=True):
-                if text.startswith(abbr, i):
-                    braille_output.extend(flatten_braille_cell(HANGUL_BRAILLE_ABBREVIATION[abbr]))
-                    i += len(abbr)
-                    matched = True
-                    mode = None
-                    break
-            if matched:
-                continue
-        char = text[i]
-        if char.isdigit():
-            if mode != "number":
-                braille_output.append(NUMBER_PREFIX)
-                mode = "number"
-            braille_output.extend(flatten_braille_cell(NUMBER_TO_BRAILLE.get(char, [0,0,0,0,0,0])))
-            i += 1
-            continue
-        elif char.isalpha() and char.isascii():
-            if mode != "alpha":
-                braille_output.append(CAPITAL_PREFIX)
-                mode = "alpha"
-            braille_output.extend(flatten_braille_cell(ALPHABET_TO_BRAILLE.get(char.lower(), [0,0,0,0,0,0])))
-            i += 1
-            continue
-        elif char in SYMBOL_TO_BRAILLE:
-            braille_output.extend(flatten_braille_cell(SYMBOL_TO_BRAILLE[char]))
-            mode = None
-            i += 1
-            continue
-        elif hgtk.checker.is_hangul(char):
-            try:
-                cho, jung, jong = hgtk.letter.decompose(char)
-                if cho in INITIAL_TO_BRAILLE:
-                    braille_output.extend(flatten_braille_cell(INITIAL_TO_BRAILLE[cho]))
-                if jung in MEDIAL_TO_BRAILLE:
-                    braille_output.extend(flatten_braille_cell(MEDIAL_TO_BRAILLE[jung]))
-                if jong and jong in FINAL_TO_BRAILLE:
-                    braille_output.extend(flatten_braille_cell(FINAL_TO_BRAILLE[jong]))
-                elif not jong:
-                    braille_output.extend(flatten_braille_cell(FINAL_TO_BRAILLE['']))
-                mode = None
-            except Exception as e:
-                print(f"[점자 변환 에러 - 한글 조합 실패]: {e}")
-                braille_output.append([0,0,0,0,0,0])
-            i += 1
+def match_abbreviation(text: str, i: int) -> Tuple[Optional[bytes], int]:
+    """
+    text[i:]에서 시작하는 가장 긴 여러 글자 약자를 트라이로 한 번에 찾음.
+    (셀 코드 bytes, 약자 다음 위치) 반환, 일치하는 약자가 없으면 (None, i)
+    """
+    node = ABBREV_TRIE
+    best, best_end = None, i
+    n = len(text)
+    j = i
+    while j < n:
+        node = node.get(text[j])
+        if node is None:
+            break
+        j += 1
+        if None in node:
+            best, best_end = node[None], j
+    return best, best_end
+
+def _special_runs(use_abbreviation: bool, separated: bool):
+    """
+    분류 문자열에서 따로 처리할 구간: 숫자/영문이 이어진 구간(구분점자 한 번), 변환할 수 없는 글자 구간,
+    (약자 적용 시) 약자 첫 글자 후보. 나머지 한글/기호/공백(배치면 문자열 경계 포함)은 셀 표로 한 번에 바꿈.
+    앞의 (?=...)는 바로 변환하는 글자를 정규식 엔진이 빠르게 건너뛰게 함
+    """
+    direct = CLASS_DIRECT + ("" if use_abbreviation else CLASS_ABBREV) + (CLASS_SEPARATOR if separated else "")
+    known = CLASS_DIRECT + CLASS_ABBREV + CLASS_DIGIT + CLASS_ALPHA + (CLASS_SEPARATOR if separated else "")
+    abbreviation = f"{CLASS_ABBREV}|" if use_abbreviation else ""
+    return re.compile(f"(?=[^{direct}])(?:{abbreviation}{CLASS_DIGIT}+|{CLASS_ALPHA}+|[^{known}]+)")
+
+# (약자 적용 여부, 배치 여부) -> 따로 처리할 구간 정규식
+_SPECIAL_RUNS = {
+    (use_abbreviation, separated): _special_runs(use_abbreviation, separated)
+    for use_abbreviation in (False, True) for separated in (False, True)
+}
+# 여러 글자 약자 (긴 약자부터 시도하므로 match_abbreviation과 같은 최장 일치)
+_ABBREVIATIONS = re.compile("|".join(sorted(ABBREV_MARKS, key=len, reverse=True)))
+
+def _encode(
+    text: str, out: bytearray, mode: int, use_abbreviation: bool, final: bool,
+    metrics: Optional[Metrics] = None, separated: bool = False
+) -> Tuple[int, int]:
+    """
+    text를 셀 코드로 바꿔 out에 이어 붙임. (처리한 글자 수, 마지막 모드) 반환.
+    글자마다 분류 표(CHAR_CLASSES)를 한 번 찾아 만든 분류 문자열에서 따로 처리할 구간만 골라내
+    그 자리에 표시 글자(구분점자/빈 셀/약자)를 끼워 넣고, 원문 조각과 함께 셀 표(CHAR_CELLS)로 한 번에 변환.
+    final이 아니면 약자가 청크 경계에 걸칠 수 있는 끝부분(ABBREV_MAX_LEN - 1글자)은 남겨 둠.
+    separated면 text는 MARK_SEPARATOR로 이은 여러 문자열이고, 경계마다 SEPARATOR_CODE를 넣음
+    (경계 뒤는 일반 모드라 각 문자열을 따로 변환한 것과 같음).
+    약자/구분점자/변환 못 한 글자는 드문 분기에서만 세고 끝날 때 metrics에 한 번에 더함
+    """
+    cells = CHAR_CELLS_ABBREV if use_abbreviation else CHAR_CELLS
+    runs = _SPECIAL_RUNS[use_abbreviation, separated]
+    direct = CLASS_DIRECT if use_abbreviation else CLASS_DIRECT + CLASS_ABBREV
+    n = len(text)
+    stop = n if final or not use_abbreviation else max(n - ABBREV_MAX_LEN + 1, 0)
+    classes = text[:stop].translate(CHAR_CLASSES)
+    if not classes.strip(direct):
+        # 모두 바로 변환하는 글자 (짧은 문자열에서 흔함)
+        if stop:
+            out += text[:stop].translate(cells).encode("latin-1")
+            mode = MODE_NONE
+        return stop, mode
+    abbreviations = switches = 0
+    unknown = []
+    parts = []
+    pos = 0
+    for run in runs.finditer(classes):
+        start, end = run.span()
+        if start < pos:
+            # 앞에서 찾은 약자 안의 글자
             continue
+        kind = classes[start]
+        if kind == CLASS_ABBREV:
+            match = _ABBREVIATIONS.match(text, start)
+            if match is None:
+                continue
+            end = match.end()
+            parts.append(text[pos:start])
+            parts.append(ABBREV_MARKS[match.group()])
+            abbreviations += 1
+            pos = end
+        elif kind == CLASS_DIGIT or kind == CLASS_ALPHA:
+            # 이어진 숫자/영문 앞에 구분점자 한 번 (청크 맨 앞이면 이어받은 모드가 같을 때 생략)
+            if start or mode != (MODE_NUMBER if kind == CLASS_DIGIT else MODE_ALPHA):
+                parts.append(text[pos:start])
+                parts.append(MARK_NUMBER if kind == CLASS_DIGIT else MARK_CAPITAL)
+                switches += 1
+                pos = start
         else:
-            braille_output.append([0,0,0,0,0,0])
-            mode = None
-            i += 1
-            continue
+            parts.append(text[pos:start])
+            parts.append(MARK_BLANK * (end - start))
+            unknown.append(text[start:end])
+            pos = end
+    parts.append(text[pos:stop])
+    out += "".join(parts).translate(cells).encode("latin-1")
+    consumed = max(pos, stop)
+    # 약자가 stop을 넘었으면 마지막 글자는 약자 (일반 모드)
+    last = classes[consumed - 1] if consumed <= stop else CLASS_DIRECT
+    mode = MODE_NUMBER if last == CLASS_DIGIT else MODE_ALPHA if last == CLASS_ALPHA else MODE_NONE
+    if metrics is not None and (abbreviations or switches or unknown):
+        metrics.add(abbreviations=abbreviations, mode_switches=switches, unknown_chars=sum(map(len, unknown)))
+    if unknown:
+        unknown = "".join(unknown)
+        braille_metrics.report(
+            "unknown_chars",
+            f"점자로 바꿀 수 없는 글자 {len(unknown)}개를 빈 셀로 변환: {''.join(dict.fromkeys(unknown))[:20]!r}"
+        )
+    return consumed, mode
+
+# 단어 단위 캐시: 단어(공백 아닌 글자들) + 뒤따르는 공백을 한 조각으로 변환.
+# 약자에 공백이 없고 변환에 앞을 미리 보는 일이 없으며 공백은 모드를 일반으로 되돌리므로,
+# 모든 조각은 일반 모드에서 시작하고 결과는 조각에만 달려 있음
+_TEXT_TOKEN = re.compile(r"\S+\s*|\s+")
+
+def split_words(text: str) -> List[str]:
+    """
+    텍스트를 단어 조각(단어 + 뒤따르는 공백, 맨 앞 공백은 따로)으로 나눔.
+    조각마다 따로 변환해 이어 붙여도 text_to_braille(text)와 같음
+    """
+    return _TEXT_TOKEN.findall(text)
+
+def _encode_cached(text: str, use_abbreviation: bool, cache: LRUCache, metrics: Optional[Metrics]) -> bytes:
+    tokens = split_words(text)
+    # 호출 안에서 같은 단어는 한 번만 조회/변환하고, 공유 캐시는 잠금 한 번으로 묶어서 씀
+    unique = dict.fromkeys(tokens)
+    found = cache.get_many((token, use_abbreviation, MODE_NONE) for token in unique)
+    new = {}
+    for token in unique:
+        key = (token, use_abbreviation, MODE_NONE)
+        codes = found.get(key)
+        if codes is None:
+            out = bytearray()
+            _encode(token, out, MODE_NONE, use_abbreviation, True, metrics)
+            codes = new[key] = bytes(out)
+        unique[token] = codes
+    if new:
+        cache.put_many(new)
+    cache.add_hits(len(tokens) - len(unique))
+    return b"".join(map(unique.__getitem__, tokens))
+
+def text_to_braille(text: str, use_abbreviation: bool = True, cache: Optional[LRUCache] = None) -> bytes:
+    """
+    텍스트를 점자 셀 코드 bytes로 변환 (6점 리스트가 필요하면 unpack_cells 사용)
+    cache를 주면 공백으로 나뉜 단어 단위로 (단어, 약자 사용 여부, 시작 모드) -> 결과를 재사용
+    (집계를 켜 두면 캐시에서 찾은 단어는 카운터에 다시 세지 않음)
+    """
+    metrics = braille_metrics.active
+    if metrics is not None:
+        start = perf_counter()
+    if cache is not None:
+        braille_output = _encode_cached(text, use_abbreviation, cache, metrics)
+    else:
+        braille_output = bytearray()
+        _encode(text, braille_output, MODE_NONE, use_abbreviation, True, metrics)
+        braille_output = bytes(braille_output)
+    if metrics is not None:
+        metrics.record("translate", perf_counter() - start)
     return braille_output
 
-def braille_to_text(braille: List[List[int]]) -> str:
-    text_output = ""
+class OffsetMap(NamedTuple):
+    """
+    원문 글자 위치 <-> 셀 위치 대응. 변환 단위(글자 하나 또는 여러 글자 약자 하나)의 경계를
+    원문/셀 양쪽에 같은 순서로 담음 (둘 다 0에서 시작해 전체 길이로 끝남)
+    """
+    cells: bytes
+    source_bounds: List[int]
+    cell_bounds: List[int]
+
+    def cell_start(self, pos: int) -> int:
+        """원문 pos 글자가 속한 단위의 첫 셀 위치 (pos가 끝이면 전체 셀 수)"""
+        return self.cell_bounds[bisect_right(self.source_bounds, pos) - 1]
+
+    def cell_end(self, pos: int) -> int:
+        """원문 pos 위치에서 끝나거나 pos를 넘어 끝나는 첫 단위의 셀 끝 위치"""
+        return self.cell_bounds[bisect_left(self.source_bounds, pos)]
+
+    def source_start(self, cell: int) -> int:
+        """cell 번째 셀을 만든 단위의 첫 글자 위치"""
+        return self.source_bounds[bisect_right(self.cell_bounds, cell) - 1]
+
+    def source_end(self, cell: int) -> int:
+        """cell 위치에서 끝나거나 cell을 넘어 끝나는 첫 단위의 원문 끝 위치"""
+        return self.source_bounds[bisect_left(self.cell_bounds, cell)]
+
+    def cell_range(self, start: int, end: int) -> Tuple[int, int]:
+        """원문 [start, end) 글자를 나타내는 셀 구간 (약자에 걸치면 약자 전체로 넓힘, 빈 구간이면 빈 구간)"""
+        first = self.cell_start(start)
+        return first, first if start == end else max(first, self.cell_end(end))
+
+    def source_range(self, cell_start: int, cell_end: int) -> Tuple[int, int]:
+        """셀 [cell_start, cell_end)를 만든 원문 구간"""
+        first = self.source_start(cell_start)
+        return first, first if cell_start == cell_end else max(first, self.source_end(cell_end))
+
+def text_to_braille_offsets(text: str, use_abbreviation: bool = True) -> OffsetMap:
+    """
+    text_to_braille와 같은 셀과 함께 글자 <-> 셀 대응을 만듦.
+    변환 단위마다 _encode를 따로 부르므로 느림 (단어 하나, 커서 위치처럼 짧은 구간에 씀)
+    """
+    out = bytearray()
+    source_bounds = [0]
+    cell_bounds = [0]
+    mode = MODE_NONE
     i = 0
-    n = len(braille)
-    mode = None
+    n = len(text)
     while i < n:
-        cell = braille[i]
-        if cell == NUMBER_PREFIX:
-            mode = "number"
-            i += 1
-            continue
-        elif cell == CAPITAL_PREFIX:
-            mode = "alpha"
-            i += 1
-            continue
-        elif cell == SYMBOL_PREFIX:
-            mode = "symbol"
+        end = i + 1
+        if use_abbreviation and text[i] in ABBREV_TRIE:
+            codes, abbrev_end = match_abbreviation(text, i)
+            if codes is not None:
+                end = abbrev_end
+        # 단위 하나만 넘겨도 같은 약자/같은 모드 전환이 일어나므로 이어 붙이면 한 번에 변환한 결과와 같음
+        _, mode = _encode(text[i:end], out, mode, use_abbreviation, True)
+        i = end
+        source_bounds.append(i)
+        cell_bounds.append(len(out))
+    return OffsetMap(bytes(out), source_bounds, cell_bounds)
+
+# === 복호화 오토마톤 (import 시 INV_* 테이블을 셀 코드 64개 기준 표로 컴파일) ===
+
+def _compile_decoder():
+    """
+    - prefix_mode[code]: 구분점자면 전환할 모드, 아니면 0
+    - mode_emit[mode][code]: 해당 모드에서 바로 출력할 글자 (없으면 None -> 일반 모드로 복귀)
+    - neutral_emit[code]: 일반 모드 한 셀 출력 (영문 > 기호 > 숫자 > 알 수 없는 점자 순)
+    - neutral_kind[code]: 일반 모드 한 셀의 종류 (KIND_*)
+    - starts_syllable[code]: 초성 셀 여부 (음절 역변환 표 조회 필요 여부)
+    """
+    prefix_mode = [MODE_NONE] * 64
+    for code, mode in (
+        (NUMBER_PREFIX_CODE, MODE_NUMBER),
+        (CAPITAL_PREFIX_CODE, MODE_ALPHA),
+        (SYMBOL_PREFIX_CODE, MODE_SYMBOL),
+    ):
+        if code is not None and not prefix_mode[code]:
+            prefix_mode[code] = mode
+    mode_emit = (
+        (None,) * 64,
+        tuple(INV_NUMBER.get(code) for code in range(64)),
+        tuple(INV_ALPHA.get(code) for code in range(64)),
+        tuple(INV_SYMBOL.get(code) for code in range(64)),
+    )
+    neutral_emit = []
+    neutral_kind = []
+    for code in range(64):
+        for inv in (INV_ALPHA, INV_SYMBOL, INV_NUMBER):
+            if code in inv:
+                neutral_emit.append(inv[code])
+                neutral_kind.append(KIND_PLAIN)
+                break
+        else:
+            neutral_emit.append("[알 수 없는 점자: {}]".format(''.join(str(dot) for dot in code_to_cell(code))))
+            neutral_kind.append(KIND_UNKNOWN)
+        if code in AMBIGUOUS_SYMBOLS:
+            neutral_kind[code] = KIND_AMBIGUOUS
+    initials = {key >> 6 for key in INV_SYLLABLE_OPEN} | {key >> 12 for key in INV_SYLLABLE}
+    starts_syllable = tuple(code in initials for code in range(64))
+    return tuple(prefix_mode), mode_emit, tuple(neutral_emit), starts_syllable, tuple(neutral_kind)
+
+# 일반 모드 한 셀의 종류: 그대로 출력 / 문맥으로 고르는 기호 / 알 수 없는 점자
+KIND_PLAIN, KIND_AMBIGUOUS, KIND_UNKNOWN = 0, 1, 2
+
+PREFIX_MODE, MODE_EMIT, NEUTRAL_EMIT, STARTS_SYLLABLE, NEUTRAL_KIND = _compile_decoder()
+
+def _decode(
+    codes: bytes, out: List[str], mode: int, prev_char: str, final: bool,
+    metrics: Optional[Metrics] = None
+) -> Tuple[int, int, str]:
+    """
+    셀 코드를 글자로 바꿔 out에 추가. (처리한 셀 수, 마지막 모드, 마지막 글자) 반환.
+    셀 하나당 표 조회 몇 번으로 끝나는 한 방향(왼쪽→오른쪽) 처리이며,
+    final이 아니면 미리보기(최대 2셀)가 모자란 끝부분은 남겨 둠.
+    음절/구분점자/모호한 기호/알 수 없는 셀은 지역 변수로 세고 끝날 때 metrics에 한 번에 더함
+    """
+    append = out.append
+    i = 0
+    n = len(codes)
+    stop = n if final else n - 2
+    syllables = switches = ambiguous = 0
+    unknown = []
+    while i < stop:
+        cell = codes[i]
+        next_mode = PREFIX_MODE[cell]
+        if next_mode:
+            mode = next_mode
+            switches += 1
             i += 1
             continue
-        found = False
-        if mode == "number":
-            numkey = tupleize(cell)
-            if numkey in INV_NUMBER:
-                text_output += INV_NUMBER[numkey]
-                i += 1
-                continue
-            else:
-                mode = None
-        if mode == "alpha":
-            alphakey = tupleize(cell)
-            if alphakey in INV_ALPHA:
-                text_output += INV_ALPHA[alphakey]
-                i += 1
-                continue
-            else:
-                mode = None
-        if mode == "symbol":
-            symbolkey = tupleize(cell)
-            if symbolkey in INV_SYMBOL:
-                text_output += INV_SYMBOL[symbolkey]
+        if mode:
+            emitted = MODE_EMIT[mode][cell]
+            if emitted is not None:
+                append(emitted)
+                prev_char = emitted[-1]
                 i += 1
                 continue
-            else:
-                mode = None
-        for length in [3, 2, 1]:
-            if i + length <= n:
-                key = tupleize(braille[i:i+length])
-                if key in INV_ABBREV:
-                    text_output += INV_ABBREV[key]
-                    i += length
-                    found = True
-                    break
-        if found:
-            mode = None
-            continue
-        if i + 2 < n:
-            ini_key = tupleize(braille[i])
-            med_key = tupleize(braille[i+1])
-            fin_key = tupleize(braille[i+2])
-            if ini_key in INV_INITIAL and med_key in INV_MEDIAL and fin_key in INV_FINAL:
-                try:
-                    cho = INV_INITIAL[ini_key]
-                    jung = INV_MEDIAL[med_key]
-                    jong = INV_FINAL[fin_key]
-                    text_output += hgtk.letter.compose(cho, jung, jong)
+            mode = MODE_NONE
+        if STARTS_SYLLABLE[cell]:
+            # 초성+중성+종성(3셀) 우선, 다음 초성+중성(2셀)
+            if i + 2 < n:
+                syllable = INV_SYLLABLE.get(cell << 12 | codes[i+1] << 6 | codes[i+2])
+                if syllable is not None:
+                    append(syllable)
+                    prev_char = syllable
+                    syllables += 1
                     i += 3
-                    mode = None
-                    continue
-                except Exception as e:
-                    text_output += f"[오류: 한글 조합 실패({e})]"
-                    i += 3
-                    mode = None
-                    continue
-        if i + 1 < n:
-            ini_key = tupleize(braille[i])
-            med_key = tupleize(braille[i+1])
-            if ini_key in INV_INITIAL and med_key in INV_MEDIAL:
-                try:
-                    cho = INV_INITIAL[ini_key]
-                    jung = INV_MEDIAL[med_key]
-                    text_output += hgtk.letter.compose(cho, jung)
-                    i += 2
-                    mode = None
                     continue
-                except Exception as e:
-                    text_output += f"[오류: 한글 조합 실패({e})]"
+            if i + 1 < n:
+                syllable = INV_SYLLABLE_OPEN.get(cell << 6 | codes[i+1])
+                if syllable is not None:
+                    append(syllable)
+                    prev_char = syllable
+                    syllables += 1
                     i += 2
-                    mode = None
                     continue
-        symbolkey = tupleize(cell)
-        if symbolkey in AMBIGUOUS_SYMBOLS:
-            prev_char = text_output[-1] if text_output else ""
-            next_cell = braille[i+1] if (i+1) < n else None
-            next_is_end = (i+1) >= n
-            resolved = resolve_ambiguous_symbol(symbolkey, prev_char, next_cell, next_is_end)
+        emitted = NEUTRAL_EMIT[cell]
+        kind = NEUTRAL_KIND[cell]
+        if kind == KIND_AMBIGUOUS:
+            next_cell = codes[i+1] if (i+1) < n else None
+            resolved = resolve_ambiguous_symbol(cell, prev_char, next_cell, next_cell is None)
             if resolved is not None:
-                text_output += resolved
-                i += 1
-                mode = None
-                continue
-        alphakey = tupleize(cell)
-        if alphakey in INV_ALPHA:
-            text_output += INV_ALPHA[alphakey]
-            i += 1
-            mode = None
-            continue
-        symbolkey = tupleize(cell)
-        if symbolkey in INV_SYMBOL:
-            text_output += INV_SYMBOL[symbolkey]
-            i += 1
-            mode = None
-            continue
-        numkey = tupleize(cell)
-        if numkey in INV_NUMBER:
-            text_output += INV_NUMBER[numkey]
-            i += 1
-            mode = None
-            continue
-        text_output += "[알 수 없는 점자: {}]".format(''.join(str(dot) for dot in cell))
+                emitted = resolved
+            ambiguous += 1
+        elif kind:
+            unknown.append(cell)
+        append(emitted)
+        prev_char = emitted[-1]
         i += 1
-        mode = None
-    return text_output
\ No newline at end of file
+    if metrics is not None and (syllables or switches or ambiguous or unknown):
+        metrics.add(
+            syllables=syllables, mode_switches=switches,
+            ambiguous_symbols=ambiguous, unknown_cells=len(unknown)
+        )
+    if unknown:
+        cells = ' '.join(''.join(str(dot) for dot in code_to_cell(code)) for code in dict.fromkeys(unknown))
+        braille_metrics.report("unknown_cells", f"알 수 없는 점자 셀 {len(unknown)}개: {cells}")
+    return i, mode, prev_char
+
+# 단어 단위 캐시: 빈 셀이 아닌 셀들 + 뒤따르는 빈 셀을 한 조각으로 복원.
+# 빈 셀은 구분점자/초성/모호한 기호가 아니고 중성 자리에 오는 음절도 없으므로
+# 미리보기가 조각 밖으로 나가지 않고, 조각 끝의 빈 셀이 모드를 일반으로 되돌림
+# -> 조각의 결과는 (조각, 직전 글자)에만 달려 있음. 표가 바뀌어 이 조건이 깨지면 캐시 없이 복원함
+_CELL_TOKEN = re.compile(rb"[^\x00]+\x00*|\x00+")
+DECODE_CACHEABLE = (
+    not PREFIX_MODE[0] and not STARTS_SYLLABLE[0] and NEUTRAL_KIND[0] != KIND_AMBIGUOUS
+    and all(emit[0] is None for emit in MODE_EMIT)
+    and all((key >> 6) & 63 for key in INV_SYLLABLE)
+)
+
+def _decode_cached(
+    codes: bytes, cache: Optional[LRUCache], metrics: Optional[Metrics], local: Optional[dict] = None
+) -> str:
+    """
+    단어 조각별로 복원해 이어 붙임. local은 (조각, 직전 글자) -> (결과, 나간 뒤 직전 글자) 메모로,
+    배치에서는 여러 호출이 함께 씀. cache가 없으면 local만 씀
+    """
+    if local is None:
+        local = {}
+    # 직전 글자에 따라 결과가 달라질 수 있으므로 (조각, 직전 글자)로 차례로 이어 가며 찾음
+    parts = []
+    prev_char = ""
+    reused = 0
+    for token in _CELL_TOKEN.findall(codes):
+        key = (token, prev_char)
+        hit = local.get(key)
+        if hit is None:
+            cache_key = (token, MODE_NONE, prev_char)
+            hit = cache.get(cache_key) if cache is not None else None
+            if hit is None:
+                out: List[str] = []
+                _, _, exit_prev = _decode(token, out, MODE_NONE, prev_char, True, metrics)
+                hit = (''.join(out), exit_prev)
+                if cache is not None:
+                    cache.put(cache_key, hit)
+            local[key] = hit
+        else:
+            reused += 1
+        parts.append(hit[0])
+        prev_char = hit[1]
+    if cache is not None and reused:
+        cache.add_hits(reused)
+    return ''.join(parts)
+
+def braille_to_text(braille: BrailleCells, cache: Optional[LRUCache] = None) -> str:
+    """
+    점자(셀 코드 bytes 또는 6점 리스트의 리스트)를 텍스트로 복원
+    cache를 주면 빈 셀로 나뉜 단어 단위로 (셀 코드, 시작 모드, 직전 글자) -> 결과를 재사용
+    """
+    metrics = braille_metrics.active
+    if metrics is not None:
+        start = perf_counter()
+    if cache is not None and DECODE_CACHEABLE:
+        text = _decode_cached(pack_cells(braille), cache, metrics)
+    else:
+        out: List[str] = []
+        _decode(pack_cells(braille), out, MODE_NONE, "", True, metrics)
+        text = ''.join(out)
+    if metrics is not None:
+        metrics.record("translate", perf_counter() - start)
+    return text
+
+# === 유니코드 점자 문자열 직접 변환 ===
+
+def text_to_unicode(text: str, use_abbreviation: bool = True, cache: Optional[LRUCache] = None) -> str:
+    """
+    텍스트를 유니코드 점자 문자열로 바로 변환.
+    셀 코드 bytes 한 덩어리를 C 수준 charmap으로 한 번에 바꾸므로 셀별 파이썬 객체를 만들지 않음
+    """
+    return codes_to_unicode(text_to_braille(text, use_abbreviation, cache))
+
+def unicode_to_text(braille: str, cache: Optional[LRUCache] = None) -> str:
+    """유니코드 점자 문자열을 셀 코드 bytes로 한 번에 바꿔 바로 복원 (점자가 아닌 글자는 위치와 함께 ValueError)"""
+    metrics = braille_metrics.active
+    if metrics is None:
+        return braille_to_text(unicode_to_codes(braille), cache)
+    start = perf_counter()
+    codes = unicode_to_codes(braille)
+    metrics.record("parse", perf_counter() - start)
+    return braille_to_text(codes, cache)
+
+# === 배치 변환 (짧은 문자열 여러 개) ===
+
+class PackedCells(NamedTuple):
+    """
+    여러 점자를 이어 붙인 셀 코드 버퍼와 경계 (Arrow의 가변 길이 바이너리 배열과 같은 배치).
+    i번째 점자는 data[offsets[i]:offsets[i + 1]]. offsets는 0에서 시작해 len(data)로 끝나는 int64 array
+    (pyarrow.LargeBinaryArray.from_buffers에 버퍼 그대로 넘길 수 있음)
+    """
+    data: bytes
+    offsets: array
+
+    @property
+    def item_count(self) -> int:
+        return len(self.offsets) - 1
+
+    def item(self, index: int) -> bytes:
+        return self.data[self.offsets[index]:self.offsets[index + 1]]
+
+    def to_list(self) -> List[bytes]:
+        data, offsets = self
+        return [data[start:end] for start, end in zip(offsets, offsets[1:])]
+
+    @classmethod
+    def from_list(cls, items: Iterable[bytes]) -> "PackedCells":
+        items = list(items)
+        return cls(b"".join(items), array("q", accumulate(map(len, items), initial=0)))
+
+# 배치 결과를 유니코드 점자로 한 번에 바꿀 때 쓰는 charmap (SEPARATOR_CODE -> 줄바꿈, 점자에는 없는 글자)
+_BATCH_UNICODE_SEPARATOR = "\n"
+_BATCH_UNICODE_CHARMAP = codes_to_unicode(bytes(range(64))) + _BATCH_UNICODE_SEPARATOR
+
+# 배치 전체를 한 번에 단어 조각으로 나눔 (split_words와 같되 문자열 경계 MARK_SEPARATOR는 따로 한 조각)
+_BATCH_TEXT_TOKEN = re.compile(f"{MARK_SEPARATOR}|[^\\s{MARK_SEPARATOR}]+\\s*|\\s+")
+
+def encode_many(
+    texts: Iterable[str], use_abbreviation: bool = True, as_unicode: bool = False
+) -> Union[PackedCells, List[str]]:
+    """
+    짧은 문자열 여러 개(라벨, 상품명 등)를 한 번에 변환. 각 결과는 text_to_braille(text)와 같음.
+    서로 다른 문자열을 MARK_SEPARATOR로 이어 단어 조각으로 한 번에 나누고, 서로 다른 조각만 _encode 한 번으로
+    변환한 뒤 조각 셀을 한 번에 이어 붙여 경계(SEPARATOR_CODE)에서 자름 -> 호출마다 드는 준비 비용이 배치 전체에 한 번.
+    as_unicode가 아니면 PackedCells(이어 붙인 셀 버퍼 + 경계), 맞으면 유니코드 점자 문자열 리스트 반환
+    (집계를 켜 두면 같은 조각은 카운터에 한 번만 셈)
+    """
+    metrics = braille_metrics.active
+    if metrics is not None:
+        start = perf_counter()
+    texts = texts if isinstance(texts, list) else list(texts)
+    if not texts:
+        return [] if as_unicode else PackedCells.from_list([])
+    separator = bytes((SEPARATOR_CODE,))
+    unique_texts = dict.fromkeys(texts)
+    joined = MARK_SEPARATOR.join(unique_texts)
+    if joined.count(MARK_SEPARATOR) == len(unique_texts) - 1:
+        tokens = _BATCH_TEXT_TOKEN.findall(joined)
+        unique = dict.fromkeys(tokens)
+        unique.pop(MARK_SEPARATOR, None)
+        out = bytearray()
+        _encode(MARK_SEPARATOR.join(unique), out, MODE_NONE, use_abbreviation, True, metrics, separated=True)
+        token_cells = dict(zip(unique, bytes(out).split(separator)))
+        token_cells[MARK_SEPARATOR] = separator
+        out = b"".join(map(token_cells.__getitem__, tokens))
+    else:
+        # 원문에 경계 글자가 들어 있으면(빈 셀로 변환) 하나씩 변환해 경계를 직접 넣음
+        out = bytearray()
+        for i, text in enumerate(unique_texts):
+            if i:
+                out += separator
+            _encode(text, out, MODE_NONE, use_abbreviation, True, metrics)
+    if as_unicode:
+        results = codecs.charmap_decode(out, "strict", _BATCH_UNICODE_CHARMAP)[0].split(_BATCH_UNICODE_SEPARATOR)
+    else:
+        results = bytes(out).split(separator)
+    if len(unique_texts) < len(texts):
+        results = list(map(dict(zip(unique_texts, results)).__getitem__, texts))
+    if metrics is not None:
+        metrics.record("translate", perf_counter() - start)
+    return results if as_unicode else PackedCells.from_list(results)
+
+def decode_many(
+    braille: Union[PackedCells, Iterable[Union[BrailleCells, str]]], cache: Optional[LRUCache] = None
+) -> List[str]:
+    """
+    점자 여러 개를 한 번에 복원. 각 결과는 braille_to_text(점자)와 같음.
+    PackedCells 또는 셀 코드 버퍼/6점 리스트/유니코드 점자 문자열의 iterable을 받음.
+    같은 점자는 한 번만, 단어 조각은 (조각, 직전 글자)별로 배치 전체에서 한 번만 복원함
+    (cache를 주면 배치에 없던 조각은 공유 캐시에서도 찾음)
+    """
+    metrics = braille_metrics.active
+    if metrics is not None:
+        start = perf_counter()
+    if isinstance(braille, PackedCells):
+        # 코드 범위 확인은 버퍼 전체에 한 번
+        items = PackedCells(pack_cells(braille.data), braille.offsets).to_list()
+    else:
+        items = [unicode_to_codes(item) if isinstance(item, str) else pack_cells(item) for item in braille]
+    unique = dict.fromkeys(items)
+    if DECODE_CACHEABLE:
+        local = {}
+        for codes in unique:
+            unique[codes] = _decode_cached(codes, cache, metrics, local)
+    else:
+        for codes in unique:
+            out: List[str] = []
+            _decode(codes, out, MODE_NONE, "", True, metrics)
+            unique[codes] = ''.join(out)
+    results = list(map(unique.__getitem__, items))
+    if metrics is not None:
+        metrics.record("translate", perf_counter() - start)
+    return results
+
+# === 스트리밍 변환 (문서 크기와 무관하게 메모리 일정) ===
+def _iter_chunks(source, chunk_size: int) -> Iterator:
+    # 파일 객체는 chunk_size 단위로 읽고, 문자열/버퍼 하나는 그대로 한 청크로 취급
+    if hasattr(source, "read"):
+        return iter(lambda: source.read(chunk_size), source.read(0))
+    if isinstance(source, (str, bytes, bytearray, memoryview, array)):
+        return iter((source,))
+    return iter(source)
+
+def iter_text_to_braille(
+    source: Union[Iterable[str], TextIO],
+    use_abbreviation: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    텍스트 청크(문자열 iterable 또는 텍스트 파일 객체)를 받아 셀 코드 bytes를 차례로 내보냄.
+    - 청크 경계에 걸친 약자(예: "그러니까")는 다음 청크와 이어 붙여 판단
+    - 숫자/영문 구분점자 상태는 청크를 넘어 유지
+    모든 출력을 이어 붙이면 text_to_braille(전체 텍스트)와 같음 (집계를 켜 두면 청크마다 translate 시간 기록)
+    """
+    pending = ""
+    mode = MODE_NONE
+    for chunk in _iter_chunks(source, chunk_size):
+        metrics = braille_metrics.active
+        if metrics is not None:
+            start = perf_counter()
+        text = pending + chunk if pending else chunk
+        out = bytearray()
+        consumed, mode = _encode(text, out, mode, use_abbreviation, False, metrics)
+        pending = text[consumed:]
+        if metrics is not None:
+            metrics.record("translate", perf_counter() - start)
+        if out:
+            yield bytes(out)
+    out = bytearray()
+    _encode(pending, out, mode, use_abbreviation, True, braille_metrics.active)
+    if out:
+        yield bytes(out)
+
+def iter_braille_to_text(
+    source: Union[Iterable[BrailleCells], BinaryIO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    점자 청크(셀 코드 버퍼 iterable 또는 셀 코드 바이너리 파일 객체)를 받아 텍스트를 차례로 내보냄.
+    음절/기호 판단에 필요한 최대 2셀 미리보기와 모드, 직전 글자는 청크를 넘어 유지.
+    모든 출력을 이어 붙이면 braille_to_text(전체 점자)와 같음
+    """
+    pending = b""
+    mode = MODE_NONE
+    prev_char = ""
+    for chunk in _iter_chunks(source, chunk_size):
+        metrics = braille_metrics.active
+        if metrics is not None:
+            start = perf_counter()
+        codes = pending + pack_cells(chunk)
+        out: List[str] = []
+        consumed, mode, prev_char = _decode(codes, out, mode, prev_char, False, metrics)
+        pending = codes[consumed:]
+        if metrics is not None:
+            metrics.record("translate", perf_counter() - start)
+        if out:
+            yield ''.join(out)
+    out = []
+    _decode(pending, out, mode, prev_char, True, braille_metrics.active)
+    if out:
+        yield ''.join(out)
@@ -1,5 +1,10 @@
+import codecs
 import re
-from typing import List, Union, Tuple
+from array import array
+from typing import Iterable, List, Sequence, Union, Tuple
+
+# 셀 코드: 점 i번(0~5)을 비트 i로 모은 0~63 정수. 0x2800 + 코드 = 유니코드 점자
+BrailleCells = Union[bytes, bytearray, memoryview, array, Sequence]
 
 def flatten_braille_cell(cell: Union[List[int], List[List[int]]]) -> List[List[int]]:
     """
@@ -25,6 +30,91 @@ def tupleize(cell: Union[List[int], List[List[int]]]) -> Union[Tuple[int, ...],
             return tuple(cell)
     raise ValueError("cell must be a list of int or list of list of int")
 
+def cell_to_code(cell: Sequence[int]) -> int:
+    """
+    6점 셀을 0~63 셀 코드로 변환
+    - [1,0,0,1,0,1] -> 0b101001 (41)
+    """
+    if len(cell) != 6:
+        raise ValueError("점자 셀은 6개의 점(0/1)으로 이루어져야 합니다.")
+    code = 0
+    for i, dot in enumerate(cell):
+        if dot:
+            code |= 1 << i
+    return code
+
+def code_to_cell(code: int) -> List[int]:
+    """
+    셀 코드를 6점 리스트로 변환 (cell_to_code의 역)
+    """
+    return [(code >> i) & 1 for i in range(6)]
+
+def pack_cells(braille: BrailleCells) -> bytes:
+    """
+    점자를 셀 코드 bytes로 변환.
+    - bytes/bytearray/memoryview/array('B'): 코드 범위(0~63)만 확인
+    - 셀 코드(int) 시퀀스, 6점 셀 리스트, 2차원 셀(테이블 값) 리스트 모두 허용
+    """
+    if isinstance(braille, bytes):
+        packed = braille
+    elif isinstance(braille, (bytearray, memoryview)) or (
+        isinstance(braille, array) and braille.typecode == 'B'
+    ):
+        packed = bytes(braille)
+    else:
+        out = bytearray()
+        for cell in braille:
+            if isinstance(cell, int):
+                out.append(cell)
+            elif len(cell) > 0 and isinstance(cell[0], (list, tuple)):
+                out.extend(cell_to_code(c) for c in cell)
+            else:
+                out.append(cell_to_code(cell))
+        packed = bytes(out)
+    if packed and max(packed) > 63:
+        raise ValueError("셀 코드는 0~63 범위여야 합니다.")
+    return packed
+
+class BrailleParseError(ValueError):
+    """점자 입력 형식 오류. offset: 잘못된 첫 셀의 순번(0부터), detail: 셀과 사유"""
+
+    def __init__(self, detail: str, offset: int):
+        super().__init__(f"{offset}번째 셀 {detail}")
+        self.detail = detail
+        self.offset = offset
+
+    def shifted(self, base: int) -> "BrailleParseError":
+        """앞에 base개 셀이 더 있었던 것으로 순번을 옮긴 오류 (청크 단위로 읽을 때)"""
+        return BrailleParseError(self.detail, self.offset + base)
+
+# 셀 코드(바이트) -> 유니코드 점자 charmap (64 이상은 정의하지 않음)
+_UNICODE_CHARMAP = ''.join(chr(0x2800 + code) for code in range(64)) + '\ufffe' * 192
+# U+2800~U+283F의 UTF-8은 E2 A0 80~BF이므로 세 번째 바이트 - 0x80이 셀 코드
+_UTF8_TAIL_TO_CODE = bytes((b - 0x80) & 0xFF for b in range(256))
+_NON_BRAILLE_CELL = re.compile('[^\u2800-\u283f]')
+
+def codes_to_unicode(braille: BrailleCells) -> str:
+    """
+    점자를 유니코드 점자 문자열(U+2800~U+283F)로 변환 (C 수준 charmap 변환 한 번)
+    """
+    return codecs.charmap_decode(pack_cells(braille), 'strict', _UNICODE_CHARMAP)[0]
+
+def unicode_to_codes(braille: str) -> bytes:
+    """
+    유니코드 점자 문자열을 셀 코드 bytes로 변환 (codes_to_unicode의 역).
+    6점 점자가 아닌 글자가 있으면 그 위치(= 셀 순번)를 담아 BrailleParseError
+    """
+    bad = _NON_BRAILLE_CELL.search(braille)
+    if bad is not None:
+        raise BrailleParseError(f"{bad.group()!r}는 6점 유니코드 점자(U+2800~U+283F)가 아닙니다.", bad.start())
+    return braille.encode('utf-8')[2::3].translate(_UTF8_TAIL_TO_CODE)
+
+def unpack_cells(codes: Iterable[int]) -> List[List[int]]:
+    """
+    셀 코드 bytes를 6점 리스트의 리스트로 변환 (호환용 보기)
+    """
+    return [code_to_cell(code) for code in codes]
+
 def safe_filename(text: str) -> str:
     """
     파일명에 쓸 수 없는 문자(\\ / : * ? " < > | 공백)를 언더바(_)로 변환
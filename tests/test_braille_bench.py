@@ -0,0 +1,57 @@
+import sys
+import os
+
+# src 디렉터리를 모듈 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import json
+import pytest
+import main
+import braille_bench as bench
+from braille_table import HANGUL_BRAILLE_ABBREVIATION
+
+def test_corpora_are_deterministic():
+    for kind in bench.CORPUS_KINDS:
+        text = bench.make_corpus(kind, 3000)
+        assert len(text) == 3000
+        assert text == bench.make_corpus(kind, 3000)
+        assert text != bench.make_corpus(kind, 3000, seed=1)
+    assert any(word in bench.make_corpus("abbrev", 3000).split() for word in HANGUL_BRAILLE_ABBREVIATION)
+    mixed = bench.make_corpus("mixed", 3000)
+    assert any(c.isdigit() for c in mixed) and any(c.isascii() and c.isalpha() for c in mixed)
+    assert "\n" in bench.make_corpus("long", 3000)
+    with pytest.raises(ValueError):
+        bench.make_corpus("poetry", 10)
+
+def test_run_and_compare(tmp_path):
+    results = bench.run_benchmarks(
+        sizes=(200,), long_size=0, image_cells=(4,),
+        operations=("encode_abbrev", "decode", "edit", "encode_many", "decode_many", "render", "recognize"), repeat=1, min_time=0
+    )
+    names = [r.name for r in results]
+    assert "encode_abbrev/hangul/200" in names and "decode/mixed/200" in names
+    assert "render/mixed/4" in names and "recognize/mixed/4" in names
+    assert "edit/abbrev/200" in names
+    assert "encode_many/mixed/200" in names and "decode_many/hangul/200" in names
+    assert all(r.best_seconds > 0 and r.peak_bytes > 0 for r in results)
+
+    path = str(tmp_path / "bench.json")
+    bench.save_results(path, results)
+    baseline = bench.load_results(path)
+    assert set(baseline) == set(names)
+    assert not bench.compare(results, baseline)
+    # 기준보다 크게 느려지거나 메모리를 많이 쓰면 회귀
+    slower = [r._replace(best_seconds=r.best_seconds * 2, peak_bytes=r.peak_bytes * 4 + 10 ** 6) for r in results]
+    regressions = bench.compare(slower, baseline)
+    assert {(g.name, g.metric) for g in regressions} == {(n, m) for n in names for m in ("time", "memory")}
+
+def test_cli_fails_on_regression(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    argv = ["bench", "--sizes", "100", "--long-size", "0", "--image-cells", "", "--only", "encode_plain", "--repeat", "1"]
+    assert main.run_cli(argv + ["-o", str(baseline)]) == 0
+    document = json.loads(baseline.read_text(encoding="utf-8"))
+    for record in document["results"]:
+        record["best_seconds"] /= 1000
+    baseline.write_text(json.dumps(document), encoding="utf-8")
+    assert main.run_cli(argv + ["--baseline", str(baseline)]) == 1
+    assert "회귀: encode_plain/hangul/100 time" in capsys.readouterr().err
@@ -0,0 +1,63 @@
+import sys
+import os
+
+# src 디렉터리를 모듈 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import unicodedata
+
+import pytest
+import braille_table
+from braille_compile import (
+    TableConflictError, check_tables, find_duplicate_keys, read_artifact, source_stamp, write_artifact,
+)
+
+def test_artifact_round_trip(tmp_path):
+    path = str(tmp_path / "tables.bin")
+    tables = braille_table.compile_tables()
+    stamp = braille_table.TABLE_SOURCE_STAMP
+    write_artifact(path, tables, stamp)
+    loaded = read_artifact(path, stamp, verify=True)
+    assert loaded == tables
+    assert loaded["HANGUL_CODES"]["한"] == braille_table.HANGUL_CODES["한"]
+    # 원본이 바뀌었거나 본문이 손상되면 다시 만들어야 함
+    assert read_artifact(path, b"other") is None
+    with open(path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        f.write(b"\xff")
+    assert read_artifact(path, stamp, verify=True) is None
+    assert read_artifact(str(tmp_path / "missing.bin"), stamp) is None
+
+def test_source_stamp_tracks_changes(tmp_path):
+    src = tmp_path / "table.py"
+    src.write_text("A = {}\n", encoding="utf-8")
+    stamp = source_stamp([str(src)])
+    assert source_stamp([str(src)]) == stamp
+    src.write_text("A = {'a': 1}\n", encoding="utf-8")
+    assert source_stamp([str(src)]) != stamp
+    # 유니코드 데이터 버전이 다른 인터프리터에서는 숫자 분류가 달라질 수 있으므로 다시 만듦
+    stamp = source_stamp([str(src)], ("15.0.0",))
+    assert source_stamp([str(src)], ("15.1.0",)) != stamp
+    assert unicodedata.unidata_version in braille_table.TABLE_SOURCE_STAMP.decode("latin-1")
+
+def test_ambiguous_mappings_are_rejected():
+    tables = {"T": {"a": [1,0,0,0,0,0], "b": [1,0,0,0,0,0], "c": [[0,1,0,0,0,0],[1,0,0,0,0,0]]}}
+    with pytest.raises(TableConflictError) as info:
+        check_tables(tables)
+    (conflict,) = info.value.conflicts
+    assert conflict.kind == "ambiguous" and set(conflict.keys) == {"a", "b"}
+    # 문맥으로 구분하는 묶음 안의 중복은 허용
+    check_tables(tables, allowed=[("a", "b")])
+
+def test_duplicate_literal_keys_are_rejected(tmp_path):
+    src = tmp_path / "table.py"
+    src.write_text("T = {'a': [1,0,0,0,0,0], 'b': [0,1,0,0,0,0], 'a': [0,0,1,0,0,0]}\n", encoding="utf-8")
+    conflicts = find_duplicate_keys(str(src), ["T"])
+    assert [(c.kind, c.table, c.keys) for c in conflicts] == [("duplicate-key", "T", ("a",))]
+
+def test_current_tables_compile():
+    # 표 정의의 중복 key가 정리되어 있어야 아티팩트를 만들 수 있음
+    braille_table.compile_tables()
+    assert braille_table.FINAL_CODES["ㅅ"] != braille_table.FINAL_CODES["ㅆ"]
+    codes = braille_table.HANGUL_CODES["났"]
+    assert braille_table.INV_SYLLABLE[codes[0] << 12 | codes[1] << 6 | codes[2]] == "났"
@@ -0,0 +1,37 @@
+import sys
+import os
+
+# src 디렉터리를 모듈 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+from braille_corpus import translate_corpus
+from braille_translator import text_to_braille, braille_to_text
+
+DOCS = [f"안녕하세요 {i} 그리고 Hello" for i in range(50)]
+
+def test_ordered_matches_serial():
+    expected = [text_to_braille(doc) for doc in DOCS]
+    results = list(translate_corpus(DOCS, workers=2, shard_size=7, max_pending=2))
+    assert [idx for idx, _ in results] == list(range(len(DOCS)))
+    assert [cells for _, cells in results] == expected
+
+def test_unordered_and_decode():
+    cells = [text_to_braille(doc) for doc in DOCS]
+    results = dict(translate_corpus(cells, direction="decode", workers=2, shard_size=5, ordered=False))
+    assert results == {idx: braille_to_text(c) for idx, c in enumerate(cells)}
+
+def test_checkpoint_resume(tmp_path):
+    checkpoint = str(tmp_path / "corpus.ckpt")
+    stats = []
+    run = translate_corpus(DOCS, workers=1, shard_size=10, checkpoint=checkpoint, on_shard=stats.append)
+    first = [next(run) for _ in range(25)]
+    run.close()
+    assert [s.shard for s in stats] == [0, 1]
+    assert all(s.documents == 10 and s.throughput > 0 for s in stats)
+    # 끝난 샤드(0, 1)는 건너뛰고 중간에 멈춘 샤드 2부터 다시 처리
+    rest = list(translate_corpus(DOCS, workers=2, shard_size=10, checkpoint=checkpoint))
+    assert rest[0][0] == 20
+    assert [idx for idx, _ in first[:20] + rest] == list(range(len(DOCS)))
+    with pytest.raises(ValueError):
+        list(translate_corpus(DOCS, shard_size=3, checkpoint=checkpoint))
@@ -0,0 +1,78 @@
+import sys
+import os
+
+# src 디렉터리를 모듈 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import cv2
+import numpy as np
+import pytest
+from braille_image import (
+    DOT_POS, braille_to_image, braille_to_pages, encode_image, image_to_braille_list, join_lines,
+    pages_to_braille_list, render_braille, sample_dots, wrap_cells,
+)
+
+def _reference_render(codes, cell_size, dot_radius, margin):
+    # 셀마다 cv2.circle로 그리는 기존 방식
+    img = np.full((cell_size + 2 * margin, len(codes) * cell_size + 2 * margin), 255, dtype=np.uint8)
+    for idx, code in enumerate(codes):
+        for i, (dx, dy) in enumerate(DOT_POS):
+            if code >> i & 1:
+                cx = margin + idx * cell_size + dx * (cell_size // 2) + cell_size // 4
+                cy = margin + dy * (cell_size // 3) + cell_size // 6
+                cv2.circle(img, (cx, cy), dot_radius, 0, -1)
+    return img
+
+@pytest.mark.parametrize("cell_size, dot_radius, margin", [(40, 7, 20), (20, 9, 3), (12, 8, 2)])
+def test_render_matches_per_dot_drawing(cell_size, dot_radius, margin):
+    codes = bytes(range(64))
+    expected = _reference_render(codes, cell_size, dot_radius, margin)
+    assert np.array_equal(render_braille(codes, cell_size, dot_radius, margin), expected)
+
+def test_image_round_trip(tmp_path):
+    codes = bytes(range(64))
+    path = braille_to_image(codes, save_path=str(tmp_path / "dot.png"))
+    assert image_to_braille_list(path) == codes
+
+
+def test_sample_dots_matches_patch_mean():
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 256, (30, 50), dtype=np.uint8)
+    # 경계에 걸치거나 이미지 밖인 중심도 포함
+    cx = rng.integers(0, 60, 200)
+    cy = rng.integers(0, 40, 200)
+    expected = []
+    for x, y in zip(cx, cy):
+        px = img[max(0, y - 2):y + 3, max(0, x - 2):x + 3]
+        expected.append(px.size > 0 and px.mean() < 128)
+    assert sample_dots(img, cx, cy, patch=2).tolist() == expected
+
+def test_wrap_cells_breaks_at_word_boundaries():
+    # 점 있는 셀 1, 빈 셀 0
+    codes = bytes([1, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0, 0, 1])
+    lines = list(wrap_cells(codes, cells_per_line=5))
+    assert lines == [bytes([1, 1]), bytes([1, 1, 1]), bytes([1] * 5), bytes([1, 0, 0, 1])]
+    assert join_lines(lines, cells_per_line=5) == codes
+
+def test_page_round_trip(tmp_path):
+    codes = bytes((i * 7) % 64 if i % 5 else 0 for i in range(300))
+    paths = braille_to_pages(codes, str(tmp_path), cells_per_line=12, lines_per_page=4, cell_size=20, dot_radius=3, margin=6)
+    assert len(paths) > 1
+    assert pages_to_braille_list(paths, cells_per_line=12, cell_size=20, margin=6) == codes
+    # 쪽 파일을 쓸 수 없으면 경로를 돌려주지 않고 실패
+    (tmp_path / "blocked" / "page_0001.png").mkdir(parents=True)
+    with pytest.raises(ValueError, match="page_0001.png"):
+        braille_to_pages(codes, str(tmp_path / "blocked"), cells_per_line=12, lines_per_page=4)
+
+def test_in_memory_encode_decode(tmp_path, monkeypatch):
+    codes = bytes(range(64))
+    png = encode_image(codes)
+    assert image_to_braille_list(png) == codes
+    assert image_to_braille_list(memoryview(png)) == codes
+    assert image_to_braille_list(cv2.cvtColor(render_braille(codes), cv2.COLOR_GRAY2BGR)) == codes
+    assert len(encode_image(codes, compression=9)) < len(encode_image(codes, compression=0))
+    assert image_to_braille_list(encode_image(codes, ".webp", quality=101)) == codes
+
+    # 디렉터리 없는 상대 경로에도 저장
+    monkeypatch.chdir(tmp_path)
+    assert image_to_braille_list(braille_to_image(codes)) == codes
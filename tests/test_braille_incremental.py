@@ -0,0 +1,62 @@
+import sys
+import os
+
+# src 디렉터리를 모듈 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import random
+import pytest
+from braille_bench import make_corpus
+from braille_incremental import IncrementalTranslator
+from braille_translator import text_to_braille, text_to_braille_offsets
+
+@pytest.mark.parametrize("use_abbreviation", [True, False])
+def test_edits_match_full_translation(use_abbreviation):
+    rng = random.Random(0)
+    pieces = list("그래서러니까 하지만 가나12 3abcZ.,?!\n") + ["그러나", "그런데 ", "  ", "99"]
+    text = make_corpus("mixed", 600)
+    # 블록을 작게 잡아 블록 합치기/나누기까지 거침
+    doc = IncrementalTranslator(text, use_abbreviation, block_size=2)
+    cells = doc.cells
+    for _ in range(300):
+        start = rng.randint(0, len(text))
+        end = min(len(text), start + rng.choice([0, 0, 1, 2, 7, 40]))
+        replacement = ''.join(rng.choice(pieces) for _ in range(rng.choice([0, 1, 1, 3])))
+        edit = doc.edit(start, end, replacement)
+        text = text[:start] + replacement + text[end:]
+        cells = edit.apply(cells)
+        assert cells == text_to_braille(text, use_abbreviation)
+    assert doc.text == text and doc.cells == cells
+    assert (len(doc), doc.cell_count) == (len(text), len(cells))
+
+def test_edit_touches_only_changed_word():
+    doc = IncrementalTranslator("안녕 그래서 123")
+    before = doc.cells
+    # 숫자 앞에 입력하면 숫자 구분점자를 포함한 마지막 단어만 바뀜
+    edit = doc.edit(7, 7, "4")
+    word = len(text_to_braille("안녕 그래서 "))
+    assert (edit.start, edit.end) == (word, len(before))
+    assert edit.cells == text_to_braille("4123")
+    # 공백을 지워 두 단어가 붙으면 앞 단어부터 다시 변환
+    edit = doc.edit(6, 7)
+    assert doc.cells == text_to_braille("안녕 그래서4123") == edit.apply(before[:word] + text_to_braille("4123"))
+    with pytest.raises(ValueError):
+        doc.edit(5, 100, "x")
+
+def test_offset_maps():
+    text = "안녕 그래서 abc 12"
+    doc = IncrementalTranslator(text, block_size=1)
+    whole = text_to_braille_offsets(text)
+    assert whole.cells == text_to_braille(text)
+    abbrev = text_to_braille("안녕 ")
+    # 약자 "그래서" 안의 한 글자는 약자 셀 전체로 넓어짐
+    assert doc.cell_range(4, 5) == whole.cell_range(4, 5) == (len(abbrev), len(text_to_braille("안녕 그래서")))
+    assert doc.source_range(*doc.cell_range(4, 5)) == (3, 6)
+    assert doc.cell_range(5, 5)[0] == doc.cell_range(5, 5)[1]
+    for start in range(len(text) + 1):
+        for end in range(start, len(text) + 1):
+            assert doc.cell_range(start, end) == whole.cell_range(start, end)
+    for cell in range(len(whole.cells) + 1):
+        assert doc.source_range(cell, len(whole.cells)) == whole.source_range(cell, len(whole.cells))
+    with pytest.raises(ValueError):
+        doc.source_range(0, len(whole.cells) + 1)
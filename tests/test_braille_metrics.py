@@ -0,0 +1,62 @@
+import sys
+import os
+
+# src 디렉터리를 모듈 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import logging
+import braille_metrics
+import main
+from braille_metrics import Metrics, collect
+from braille_parse import parse_unicode
+from braille_translator import braille_to_text, iter_text_to_braille, text_to_braille
+from braille_utils import codes_to_unicode
+
+def test_counters_and_events():
+    events = []
+    with collect(on_event=lambda kind, message: events.append(kind)) as metrics:
+        codes = text_to_braille("그래서 안녕 123 ☃")
+        braille_to_text(parse_unicode(codes_to_unicode(text_to_braille("안녕"))) + bytes([63]))
+    assert braille_metrics.active is None
+    snapshot = metrics.snapshot()
+    assert snapshot.counters["abbreviations"] == 1
+    assert snapshot.counters["unknown_chars"] == 1
+    assert snapshot.counters["syllables"] == 2
+    assert snapshot.counters["unknown_cells"] == 1
+    assert snapshot.counters["mode_switches"] >= 1
+    assert events == ["unknown_chars", "unknown_cells"]
+    assert snapshot.stages["translate"].calls == 3
+    assert snapshot.stages["parse"].calls == 1
+    # 스트리밍 변환은 청크마다 기록하고, 카운터는 한 번에 변환한 것과 같음
+    metrics.reset()
+    with collect(metrics):
+        b"".join(iter_text_to_braille(["그래", "서 안녕"]))
+    assert metrics.snapshot().counters["abbreviations"] == 1
+    assert metrics.snapshot().stages["translate"].calls == 2
+
+def test_disabled_logs_without_printing(caplog, capsys):
+    metrics = Metrics()
+    with caplog.at_level(logging.INFO, logger="braille"):
+        text_to_braille("☃")
+        braille_to_text(bytes([63]))
+    assert [r.getMessage().split(":")[0] for r in caplog.records] == ["unknown_chars", "unknown_cells"]
+    assert capsys.readouterr().out == ""
+    assert metrics.snapshot().counters["unknown_chars"] == 0
+
+def test_prometheus_dump_and_cli(tmp_path, capsys):
+    metrics = Metrics()
+    metrics.add(syllables=3)
+    metrics.record("render", 0.5)
+    dump = metrics.to_prometheus()
+    assert "# TYPE braille_syllables_total counter\nbraille_syllables_total 3\n" in dump
+    assert 'braille_stage_seconds_total{stage="render"} 0.5' in dump
+
+    src = tmp_path / "a.txt"
+    src.write_text("그래서 ☃\n", encoding="utf-8")
+    prom = tmp_path / "metrics.prom"
+    assert main.run_cli(["encode", str(src), "--metrics", str(prom), "-j", "2"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out == codes_to_unicode(text_to_braille("그래서 ☃")) + "\n"
+    assert "a.txt" in captured.err
+    assert "braille_abbreviations_total 1" in prom.read_text(encoding="utf-8")
+    assert braille_metrics.active is None
@@ -0,0 +1,45 @@
+import sys
+import os
+
+# src 디렉터리를 모듈 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import json
+import pytest
+import main
+from braille_image import braille_to_image
+from braille_ocr import bulk_ocr, expand_image_inputs
+from braille_samples import SampleStore
+from braille_translator import braille_to_text, text_to_braille
+
+def _make_legacy(data_dir, texts):
+    for idx, text in enumerate(texts, 1):
+        braille_to_image(text_to_braille(text), save_path=str(data_dir / str(idx) / "dot.png"))
+        (data_dir / str(idx) / f"{text}.txt").write_text(text, encoding="utf-8")
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_bulk_ocr_checks_ground_truth(tmp_path, workers):
+    texts = ["안녕", "점자", "가나다"]
+    _make_legacy(tmp_path, texts)
+    (tmp_path / "broken.png").write_bytes(b"not an image")
+    paths = expand_image_inputs([str(tmp_path)])
+    results = list(bulk_ocr(paths, workers=workers, threads=2, check=True, max_pending=2))
+    assert [r.path for r in results] == paths
+    by_name = {os.path.relpath(r.path, tmp_path): r for r in results}
+    assert by_name["broken.png"].error is not None
+    for idx, text in enumerate(texts, 1):
+        r = by_name[os.path.join(str(idx), "dot.png")]
+        assert r.error is None and r.cells == text_to_braille(text)
+        assert r.text == braille_to_text(text_to_braille(text))
+        assert r.expected == text and r.correct == (r.text == text)
+
+def test_bulk_ocr_cli_uses_store_manifest(tmp_path, capsys):
+    data_dir = tmp_path / "data"
+    with SampleStore(str(data_dir)) as store:
+        store.save(text_to_braille("hello"), "hello")
+    out = tmp_path / "results.jsonl"
+    assert main.run_cli(["bulk-ocr", str(data_dir), "-o", str(out), "--check"]) == 0
+    records = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == 1
+    assert records[0]["expected"] == "hello" and records[0]["correct"] is True
+    assert "정답 일치 1/1" in capsys.readouterr().err
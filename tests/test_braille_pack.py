@@ -0,0 +1,46 @@
+import sys
+import os
+
+# src 디렉터리를 모듈 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import numpy as np
+import main
+from braille_image import braille_to_image
+from braille_pack import PackReader, PackWriter
+from braille_samples import SampleStore
+
+def test_pack_random_access(tmp_path):
+    path = str(tmp_path / "train.brpk")
+    pixels = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    with PackWriter(path) as writer:
+        writer.add(bytes([1, 2, 3]), "가", None)
+        writer.add(bytes([63]), "안녕", "data/1/dot.png")
+    # 기존 팩에 이어서 기록
+    with PackWriter(path) as writer:
+        writer.add(bytes([]), "", pixels)
+
+    reader = PackReader(path)
+    assert len(reader) == 3
+    assert bytes(reader[1].cells) == bytes([63])
+    assert reader[1].text == "안녕" and reader[1].image == "data/1/dot.png"
+    assert reader[0].image is None and reader[0].text == "가"
+    assert np.array_equal(reader[-1].image, pixels)
+    assert [s.text for s in reader] == ["가", "안녕", ""]
+    reader.close()
+
+def test_pack_cli_from_legacy_layout(tmp_path):
+    data_dir = tmp_path / "data"
+    codes = bytes([11, 0, 35])
+    for idx, text in (("1", "안녕"), ("2", "점자")):
+        braille_to_image(codes, save_path=str(data_dir / idx / "dot.png"))
+        (data_dir / idx / f"{text}.txt").write_text(text, encoding="utf-8")
+    pack = str(tmp_path / "data.brpk")
+    assert main.run_cli(["pack", str(data_dir), pack, "--image", "pixels"]) == 0
+    with PackReader(pack) as reader:
+        assert [(bytes(s.cells), s.text, s.image.shape) for s in reader] == [
+            (codes, "안녕", (80, 160)), (codes, "점자", (80, 160))
+        ]
+
+    assert main.run_cli(["unpack", pack, str(tmp_path / "copy")]) == 0
+    assert [s.text for s in SampleStore(str(tmp_path / "copy"))] == ["안녕", "점자"]
@@ -0,0 +1,42 @@
+import sys
+import os
+
+# src 디렉터리를 모듈 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import pytest
+import main
+from braille_parse import format_01, parse_01, parse_unicode
+from braille_utils import BrailleParseError
+
+def test_parse_01_layouts():
+    codes = bytes(range(64))
+    canonical = format_01(codes)
+    assert canonical.split()[1] == "100000"
+    assert parse_01(canonical) == codes
+    assert parse_01("\n  " + canonical.replace(" ", "\t\n ") + "  \r\n") == codes
+    assert parse_01("") == b"" and parse_01("   ") == b""
+
+@pytest.mark.parametrize("text, offset", [
+    ("100000 11000 000000", 1),
+    ("100000 110000 1100a0", 2),
+    ("100000\n1100000", 1),
+    ("가00000 100000", 0),
+    ("100000 110000 1", 2),
+])
+def test_parse_01_reports_first_bad_cell(text, offset):
+    with pytest.raises(BrailleParseError) as info:
+        parse_01(text)
+    assert info.value.offset == offset
+
+def test_parse_unicode():
+    assert parse_unicode("\u2801\r\n\u2803") == bytes([1, 3])
+    with pytest.raises(BrailleParseError) as info:
+        parse_unicode("\u2801\u2803 \u2801")
+    assert info.value.offset == 2
+
+def test_cli_decode_error_offset_spans_chunks(tmp_path, capsys):
+    src = tmp_path / "a.txt"
+    src.write_text(format_01(bytes(40)) + " 10000x", encoding="utf-8")
+    assert main.run_cli(["decode", "-f", "01", "--buffer-size", "16", str(src)]) == 1
+    assert "40번째 셀" in capsys.readouterr().err
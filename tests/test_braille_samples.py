@@ -0,0 +1,94 @@
+import sys
+import os
+
+# src 디렉터리를 모듈 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import subprocess
+import threading
+import time
+
+import pytest
+from braille_image import image_to_braille_list
+from braille_samples import SampleStore, _file_lock
+
+def test_save_and_lookup(tmp_path):
+    store = SampleStore(str(tmp_path), shard_size=2)
+    samples = [store.save(bytes([i + 1, 0, 63]), f"샘플{i}") for i in range(5)]
+    assert [s.id for s in samples] == [1, 2, 3, 4, 5]
+    assert os.path.dirname(samples[4].image_path).endswith("shard_0002")
+    assert image_to_braille_list(samples[2].image_path) == bytes([3, 0, 63])
+
+    # 새로 연 저장소는 manifest만 읽고 번호를 이어서 발급
+    reopened = SampleStore(str(tmp_path))
+    assert len(reopened) == 5
+    assert reopened.get(4).text == "샘플3"
+    assert reopened.save(bytes([1]), "다음").id == 6
+    assert 6 in store and [s.id for s in store] == [1, 2, 3, 4, 5, 6]
+
+def test_batched_commit(tmp_path):
+    with SampleStore(str(tmp_path), batch_size=4) as store:
+        for i in range(3):
+            store.save(bytes([1]), str(i))
+        # 묶음이 차기 전에는 manifest에 기록되지 않음
+        assert len(SampleStore(str(tmp_path))) == 0
+    assert [s.text for s in SampleStore(str(tmp_path))] == ["0", "1", "2"]
+
+def test_imports_legacy_sample_dirs(tmp_path):
+    legacy = tmp_path / "7"
+    legacy.mkdir()
+    (legacy / "dot.png").write_bytes(b"")
+    (legacy / "안녕.txt").write_text("안녕", encoding="utf-8")
+    store = SampleStore(str(tmp_path))
+    assert store.get(7).text == "안녕"
+    assert store.get(7).image_path == os.path.join(str(tmp_path), "7/dot.png")
+    assert store.save(bytes([1]), "새 샘플").id == 8
+
+
+def test_file_lock_excludes_and_survives_leftover_file(tmp_path):
+    path = str(tmp_path / ".lock")
+    # 비정상 종료로 남은 잠금 파일은 잠겨 있지 않으므로 바로 잡힘
+    (tmp_path / ".lock").write_bytes(b"")
+    with _file_lock(path):
+        with pytest.raises(TimeoutError):
+            with _file_lock(path, timeout=0.05):
+                pass
+    with _file_lock(path, timeout=0.05):
+        pass
+    # 잡은 프로세스가 풀지 않고 죽어도 운영체제가 잠금을 풂
+    code = (
+        "import os, sys; sys.path.insert(0, sys.argv[1]); from braille_samples import _file_lock; "
+        "lock = _file_lock(sys.argv[2]); lock.__enter__(); print('locked', flush=True); os._exit(0)"
+    )
+    src = os.path.join(os.path.dirname(__file__), "../src")
+    out = subprocess.run([sys.executable, "-c", code, src, path], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "locked"
+    with _file_lock(path, timeout=0.05):
+        pass
+
+def test_file_lock_concurrent_threads(tmp_path):
+    path = str(tmp_path / ".lock")
+    holders = []
+    overlaps = []
+    errors = []
+    start = threading.Barrier(8)
+
+    def worker():
+        start.wait()
+        try:
+            for _ in range(3):
+                with _file_lock(path):
+                    holders.append(1)
+                    if len(holders) > 1:
+                        overlaps.append(len(holders))
+                    time.sleep(0.01)
+                    holders.pop()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not overlaps and not errors
@@ -0,0 +1,76 @@
+import sys
+import os
+
+# src 디렉터리를 모듈 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import asyncio
+import json
+from braille_server import BrailleServer, ServerConfig
+from braille_translator import text_to_braille
+
+async def _request(reader, writer, method, path, body=b""):
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode().partition(":")
+        headers[name.lower()] = value.strip()
+    payload = await reader.readexactly(int(headers["content-length"]))
+    return status, headers, payload
+
+def _run(scenario):
+    async def main():
+        server = await BrailleServer(ServerConfig(port=0, workers=0, batch_window=0.01)).start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            try:
+                return await scenario(server, reader, writer)
+            finally:
+                writer.close()
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+def test_endpoints():
+    async def scenario(server, reader, writer):
+        status, _, body = await _request(reader, writer, "POST", "/encode", json.dumps({"text": "hello"}).encode())
+        assert status == 200
+        encoded = json.loads(body)
+        assert bytes(encoded["cells"]) == text_to_braille("hello")
+
+        status, _, body = await _request(reader, writer, "POST", "/decode", json.dumps({"braille": encoded["braille"]}).encode())
+        assert (status, json.loads(body)["text"]) == (200, "hello")
+
+        status, headers, png = await _request(reader, writer, "POST", "/render", json.dumps({"text": "hello"}).encode())
+        assert status == 200 and headers["content-type"] == "image/png"
+        status, _, body = await _request(reader, writer, "POST", "/ocr", png)
+        assert json.loads(body)["text"] == "hello"
+
+        assert (await _request(reader, writer, "POST", "/decode", b'{"cells": [99]}'))[0] == 400
+        assert (await _request(reader, writer, "GET", "/encode"))[0] == 405
+        assert (await _request(reader, writer, "GET", "/nope"))[0] == 404
+        assert json.loads((await _request(reader, writer, "GET", "/health"))[2]) == {"status": "ok"}
+        metrics = json.loads((await _request(reader, writer, "GET", "/metrics"))[2])
+        assert metrics["requests"]["/encode"] == 2 and metrics["errors"] == 3
+    _run(scenario)
+
+def test_concurrent_requests_are_batched():
+    texts = [f"word{i}" for i in range(50)]
+
+    async def scenario(server, reader, writer):
+        async def one(text):
+            r, w = await asyncio.open_connection("127.0.0.1", server.port)
+            try:
+                _, _, body = await _request(r, w, "POST", "/encode", json.dumps({"text": text}).encode())
+                return bytes(json.loads(body)["cells"])
+            finally:
+                w.close()
+        results = await asyncio.gather(*(one(t) for t in texts))
+        assert results == [text_to_braille(t) for t in texts]
+        assert server.stats["batches"] < len(texts)
+    _run(scenario)
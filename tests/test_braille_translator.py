@@ -5,8 +5,11 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 import pytest
-from braille_translator import text_to_braille, braille_to_text
-from braille_utils import flatten_braille_cell, validate_braille_str
+from braille_translator import (
+    text_to_braille, braille_to_text, match_abbreviation,
+    iter_text_to_braille, iter_braille_to_text,
+)
+from braille_utils import flatten_braille_cell, validate_braille_str, pack_cells, unpack_cells
 
 def test_hangul_round_trip():
     text = "안녕"
@@ -58,4 +61,164 @@ def test_mixed_text():
     braille = text_to_braille(text)
     recovered = braille_to_text(braille)
     # 한글/영문/숫자/특수문자 roundtrip이 제대로 되는지 확인
-    assert recovered.replace(" ", "").lower() == text.replace(" ", "").lower()
\ No newline at end of file
+    assert recovered.replace(" ", "").lower() == text.replace(" ", "").lower()
+
+def test_abbreviation_longest_match():
+    # "하지만은"은 "하지만" + "은"이 아니라 하나의 약자로 변환되어야 함
+    braille = text_to_braille("하지만은", use_abbreviation=True)
+    assert unpack_cells(braille) == [[0,1,1,1,1,0], [1,1,1,0,0,0], [0,1,0,0,1,0]]
+    assert match_abbreviation("그러니까요", 0)[1] == 4
+    assert match_abbreviation("요그러니까", 0) == (None, 0)
+
+
+def test_pack_cells_compat_view():
+    cells = [[1,0,0,1,0,1], [[0,1,1,0,0,1], [0,0,0,0,0,1]]]
+    packed = pack_cells(cells)
+    assert packed == bytes([0b101001, 0b100110, 0b100000])
+    assert unpack_cells(packed) == [[1,0,0,1,0,1], [0,1,1,0,0,1], [0,0,0,0,0,1]]
+    assert pack_cells(bytearray(packed)) == packed
+    with pytest.raises(ValueError):
+        pack_cells(bytes([64]))
+
+def test_braille_to_text_accepts_list_view():
+    braille = text_to_braille("한글 ABC 123")
+    assert braille_to_text(unpack_cells(braille)) == braille_to_text(braille)
+
+
+def test_hangul_syllable_table():
+    from braille_table import (
+        HANGUL_CODES, HANGUL_CODES_ABBREV, INITIAL_CODES, MEDIAL_CODES, FINAL_CODES,
+        ABBREV_CODES, INV_SYLLABLE, INV_SYLLABLE_OPEN,
+    )
+    assert len([c for c in HANGUL_CODES if len(c) == 1 and '가' <= c <= '힣']) == 11172
+    assert HANGUL_CODES['한'] == INITIAL_CODES['ㅎ'] + MEDIAL_CODES['ㅏ'] + FINAL_CODES['ㄴ']
+    assert HANGUL_CODES['ㄱ'] == INITIAL_CODES['ㄱ'] + FINAL_CODES['']
+    # 약자 모드는 한 글자 약자가 우선
+    assert HANGUL_CODES_ABBREV['가'] == ABBREV_CODES['가']
+    codes = HANGUL_CODES['항']
+    assert INV_SYLLABLE[codes[0] << 12 | codes[1] << 6 | codes[2]] == '항'
+    assert INV_SYLLABLE_OPEN[codes[0] << 6 | codes[1]] == '하'
+
+
+def test_char_class_table_and_runs():
+    from braille_table import (
+        CHAR_CLASSES, CLASS_ABBREV, CLASS_ALPHA, CLASS_DIGIT, CLASS_DIRECT, CLASS_UNKNOWN,
+        CAPITAL_PREFIX_CODE, NUMBER_PREFIX_CODE, MARK_NUMBER, encode_braille,
+    )
+    classes = "가그A z7² !é\uFDD0".translate(CHAR_CLASSES)
+    assert classes == (
+        CLASS_DIRECT + CLASS_ABBREV + CLASS_ALPHA + CLASS_DIRECT + CLASS_ALPHA + CLASS_DIGIT + CLASS_DIGIT
+        + CLASS_DIRECT + CLASS_DIRECT + CLASS_UNKNOWN + CLASS_UNKNOWN
+    )
+    # 이어진 영문/숫자는 구분점자 한 번 (대문자도 같은 셀), 사이에 다른 글자가 끼면 다시
+    assert text_to_braille("ABC").count(CAPITAL_PREFIX_CODE) == 1
+    assert text_to_braille("abc") == text_to_braille("ABC")
+    assert text_to_braille("a1b").count(CAPITAL_PREFIX_CODE) == 2
+    # 원문의 표시 글자/표 밖 글자는 빈 셀
+    assert text_to_braille(MARK_NUMBER + "😀") == bytes(2)
+    # braille_table의 encode_braille도 같은 변환기
+    assert encode_braille("Hello 123 그리고 é") == unpack_cells(text_to_braille("Hello 123 그리고 é"))
+    assert text_to_braille("7")[:1] == bytes([NUMBER_PREFIX_CODE])
+
+
+def test_streaming_matches_one_shot():
+    import io
+    text = "그러니까 안녕 123 abc 하지만은 “테스트”."
+    full = text_to_braille(text)
+    # "그러니까"가 청크 경계에 걸친 경우, 숫자 모드가 청크를 넘는 경우
+    chunks = ["그러", "니까 안녕 1", "23 a", "bc 하지만", "은 “테스트”."]
+    assert b"".join(iter_text_to_braille(chunks)) == full
+    assert b"".join(iter_text_to_braille(io.StringIO(text), chunk_size=1)) == full
+    cell_chunks = [full[k:k + 2] for k in range(0, len(full), 2)]
+    assert "".join(iter_braille_to_text(cell_chunks)) == braille_to_text(full)
+    assert "".join(iter_braille_to_text(io.BytesIO(full), chunk_size=1)) == braille_to_text(full)
+
+
+def test_word_cache_matches_uncached():
+    from braille_cache import LRUCache
+    cache = LRUCache(capacity=4)
+    text = "그리고 나는 123 그리고 abc. 나는 “하지만” 그리고"
+    for use_abbreviation in (True, False):
+        assert text_to_braille(text, use_abbreviation, cache=cache) == text_to_braille(text, use_abbreviation)
+    codes = text_to_braille(text)
+    assert braille_to_text(codes, cache=cache) == braille_to_text(codes)
+    stats = cache.stats()
+    assert stats.size == 4 and stats.evictions > 0
+    assert stats.hits > 0 and stats.misses > 0
+
+def test_lru_cache_eviction_order():
+    from braille_cache import LRUCache
+    cache = LRUCache(capacity=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats()[2:] == (3, 1, 1)
+
+
+def test_lru_cache_churn_past_capacity():
+    # 용량을 훨씬 넘겨 조회/기록을 반복해도 결과와 카운터가 OrderedDict 기준과 같고, 제거가 O(n)으로 느려지지 않음
+    import random
+    import time
+    from collections import OrderedDict
+    from braille_cache import DEFAULT_CACHE_CAPACITY, LRUCache
+    keys = random.Random(0).choices(range(200_000), k=200_000)
+    cache = LRUCache()
+    start = time.perf_counter()
+    for key in keys:
+        if cache.get(key) is None:
+            cache.put(key, key)
+    elapsed = time.perf_counter() - start
+    reference = OrderedDict()
+    misses = 0
+    start = time.perf_counter()
+    for key in keys:
+        if reference.get(key) is None:
+            misses += 1
+            reference[key] = key
+            if len(reference) > DEFAULT_CACHE_CAPACITY:
+                reference.popitem(last=False)
+        else:
+            reference.move_to_end(key)
+    reference_elapsed = time.perf_counter() - start
+    stats = cache.stats()
+    assert (stats.size, stats.misses, stats.evictions) == (
+        DEFAULT_CACHE_CAPACITY, misses, misses - DEFAULT_CACHE_CAPACITY
+    )
+    assert cache.get_many(reversed(reference)) == dict(reference)
+    # 제거할 때마다 앞쪽 빈 슬롯을 훑으면 기준보다 열 배 넘게 느림
+    assert elapsed < 5 * reference_elapsed + 0.5
+
+
+def test_unicode_direct_path():
+    from braille_translator import text_to_unicode, unicode_to_text
+    from braille_utils import codes_to_unicode, unicode_to_codes
+    text = "안녕하세요 123 Hello!"
+    codes = text_to_braille(text)
+    braille = text_to_unicode(text)
+    assert braille == ''.join(chr(0x2800 + c) for c in codes)
+    assert unicode_to_codes(braille) == codes
+    assert unicode_to_text(braille) == braille_to_text(codes)
+    assert codes_to_unicode(bytes(range(64))) == ''.join(map(chr, range(0x2800, 0x2840)))
+    with pytest.raises(ValueError, match="^2번째 셀"):
+        unicode_to_codes("\u2801\u2802a\u2803")
+    with pytest.raises(ValueError):
+        unicode_to_codes("\u2840")
+
+
+def test_encode_many_decode_many_match_single():
+    from braille_table import MARK_SEPARATOR
+    from braille_translator import PackedCells, encode_many, decode_many, text_to_unicode
+    texts = ["안녕하세요", "", "Hello 123", "그래서 그리고", "안녕하세요", "a" + MARK_SEPARATOR + "b", " 가 "]
+    packed = encode_many(texts)
+    assert isinstance(packed, PackedCells) and packed.item_count == len(texts)
+    assert packed.offsets[0] == 0 and packed.offsets[-1] == len(packed.data)
+    assert packed.to_list() == [text_to_braille(t) for t in texts]
+    assert encode_many(texts, use_abbreviation=False).to_list() == [text_to_braille(t, False) for t in texts]
+    unicode = encode_many(texts, as_unicode=True)
+    assert unicode == [text_to_unicode(t) for t in texts]
+    assert decode_many(packed) == [braille_to_text(c) for c in packed.to_list()]
+    assert decode_many(unicode) == decode_many(packed.to_list()) == decode_many(packed)
+    assert encode_many([]).item_count == 0 and encode_many([], as_unicode=True) == [] and decode_many([]) == []
@@ -0,0 +1,76 @@
+import sys
+import os
+
+# src 디렉터리를 모듈 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import io
+import subprocess
+import pytest
+import main
+from braille_translator import text_to_braille, braille_to_text
+
+def test_encode_decode_files(tmp_path, capsys):
+    src = tmp_path / "a.txt"
+    src.write_text("안녕 123\n", encoding="utf-8")
+    assert main.run_cli(["encode", str(src)]) == 0
+    encoded = capsys.readouterr().out
+    assert encoded == main.braille_list_to_unicode(text_to_braille("안녕 123")) + "\n"
+
+    brl = tmp_path / "a.brl"
+    brl.write_text(encoded, encoding="utf-8")
+    assert main.run_cli(["decode", str(brl)]) == 0
+    assert capsys.readouterr().out == braille_to_text(text_to_braille("안녕 123")) + "\n"
+
+def test_encode_output_dir_keeps_layout(tmp_path):
+    for idx in ("1", "2"):
+        (tmp_path / idx).mkdir()
+        (tmp_path / idx / "안녕.txt").write_text("안녕", encoding="utf-8")
+    out_dir = tmp_path / "out"
+    pattern = str(tmp_path / "*" / "*.txt")
+    assert main.run_cli(["encode", pattern, "-f", "binary", "--output-dir", str(out_dir)]) == 0
+    for idx in ("1", "2"):
+        assert (out_dir / idx / "안녕.brl").read_bytes() == text_to_braille("안녕")
+    # 샘플 디렉터리는 요청할 때만 생성
+    assert not os.path.exists("data/3")
+
+def test_stream_01_with_small_buffer(monkeypatch, capsys):
+    cells = text_to_braille("그러니까 abc")
+    monkeypatch.setattr(sys, "stdin", io.StringIO(main.braille_list_to_str(cells)))
+    assert main.run_cli(["decode", "-f", "01", "--buffer-size", "4"]) == 0
+    assert capsys.readouterr().out == braille_to_text(cells) + "\n"
+
+def test_failed_input_does_not_stop_batch(tmp_path, capsys):
+    good = tmp_path / "good.txt"
+    good.write_text("110110 110001", encoding="utf-8")
+    bad = tmp_path / "bad.txt"
+    bad.write_text("0101", encoding="utf-8")
+    assert main.run_cli(["decode", "-f", "01", str(bad), str(good)]) == 1
+    captured = capsys.readouterr()
+    assert "bad.txt" in captured.err
+    assert f"{good}\t{braille_to_text(bytes([0b011011, 0b100011]))}" in captured.out
+
+MAIN_PY = os.path.abspath(os.path.join(os.path.dirname(__file__), '../main.py'))
+
+def import_times(argv):
+    """python -X importtime으로 main.py를 실행해 불러온 모듈 -> 누적 import 시간(us)"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", MAIN_PY] + argv,
+        capture_output=True, text=True, encoding="utf-8", check=True
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+@pytest.mark.parametrize("argv", [["encode"], ["encode", "-f", "01"], ["decode", "-f", "01"]])
+def test_text_commands_skip_image_imports(tmp_path, argv):
+    # 텍스트 변환만 하는 실행은 OpenCV/numpy를 불러오지 않아야 시작이 빠름
+    src = tmp_path / "in.txt"
+    src.write_text("100000 110000" if argv[0] == "decode" else "안녕 123", encoding="utf-8")
+    times = import_times(argv + [str(src)])
+    assert "braille_translator" in times
+    assert not {"cv2", "numpy", "concurrent.futures.process"} & set(times)